@@ -1,41 +1,29 @@
 import json
 import os
-import psycopg2
 from typing import Dict, Any
 
+from db_metrics import QueryMetrics, connect
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from passwords import hash_password, verify_password
+from session_tokens import TokenError, issue_token
+
+PREFLIGHT = preflight_response('POST, OPTIONS', 'Content-Type, Authorization, X-Debug-Timing')
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     '''
     Business: Authenticate admin user from database
     Args: event with httpMethod, body (login, password)
           context with request_id
-    Returns: HTTP response with user data or error
+    Returns: HTTP response with user data and a signed session token, or error
     '''
     method: str = event.get('httpMethod', 'POST')
     
     # Handle CORS OPTIONS request
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': '',
-            'isBase64Encoded': False
-        }
+        return PREFLIGHT
     
     if method != 'POST':
-        return {
-            'statusCode': 405,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': 'Method not allowed'}),
-            'isBase64Encoded': False
-        }
+        return METHOD_NOT_ALLOWED
     
     body_data = json.loads(event.get('body', '{}'))
     login = body_data.get('login', '').strip()
@@ -65,19 +53,32 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'isBase64Encoded': False
         }
     
-    conn = psycopg2.connect(database_url)
+    metrics = QueryMetrics('admin-login')
+    conn = connect(database_url, metrics)
     cursor = conn.cursor()
     
-    # Query user from database
-    query = f"""
-        SELECT id, login, full_name, role, phone, lessons_attended, lessons_missed, lessons_paid
+    # Query user from database; the password hash is checked here, not in SQL
+    query = """
+        SELECT id, login, full_name, role, phone, lessons_attended, lessons_missed, lessons_paid, password
         FROM t_p720035_lineaschool_app.users
-        WHERE login = '{login}' AND password = '{password}' AND role = 'admin'
+        WHERE login = %s AND role = 'admin'
     """
     
-    cursor.execute(query)
+    cursor.execute(query, (login,))
     result = cursor.fetchone()
     
+    if result:
+        matches, needs_rehash = verify_password(password, result[8])
+        if not matches:
+            result = None
+        elif needs_rehash:
+            # Plain or weaker hash from before: upgrade on the first successful login
+            cursor.execute(
+                'UPDATE t_p720035_lineaschool_app.users SET password = %s WHERE id = %s',
+                (hash_password(password), result[0])
+            )
+            conn.commit()
+    
     cursor.close()
     conn.close()
     
@@ -93,17 +94,24 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'lessons_paid': result[7]
         }
         
-        return {
+        response_data: Dict[str, Any] = {'success': True, 'user': user_data}
+        try:
+            response_data['token'], response_data['expiresAt'] = issue_token(result[0], result[3])
+        except TokenError as e:
+            # Without AUTH_TOKEN_SECRET login still works, just without a session token
+            print(f'Session token not issued: {e}')
+        
+        return metrics.apply({
             'statusCode': 200,
             'headers': {
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({'success': True, 'user': user_data}),
+            'body': json.dumps(response_data),
             'isBase64Encoded': False
-        }
+        }, event)
     else:
-        return {
+        return metrics.apply({
             'statusCode': 401,
             'headers': {
                 'Content-Type': 'application/json',
@@ -111,4 +119,4 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             },
             'body': json.dumps({'success': False, 'error': 'Invalid credentials'}),
             'isBase64Encoded': False
-        }
+        }, event)
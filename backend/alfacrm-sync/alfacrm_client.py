@@ -0,0 +1,120 @@
+'''
+Business: Minimal AlfaCRM v2 API client shared by the sync functions
+Args: AlfaCRMClient(domain, email, api_key)
+Returns: parsed JSON pages from <entity>/index endpoints
+'''
+import json
+import threading
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+
+from resilience import TIMEOUT_MAX, get_caller
+
+if TYPE_CHECKING:
+    from urllib.request import Request
+
+PAGE_SIZE = 50
+
+
+class AlfaCRMClient:
+    '''
+    Token-authenticated client; logs in lazily and once more after a 401. Safe to share between threads.
+    Every request goes through the resilience caller of the domain: adaptive timeout capped by timeout,
+    retries for list calls and a circuit breaker
+    '''
+
+    def __init__(self, domain: str, email: str, api_key: str, timeout: float = TIMEOUT_MAX) -> None:
+        self.domain = domain
+        self.email = email
+        self.api_key = api_key
+        self.timeout = timeout
+        self.caller = get_caller(domain)
+        self.token: Optional[str] = None
+        self.requests_made = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f'https://{self.domain}/v2api'
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self.requests_made += 1
+
+    def login(self) -> str:
+        from urllib.request import Request
+
+        auth_data = json.dumps({'email': self.email, 'api_key': self.api_key}).encode('utf-8')
+        req = Request(
+            f'{self.base_url}/auth/login',
+            data=auth_data,
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+        data = self._send(req, idempotent=True)
+        self.token = data.get('token', '')
+        if not self.token:
+            raise PermissionError('Could not obtain auth token from AlfaCRM')
+        return self.token
+
+    def _send(self, req: 'Request', idempotent: bool) -> Dict[str, Any]:
+        # urllib.request грузит http.client, ssl и email: только когда запрос действительно уходит
+        from urllib.request import urlopen
+
+        def attempt(timeout: float) -> Dict[str, Any]:
+            self._count_request()
+            with urlopen(req, timeout=timeout) as response:
+                return json.loads(response.read().decode('utf-8'))
+        return self.caller.call(attempt, idempotent=idempotent, max_timeout=self.timeout, endpoint=req.selector.split('?')[0])
+
+    def post(self, path: str, payload: Dict[str, Any], idempotent: bool = True) -> Dict[str, Any]:
+        '''idempotent=False for calls that change data in AlfaCRM: no retries then'''
+        from urllib.error import HTTPError
+
+        if not self.token:
+            with self._lock:
+                need_login = not self.token
+            if need_login:
+                self.login()
+        try:
+            return self._post(path, payload, idempotent)
+        except HTTPError as e:
+            if e.code not in (401, 403):
+                raise
+            self.login()
+            return self._post(path, payload, idempotent)
+
+    def _post(self, path: str, payload: Dict[str, Any], idempotent: bool) -> Dict[str, Any]:
+        from urllib.request import Request
+
+        req = Request(
+            f'{self.base_url}/{path}',
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'X-ALFACRM-TOKEN': self.token, 'Content-Type': 'application/json'},
+            method='POST'
+        )
+        return self._send(req, idempotent)
+
+    def fetch_page(
+        self,
+        entity: str,
+        branch_id: int,
+        page: int,
+        filters: Optional[Dict[str, Any]] = None,
+        count: int = PAGE_SIZE
+    ) -> Dict[str, Any]:
+        '''One page of <entity>/index; pages are numbered from 0'''
+        payload: Dict[str, Any] = {'branch_id': branch_id, 'page': page, 'count': count}
+        payload.update(filters or {})
+        return self.post(f'{entity}/index', payload)
+
+    def fetch_branches(self) -> List[Dict[str, Any]]:
+        '''All branches of the account (branch/index is not scoped by branch_id)'''
+        branches: List[Dict[str, Any]] = []
+        page = 0
+        while True:
+            data = self.post('branch/index', {'page': page, 'count': PAGE_SIZE})
+            items = data.get('items', [])
+            branches.extend(items)
+            if not items or len(branches) >= int(data.get('total', 0) or 0):
+                return branches
+            page += 1
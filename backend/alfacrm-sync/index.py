@@ -1,250 +1,273 @@
 """
-Business: Синхронизация данных из AlfaCRM (клиенты, педагоги, оплаты)
-Args: event - dict с httpMethod, queryStringParameters
+Business: Синхронизация данных из AlfaCRM (клиенты, педагоги, занятия)
+Args: event - dict с httpMethod, queryStringParameters (branches=1,2 | all, mode, job_id)
       context - объект с атрибутами request_id, function_name
 Returns: JSON с результатами синхронизации
 """
 
 import json
 import os
-from typing import Dict, Any, List
-import urllib.request
-import urllib.parse
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-import psycopg2
+
+from alfacrm_client import AlfaCRMClient
+from db_metrics import QueryMetrics, connect
+from db_routing import lsn_headers, write_position
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from resilience import CircuitOpenError
+from session_tokens import authenticate, service_secret_valid
+from sync_engine import EntityStats, SyncEngine, config_from_env, resolve_branch_ids, run_parallel, MAX_CONCURRENCY
+from sync_jobs import create_jobs, get_job, next_job_ids, record_run, run_job_slice, serialize_job
+
+SYNC_ENTITIES = ['customers', 'teachers', 'lessons']
+WORKER_SECRET_HEADER = 'X-Worker-Secret'
+
+PREFLIGHT = preflight_response('GET, POST, OPTIONS', 'Content-Type, Authorization, X-Api-Key, X-Debug-Timing')
+
+def upstream_failure(error: Exception) -> Dict[str, Any]:
+    '''
+    AlfaCRM unreachable before any branch was synced: 503 with Retry-After while the breaker is open,
+    502 for HTTP, network and auth errors (HTTPError, URLError and PermissionError are OSErrors)
+    '''
+    if isinstance(error, CircuitOpenError):
+        response = job_response(503, {'success': False, 'error': 'AlfaCRM temporarily unavailable', 'details': str(error)})
+        response['headers']['Retry-After'] = str(max(1, int(error.retry_after)))
+        return response
+    return job_response(502, {'success': False, 'error': 'AlfaCRM request failed', 'details': str(error)})
+
+def current_write_position(database_url: str, metrics: QueryMetrics) -> Dict[str, str]:
+    '''X-DB-LSN after the branch connections committed: reads that send it back see the synced rows'''
+    conn = connect(database_url, metrics)
+    try:
+        cur = conn.cursor()
+        return lsn_headers(write_position(cur))
+    finally:
+        conn.close()
+
+def job_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps(body, ensure_ascii=False)
+    }
+
+def advance_jobs(client: AlfaCRMClient, job_ids: List[int], database_url: str, metrics: QueryMetrics) -> List[Dict[str, Any]]:
+    '''One slice of every job in parallel (different branches), each on its own connection'''
+    def advance(job_id: int, conn) -> Dict[str, Any]:
+        try:
+            return serialize_job(run_job_slice(conn, client, job_id))
+        except Exception as e:
+            # A transient error leaves the job pending for the next worker run; report its real status
+            job = get_job(conn, job_id)
+            if job is None:
+                raise
+            return {**serialize_job(job), 'error': str(e)}
+
+    outcomes = run_parallel(job_ids, advance, lambda: connect(database_url, metrics))
+    jobs = []
+    for job_id, outcome in outcomes.items():
+        if outcome['status'] == 'done':
+            jobs.append(outcome['result'])
+        else:
+            jobs.append({'job_id': job_id, 'status': 'failed', 'error': outcome['error']})
+    return jobs
+
+def handle_job_request(
+    conn, client: AlfaCRMClient, config: Dict[str, str], metrics: QueryMetrics,
+    method: str, mode: str, job_id: Any, branches: Optional[str]
+) -> Dict[str, Any]:
+    '''
+    POST ?mode=async        - create a job per branch, 202 with job ids (no entity pages fetched yet)
+    POST ?job_id=N          - advance job N by one time slice
+    POST ?mode=worker       - advance the oldest unfinished jobs, up to SYNC_MAX_CONCURRENCY in parallel;
+                              the timer sends X-Worker-Secret = SYNC_WORKER_SECRET instead of an admin token
+    GET  ?job_id=N          - job status and progress
+    '''
+    if mode == 'async' and not job_id:
+        if method != 'POST':
+            return job_response(405, {'error': 'Use POST to start a sync job'})
+        try:
+            branch_ids = resolve_branch_ids(client, config, branches)
+        except ValueError:
+            return job_response(400, {'error': 'branches must be a comma-separated list of ids or "all"'})
+        except (CircuitOpenError, OSError) as e:
+            return upstream_failure(e)
+        if not branch_ids:
+            return job_response(400, {'error': 'No branches to sync'})
+        jobs = [serialize_job(job) for job in create_jobs(conn, branch_ids, SYNC_ENTITIES)]
+        single = jobs[0] if len(jobs) == 1 else {}
+        return job_response(202, {'success': True, **single, 'jobs': jobs})
+
+    if mode == 'worker' and not job_id:
+        job_ids = next_job_ids(conn, MAX_CONCURRENCY)
+        if not job_ids:
+            return job_response(200, {'success': True, 'status': 'idle'})
+        jobs = advance_jobs(client, job_ids, config['database_url'], metrics)
+        return job_response(200, {'success': all(job['status'] != 'failed' for job in jobs), 'jobs': jobs})
+
+    try:
+        job_id = int(job_id)
+    except (TypeError, ValueError):
+        return job_response(400, {'error': 'job_id must be an integer'})
+
+    if method == 'GET':
+        job = get_job(conn, job_id)
+    else:
+        try:
+            job = run_job_slice(conn, client, job_id)
+        except Exception as e:
+            job = get_job(conn, job_id)
+            if job is None:
+                raise
+            return job_response(502, {'success': False, **serialize_job(job), 'error': str(e)})
+
+    if job is None:
+        return job_response(404, {'error': 'Job not found'})
+    return job_response(200 if job['status'] == 'done' else 202, {'success': job['status'] != 'failed', **serialize_job(job)})
+
+def sync_branches(client: AlfaCRMClient, branch_ids: List[int], database_url: str, metrics: QueryMetrics) -> Dict[int, Dict[str, Any]]:
+    '''
+    Full sync of every branch on the worker pool in two phases: users of all branches first, then lessons,
+    so a lesson never misses a teacher or student that belongs to another branch. Each run is recorded in sync_jobs
+    '''
+    stats: Dict[int, Dict[str, EntityStats]] = {branch_id: {} for branch_id in branch_ids}
+
+    def phase(entity_names: List[str], last: bool):
+        def sync_branch(branch_id: int, conn) -> Dict[str, EntityStats]:
+            engine = SyncEngine(client, conn, branch_id, entity_names)
+            try:
+                engine.run()
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                stats[branch_id].update(engine.stats)
+                record_run(conn, branch_id, SYNC_ENTITIES, {name: s.as_dict() for name, s in stats[branch_id].items()}, str(e))
+                raise
+            stats[branch_id].update(engine.stats)
+            if last:
+                record_run(conn, branch_id, SYNC_ENTITIES, {name: s.as_dict() for name, s in stats[branch_id].items()})
+            return stats[branch_id]
+        return sync_branch
+
+    connect_branch = lambda: connect(database_url, metrics)
+    outcomes = run_parallel(branch_ids, phase(SYNC_ENTITIES[:-1], last=False), connect_branch)
+    ready = [branch_id for branch_id, outcome in outcomes.items() if outcome['status'] == 'done']
+    for branch_id, outcome in run_parallel(ready, phase(SYNC_ENTITIES[-1:], last=True), connect_branch).items():
+        outcome['duration_ms'] = round(outcome['duration_ms'] + outcomes[branch_id]['duration_ms'], 1)
+        outcomes[branch_id] = outcome
+    return outcomes
+
+def total_stats(outcomes: Dict[int, Dict[str, Any]]) -> Dict[str, EntityStats]:
+    '''Entity stats summed over the branches that finished'''
+    totals = {name: EntityStats() for name in SYNC_ENTITIES}
+    for outcome in outcomes.values():
+        for name, stats in (outcome.get('result') or {}).items():
+            total = totals[name]
+            for key in ('total', 'fetched', 'added', 'updated', 'unchanged', 'pages'):
+                setattr(total, key, getattr(total, key) + getattr(stats, key))
+            total.add_errors(stats.errors)
+            total.skipped += stats.skipped - len(stats.errors)
+    return totals
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
-    
+
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, X-Api-Key',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
-    
+        return PREFLIGHT
+
     if method in ['POST', 'GET']:
-        api_key = os.environ.get('ALFACRM_API_KEY')
-        domain = os.environ.get('ALFACRM_DOMAIN')
-        email = os.environ.get('ALFACRM_EMAIL')
-        branch_id = os.environ.get('ALFACRM_BRANCH_ID')
-        database_url = os.environ.get('DATABASE_URL')
-        
-        if not all([api_key, domain, email, branch_id, database_url]):
+        params = event.get('queryStringParameters') or {}
+        mode = params.get('mode', 'sync')
+
+        # Таймер воркера подтверждает себя общим секретом WORKER_SECRET_HEADER, остальные - токеном администратора
+        if not (mode == 'worker' and service_secret_valid(event, WORKER_SECRET_HEADER, 'SYNC_WORKER_SECRET')):
+            _, auth_failure = authenticate(event, ('admin',), required=True)
+            if auth_failure:
+                return auth_failure
+
+        config = config_from_env(os.environ)
+        if not config:
             return {
                 'statusCode': 500,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
                 'body': json.dumps({'error': 'Missing AlfaCRM credentials'})
             }
-        
-        conn = psycopg2.connect(database_url)
-        cursor = conn.cursor()
-        
+
+        job_id = params.get('job_id')
+        branches = params.get('branches')
+
+        client = AlfaCRMClient(config['domain'], config['email'], config['api_key'])
+        metrics = QueryMetrics('alfacrm-sync')
+
+        if job_id or mode in ('async', 'worker'):
+            conn = connect(config['database_url'], metrics)
+            try:
+                response = handle_job_request(conn, client, config, metrics, method, mode, job_id, branches)
+                if method == 'POST':
+                    cur = conn.cursor()
+                    response['headers'].update(lsn_headers(write_position(cur)))
+                    cur.close()
+                return metrics.apply(response, event)
+            finally:
+                conn.close()
+
+        try:
+            branch_ids = resolve_branch_ids(client, config, branches)
+            if branch_ids:
+                client.login()
+        except ValueError:
+            return job_response(400, {'error': 'branches must be a comma-separated list of ids or "all"'})
+        except (CircuitOpenError, OSError) as e:
+            return metrics.apply(upstream_failure(e), event)
+        if not branch_ids:
+            return job_response(400, {'error': 'No branches to sync'})
+
+        outcomes = sync_branches(client, branch_ids, config['database_url'], metrics)
+        entity_stats = total_stats(outcomes)
+
+        customers = entity_stats['customers']
+        teachers = entity_stats['teachers']
+        lessons = entity_stats['lessons']
         stats = {
-            'students_added': 0,
-            'students_updated': 0,
-            'teachers_added': 0,
-            'teachers_updated': 0,
+            'students_added': customers.added,
+            'students_updated': customers.updated,
+            'students_unchanged': customers.unchanged,
+            'teachers_added': teachers.added,
+            'teachers_updated': teachers.updated,
+            'teachers_unchanged': teachers.unchanged,
             'payments_added': 0,
-            'lessons_added': 0,
-            'lessons_updated': 0
+            'lessons_added': lessons.added,
+            'lessons_updated': lessons.updated,
+            'lessons_unchanged': lessons.unchanged,
+            'alfacrm_requests': client.requests_made
         }
-        
-        # Синхронизация клиентов (учеников)
-        customers_url = f'https://{domain}/v2api/1/customer/index'
-        customers_data = urllib.parse.urlencode({
-            'email': email,
-            'api_key': api_key,
-            'branch_id': branch_id,
-            'page': 1,
-            'per_page': 1000
-        }).encode()
-        
-        req = urllib.request.Request(customers_url, data=customers_data)
-        with urllib.request.urlopen(req) as response:
-            customers = json.loads(response.read().decode())
-            
-            if customers.get('total', 0) > 0:
-                for customer in customers.get('items', []):
-                    customer_id = str(customer['id'])
-                    full_name = f"{customer.get('name', '')} {customer.get('last_name', '')}".strip()
-                    email_customer = customer.get('email', f"student_{customer_id}@temp.com")
-                    balance = float(customer.get('paid_count', 0) or 0)
-                    
-                    cursor.execute(
-                        "SELECT id FROM t_p720035_lineaschool_app.users WHERE login = %s AND role = 'student'",
-                        (f"alfacrm_{customer_id}",)
-                    )
-                    existing = cursor.fetchone()
-                    
-                    lessons_attended = int(customer.get('lesson_count', 0) or 0)
-                    lessons_missed = int(customer.get('lesson_not_count', 0) or 0)
-                    lessons_paid = int(customer.get('paid_count', 0) or 0)
-                    
-                    if existing:
-                        cursor.execute(
-                            '''UPDATE t_p720035_lineaschool_app.users 
-                               SET full_name = %s, lessons_attended = %s, lessons_missed = %s, lessons_paid = %s 
-                               WHERE id = (SELECT id FROM t_p720035_lineaschool_app.users 
-                                          WHERE login = %s AND role = 'student' LIMIT 1)''',
-                            (full_name, lessons_attended, lessons_missed, lessons_paid, f"alfacrm_{customer_id}")
-                        )
-                        stats['students_updated'] += 1
-                    else:
-                        cursor.execute(
-                            '''INSERT INTO t_p720035_lineaschool_app.users 
-                               (login, password, full_name, role, lessons_attended, lessons_missed, lessons_paid) 
-                               VALUES (%s, %s, %s, %s, %s, %s, %s)''',
-                            (f"alfacrm_{customer_id}", 'temp', full_name, 'student', lessons_attended, lessons_missed, lessons_paid)
-                        )
-                        stats['students_added'] += 1
-        
-        # Синхронизация педагогов
-        teachers_url = f'https://{domain}/v2api/1/teacher/index'
-        teachers_data = urllib.parse.urlencode({
-            'email': email,
-            'api_key': api_key,
-            'branch_id': branch_id,
-            'page': 1,
-            'per_page': 1000
-        }).encode()
-        
-        req = urllib.request.Request(teachers_url, data=teachers_data)
-        with urllib.request.urlopen(req) as response:
-            teachers = json.loads(response.read().decode())
-            
-            if teachers.get('total', 0) > 0:
-                for teacher in teachers.get('items', []):
-                    teacher_id = str(teacher['id'])
-                    full_name = f"{teacher.get('name', '')} {teacher.get('last_name', '')}".strip()
-                    email_teacher = teacher.get('email', f"teacher_{teacher_id}@temp.com")
-                    
-                    cursor.execute(
-                        "SELECT id FROM t_p720035_lineaschool_app.users WHERE login = %s AND role = 'teacher'",
-                        (f"alfacrm_{teacher_id}",)
-                    )
-                    existing = cursor.fetchone()
-                    
-                    if existing:
-                        cursor.execute(
-                            '''UPDATE t_p720035_lineaschool_app.users 
-                               SET full_name = %s 
-                               WHERE login = %s AND role = 'teacher' ''',
-                            (full_name, f"alfacrm_{teacher_id}")
-                        )
-                        stats['teachers_updated'] += 1
-                    else:
-                        cursor.execute(
-                            '''INSERT INTO t_p720035_lineaschool_app.users 
-                               (login, password, full_name, role) 
-                               VALUES (%s, %s, %s, %s)''',
-                            (f"alfacrm_{teacher_id}", 'temp', full_name, 'teacher')
-                        )
-                        stats['teachers_added'] += 1
-        
-        # Синхронизация занятий (lessons)
-        lessons_url = f'https://{domain}/v2api/1/lesson/index'
-        lessons_data = urllib.parse.urlencode({
-            'email': email,
-            'api_key': api_key,
-            'branch_id': branch_id,
-            'page': 1,
-            'per_page': 1000
-        }).encode()
-        
-        req = urllib.request.Request(lessons_url, data=lessons_data)
-        with urllib.request.urlopen(req) as response:
-            lessons = json.loads(response.read().decode())
-            
-            if lessons.get('total', 0) > 0:
-                for lesson in lessons.get('items', []):
-                    lesson_id = str(lesson['id'])
-                    customer_id = str(lesson.get('customer_id', ''))
-                    teacher_id_alfa = str(lesson.get('teacher_id', ''))
-                    subject_id = lesson.get('subject_id', '')
-                    
-                    cursor.execute(
-                        "SELECT id FROM t_p720035_lineaschool_app.users WHERE login = %s AND role = 'student'",
-                        (f"alfacrm_{customer_id}",)
-                    )
-                    student_row = cursor.fetchone()
-                    if not student_row:
-                        continue
-                    student_db_id = student_row[0]
-                    
-                    cursor.execute(
-                        "SELECT id FROM t_p720035_lineaschool_app.users WHERE login = %s AND role = 'teacher'",
-                        (f"alfacrm_{teacher_id_alfa}",)
-                    )
-                    teacher_row = cursor.fetchone()
-                    teacher_db_id = teacher_row[0] if teacher_row else None
-                    
-                    lesson_date = lesson.get('lesson_date', datetime.now().strftime('%Y-%m-%d'))
-                    lesson_time = lesson.get('time_from', '00:00')
-                    lesson_status_id = lesson.get('status_id', 1)
-                    
-                    status_map = {
-                        1: 'scheduled',
-                        2: 'attended',
-                        3: 'missed'
-                    }
-                    status = status_map.get(lesson_status_id, 'scheduled')
-                    
-                    lesson_type_id = lesson.get('lesson_type_id', 1)
-                    lesson_type_map = {
-                        1: 'group',
-                        2: 'individual_speech',
-                        3: 'individual_neuro'
-                    }
-                    lesson_type = lesson_type_map.get(lesson_type_id, 'group')
-                    
-                    subject_name = f"Предмет {subject_id}" if subject_id else "Урок"
-                    
-                    cursor.execute(
-                        "SELECT id FROM t_p720035_lineaschool_app.assignments WHERE alfacrm_id = %s",
-                        (lesson_id,)
-                    )
-                    existing_lesson = cursor.fetchone()
-                    
-                    if existing_lesson:
-                        cursor.execute(
-                            '''UPDATE t_p720035_lineaschool_app.assignments 
-                               SET status = %s, lesson_type = %s, subject = %s, due_date = %s, due_time = %s
-                               WHERE alfacrm_id = %s''',
-                            (status, lesson_type, subject_name, lesson_date, lesson_time, lesson_id)
-                        )
-                        stats['lessons_updated'] += 1
-                    else:
-                        cursor.execute(
-                            '''INSERT INTO t_p720035_lineaschool_app.assignments 
-                               (student_id, teacher_id, title, subject, due_date, due_time, type, status, lesson_type, alfacrm_id) 
-                               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''',
-                            (student_db_id, teacher_db_id, f"Занятие {lesson_id}", subject_name, lesson_date, lesson_time, 'lesson', status, lesson_type, lesson_id)
-                        )
-                        stats['lessons_added'] += 1
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        return {
-            'statusCode': 200,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        branch_results = {
+            str(branch_id): {
+                'status': outcome['status'],
+                'duration_ms': outcome['duration_ms'],
+                **({'stats': {name: s.as_dict() for name, s in outcome['result'].items()}}
+                   if outcome['status'] == 'done' else {'error': outcome['error']})
+            }
+            for branch_id, outcome in outcomes.items()
+        }
+        failed = [branch_id for branch_id, outcome in outcomes.items() if outcome['status'] == 'failed']
+
+        return metrics.apply({
+            'statusCode': 502 if len(failed) == len(outcomes) else 200,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*',
+                **current_write_position(config['database_url'], metrics)
+            },
             'isBase64Encoded': False,
             'body': json.dumps({
-                'success': True,
+                'success': not failed,
                 'stats': stats,
+                'branches': branch_results,
+                'errors': (customers.errors + teachers.errors)[:10],
                 'timestamp': datetime.now().isoformat()
-            })
-        }
-    
-    return {
-        'statusCode': 405,
-        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-        'body': json.dumps({'error': 'Method not allowed'})
-    }
\ No newline at end of file
+            }, ensure_ascii=False)
+        }, event)
+
+    return METHOD_NOT_ALLOWED
@@ -0,0 +1,258 @@
+"""
+Business: Возобновляемые задания синхронизации: страница за страницей с контрольными точками
+Args: create_job / run_job_slice / get_job с открытым соединением psycopg2
+Returns: состояние задания (status, позиция, статистика)
+"""
+
+import json
+import os
+import time
+from typing import Dict, Any, List, Optional
+
+from alfacrm_client import AlfaCRMClient
+from resilience import CircuitOpenError, is_retryable
+from sync_engine import SyncEngine, SCHEMA, Position
+
+SLICE_SECONDS = float(os.environ.get('SYNC_SLICE_SECONDS', '20'))
+# Сколько срезов подряд может упасть на временной ошибке AlfaCRM, прежде чем задание станет failed
+MAX_ATTEMPTS = int(os.environ.get('SYNC_JOB_MAX_ATTEMPTS', '5'))
+# Первый ключ pg_advisory_lock(int, int), чтобы не пересекаться с другими блокировками
+_LOCK_NAMESPACE = 7201
+# Сущности второй фазы: ссылаются на пользователей, поэтому ждут, пока все филиалы пакета синхронизируют пользователей
+DEPENDENT_ENTITIES = ('lessons',)
+JOB_COLUMNS = (
+    'id, branch_id, entities, status, entity_index, page, stats, error, created_at, updated_at, finished_at, '
+    'attempts, batch_id'
+)
+
+
+def users_phase_sql(alias: str) -> str:
+    '''SQL condition: the job still has entities before its first dependent one'''
+    return (
+        f"{alias}.entity_index < COALESCE(array_position(string_to_array({alias}.entities, ','), "
+        f"'{DEPENDENT_ENTITIES[0]}') - 1, 2147483647)"
+    )
+
+
+def users_phase_end(job: Dict[str, Any]) -> int:
+    '''Index of the first dependent entity of the job (len(entities) if it has none)'''
+    for index, name in enumerate(job['entities']):
+        if name in DEPENDENT_ENTITIES:
+            return index
+    return len(job['entities'])
+
+
+def create_jobs(conn, branch_ids: List[int], entity_names: List[str]) -> List[Dict[str, Any]]:
+    '''One job per branch in one batch (batch_id = smallest job id), so both sync phases stay ordered'''
+    cur = conn.cursor()
+    cur.execute(
+        f'''INSERT INTO {SCHEMA}.sync_jobs (branch_id, entities)
+            SELECT branch_id, %s FROM unnest(%s::int[]) AS branch_id
+            RETURNING id''',
+        (','.join(entity_names), branch_ids)
+    )
+    job_ids = [row[0] for row in cur.fetchall()]
+    cur.execute(
+        f'''UPDATE {SCHEMA}.sync_jobs SET batch_id = %s
+            WHERE id = ANY(%s)
+            RETURNING {JOB_COLUMNS}''',
+        (min(job_ids), job_ids)
+    )
+    jobs = sorted((_job_from_row(row) for row in cur.fetchall()), key=lambda job: job['id'])
+    conn.commit()
+    cur.close()
+    return jobs
+
+
+def get_job(conn, job_id: int) -> Optional[Dict[str, Any]]:
+    cur = conn.cursor()
+    cur.execute(f'SELECT {JOB_COLUMNS} FROM {SCHEMA}.sync_jobs WHERE id = %s', (job_id,))
+    row = cur.fetchone()
+    cur.close()
+    return _job_from_row(row) if row else None
+
+
+def record_run(conn, branch_id: int, entity_names: List[str], stats: Dict[str, Any], error: Optional[str] = None) -> Dict[str, Any]:
+    '''Finished synchronous run of one branch, stored next to async jobs so every branch has a history'''
+    cur = conn.cursor()
+    cur.execute(
+        f'''INSERT INTO {SCHEMA}.sync_jobs (branch_id, entities, status, entity_index, stats, error, finished_at)
+            VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+            RETURNING {JOB_COLUMNS}''',
+        (
+            branch_id, ','.join(entity_names), 'failed' if error else 'done',
+            0 if error else len(entity_names), json.dumps(stats, ensure_ascii=False), error[:2000] if error else None
+        )
+    )
+    job = _job_from_row(cur.fetchone())
+    conn.commit()
+    cur.close()
+    return job
+
+
+def waiting_for_batch(conn, job: Dict[str, Any]) -> bool:
+    '''Whether another unfinished job of the batch is still syncing users'''
+    if job['batch_id'] is None:
+        return False
+    cur = conn.cursor()
+    cur.execute(
+        f'''SELECT EXISTS (
+                SELECT 1 FROM {SCHEMA}.sync_jobs s
+                WHERE s.batch_id = %s AND s.id <> %s AND s.status IN ('pending', 'running') AND {users_phase_sql('s')}
+            )''',
+        (job['batch_id'], job['id'])
+    )
+    waiting = cur.fetchone()[0]
+    cur.close()
+    return waiting
+
+
+def next_job_ids(conn, limit: int = 1) -> List[int]:
+    '''
+    Oldest unfinished jobs that can make progress, for timer-triggered workers. Jobs that finished
+    users but wait for the rest of their batch are skipped, so they do not take the worker slots
+    of the branches they wait for
+    '''
+    cur = conn.cursor()
+    cur.execute(
+        f'''SELECT j.id FROM {SCHEMA}.sync_jobs j
+            WHERE j.status IN ('pending', 'running')
+              AND ({users_phase_sql('j')} OR j.batch_id IS NULL OR NOT EXISTS (
+                  SELECT 1 FROM {SCHEMA}.sync_jobs s
+                  WHERE s.batch_id = j.batch_id AND s.id <> j.id
+                    AND s.status IN ('pending', 'running') AND {users_phase_sql('s')}
+              ))
+            ORDER BY j.id
+            LIMIT %s''',
+        (limit,)
+    )
+    rows = cur.fetchall()
+    cur.close()
+    return [row[0] for row in rows]
+
+
+def run_job_slice(conn, client: AlfaCRMClient, job_id: int, slice_seconds: float = SLICE_SECONDS) -> Optional[Dict[str, Any]]:
+    '''
+    Advance job_id for at most slice_seconds; every page is committed together with the new position,
+    so a timeout loses at most the page in progress
+    Returns: job state after the slice, None if the job does not exist
+    '''
+    deadline = time.monotonic() + slice_seconds
+    cur = conn.cursor()
+
+    # Сессионная блокировка: два вызова не обрабатывают одно задание одновременно
+    cur.execute('SELECT pg_try_advisory_lock(%s, %s)', (_LOCK_NAMESPACE, job_id))
+    if not cur.fetchone()[0]:
+        cur.close()
+        job = get_job(conn, job_id)
+        if job:
+            job['busy'] = True
+        return job
+
+    try:
+        job = get_job(conn, job_id)
+        if job is None or job['status'] in ('done', 'failed'):
+            return job
+
+        engine = SyncEngine(client, conn, job['branch_id'], job['entities'], job['stats'])
+        # Как и в синхронном режиме: занятия только после пользователей всех филиалов пакета
+        stop_at = users_phase_end(job) if waiting_for_batch(conn, job) else None
+
+        def checkpoint(position: Position) -> None:
+            cur.execute(
+                f'''UPDATE {SCHEMA}.sync_jobs
+                    SET status = 'running', entity_index = %s, page = %s, stats = %s, attempts = 0,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %s''',
+                (position[0], position[1], json.dumps(engine.stats_dict(), ensure_ascii=False), job_id)
+            )
+            conn.commit()
+
+        try:
+            position, finished = engine.run_slice((job['entity_index'], job['page']), deadline, checkpoint, stop_at)
+        except Exception as e:
+            conn.rollback()
+            # Временная ошибка (429, 5xx, таймаут, открытый предохранитель) оставляет задание pending с той же позиции
+            retry = (isinstance(e, CircuitOpenError) or is_retryable(e)) and job['attempts'] + 1 < MAX_ATTEMPTS
+            cur.execute(
+                f'''UPDATE {SCHEMA}.sync_jobs
+                    SET status = %s, attempts = attempts + 1, error = %s, updated_at = CURRENT_TIMESTAMP,
+                        finished_at = CASE WHEN %s THEN NULL ELSE CURRENT_TIMESTAMP END
+                    WHERE id = %s''',
+                ('pending' if retry else 'failed', str(e)[:2000], retry, job_id)
+            )
+            conn.commit()
+            raise
+
+        if finished:
+            cur.execute(
+                f'''UPDATE {SCHEMA}.sync_jobs
+                    SET status = 'done', updated_at = CURRENT_TIMESTAMP, finished_at = CURRENT_TIMESTAMP
+                    WHERE id = %s''',
+                (job_id,)
+            )
+            conn.commit()
+        job = get_job(conn, job_id)
+        if not finished and stop_at is not None and position[0] >= stop_at:
+            job['waiting'] = True
+        return job
+    finally:
+        cur.execute('SELECT pg_advisory_unlock(%s, %s)', (_LOCK_NAMESPACE, job_id))
+        conn.commit()
+        cur.close()
+
+
+def job_progress(job: Dict[str, Any]) -> Dict[str, Any]:
+    '''Share of entities done plus page position inside the current one'''
+    entities = job['entities']
+    current = entities[job['entity_index']] if job['entity_index'] < len(entities) else None
+    current_stats = job['stats'].get(current, {}) if current else {}
+    return {
+        'entities_done': min(job['entity_index'], len(entities)),
+        'entities_total': len(entities),
+        'current_entity': current,
+        'current_page': job['page'],
+        'current_fetched': current_stats.get('fetched', 0),
+        'current_total': current_stats.get('total', 0)
+    }
+
+
+def serialize_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    result = {
+        'job_id': job['id'],
+        'branch_id': job['branch_id'],
+        'status': job['status'],
+        'progress': job_progress(job),
+        'stats': job['stats'],
+        'error': job['error'],
+        'created_at': job['created_at'].isoformat() if job['created_at'] else None,
+        'updated_at': job['updated_at'].isoformat() if job['updated_at'] else None,
+        'finished_at': job['finished_at'].isoformat() if job['finished_at'] else None,
+        'attempts': job['attempts']
+    }
+    if job.get('busy'):
+        result['busy'] = True
+    if job.get('waiting'):
+        result['waiting'] = True
+    return result
+
+
+def _job_from_row(row: tuple) -> Dict[str, Any]:
+    stats = row[6]
+    if isinstance(stats, str):
+        stats = json.loads(stats)
+    return {
+        'id': row[0],
+        'branch_id': row[1],
+        'entities': [name for name in row[2].split(',') if name],
+        'status': row[3],
+        'entity_index': row[4],
+        'page': row[5],
+        'stats': stats or {},
+        'error': row[7],
+        'created_at': row[8],
+        'updated_at': row[9],
+        'finished_at': row[10],
+        'attempts': row[11],
+        'batch_id': row[12]
+    }
@@ -0,0 +1,196 @@
+'''
+Business: Приём вебхуков AlfaCRM (ученики, педагоги, занятия) и точечное обновление одной записи
+Args: event - dict с httpMethod, body (JSON вебхука AlfaCRM), queryStringParameters (secret)
+      context - объект с атрибутами request_id, function_name
+Returns: JSON с результатом: applied, unchanged, skipped, deleted, not_found, ignored или duplicate
+'''
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+from typing import Dict, Any, Optional, Tuple
+
+from alfacrm_client import AlfaCRMClient
+from db_metrics import QueryMetrics, connect
+from db_routing import lsn_headers, write_position
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from sync_engine import ENTITIES, SCHEMA, EntityStats
+
+# Ключи идемпотентности хранятся столько часов; повтор внутри окна не применяется второй раз
+DEDUP_WINDOW_HOURS = int(os.environ.get('WEBHOOK_DEDUP_HOURS', '24'))
+
+# Сущность AlfaCRM в вебхуке -> синхронизатор из sync_engine
+WEBHOOK_ENTITIES = {'customer': 'customers', 'teacher': 'teachers', 'lesson': 'lessons'}
+WEBHOOK_EVENTS = ('create', 'update', 'delete')
+
+PREFLIGHT = preflight_response('POST, OPTIONS', 'Content-Type, X-Webhook-Secret, Idempotency-Key, X-Debug-Timing')
+
+def json_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps(body, ensure_ascii=False)
+    }
+
+def get_header(event: Dict[str, Any], name: str) -> Optional[str]:
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+def parse_webhook(event: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    '''
+    Returns: (webhook with entity, event, entity_id, branch_id, None) or (None, validation error)
+    '''
+    raw = event.get('body') or ''
+    if event.get('isBase64Encoded'):
+        raw = base64.b64decode(raw).decode('utf-8')
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        return None, 'Body must be JSON'
+    if not isinstance(payload, dict):
+        return None, 'Body must be a JSON object'
+
+    entity = str(payload.get('entity', '')).lower()
+    if entity not in WEBHOOK_ENTITIES:
+        return None, f'Unsupported entity: {payload.get("entity")}'
+    action = str(payload.get('event', '')).lower()
+    if action not in WEBHOOK_EVENTS:
+        return None, f'Unsupported event: {payload.get("event")}'
+    try:
+        entity_id = int(payload.get('entity_id'))
+        branch_id = int(payload['branch_id']) if payload.get('branch_id') else None
+    except (TypeError, ValueError):
+        return None, 'entity_id and branch_id must be integers'
+
+    return {
+        'entity': entity,
+        'event': action,
+        'entity_id': entity_id,
+        'branch_id': branch_id,
+        'payload': payload
+    }, None
+
+def idempotency_key(event: Dict[str, Any], webhook: Dict[str, Any]) -> str:
+    '''Idempotency-Key header if AlfaCRM (or a proxy) sends one, else a hash of the canonical payload'''
+    source = get_header(event, 'Idempotency-Key') or json.dumps(webhook['payload'], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def apply_webhook(cur, client: AlfaCRMClient, webhook: Dict[str, Any], branch_id: int) -> Tuple[str, EntityStats]:
+    '''
+    Upsert or delete one entity. Webhook fields can be partial, so the current state
+    is re-read from AlfaCRM and goes through the same mapping as the full sync
+    '''
+    entity = ENTITIES[WEBHOOK_ENTITIES[webhook['entity']]]
+    stats = EntityStats()
+
+    if webhook['event'] == 'delete':
+        # Учеников и педагогов не удаляем: у них остаются результаты игр
+        if webhook['entity'] != 'lesson':
+            return 'ignored', stats
+        cur.execute(
+            f'DELETE FROM {SCHEMA}.assignments WHERE alfacrm_id = %s AND type = %s',
+            (str(webhook['entity_id']), 'lesson')
+        )
+        return ('deleted' if cur.rowcount else 'not_found'), stats
+
+    filters = dict(entity.filters or {})
+    filters['id'] = webhook['entity_id']
+    data = client.fetch_page(entity.endpoint, branch_id, 0, filters)
+    items = [item for item in data.get('items', []) if str(item.get('id')) == str(webhook['entity_id'])]
+    if not items:
+        return 'not_found', stats
+
+    stats.fetched = len(items)
+    entity.sync_page(cur, items, stats)
+    if stats.added or stats.updated:
+        return 'applied', stats
+    return ('unchanged' if stats.unchanged else 'skipped'), stats
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return PREFLIGHT
+
+    if method != 'POST':
+        return METHOD_NOT_ALLOWED
+
+    secret = os.environ.get('ALFACRM_WEBHOOK_SECRET')
+    database_url = os.environ.get('DATABASE_URL')
+    domain = os.environ.get('ALFACRM_DOMAIN')
+    email = os.environ.get('ALFACRM_EMAIL')
+    api_key = os.environ.get('ALFACRM_API_KEY')
+    if not all([secret, database_url, domain, email, api_key]):
+        return json_response(500, {'error': 'Missing configuration'})
+
+    # AlfaCRM не подписывает вебхуки, поэтому секрет передаётся в URL (?secret=) или заголовке
+    params = event.get('queryStringParameters') or {}
+    provided = params.get('secret') or get_header(event, 'X-Webhook-Secret') or ''
+    if not hmac.compare_digest(provided.encode('utf-8'), secret.encode('utf-8')):
+        return json_response(401, {'error': 'Invalid webhook secret'})
+
+    webhook, error = parse_webhook(event)
+    if webhook is None:
+        return json_response(400, {'error': error})
+
+    branch_id = webhook['branch_id'] or int(os.environ.get('ALFACRM_BRANCH_ID') or 0)
+    if not branch_id:
+        return json_response(400, {'error': 'branch_id is required'})
+
+    key = idempotency_key(event, webhook)
+    metrics = QueryMetrics('alfacrm-webhook')
+    conn = connect(database_url, metrics)
+    cur = conn.cursor()
+    try:
+        cur.execute(
+            f'''DELETE FROM {SCHEMA}.webhook_events
+                WHERE received_at < CURRENT_TIMESTAMP - make_interval(hours => %s)''',
+            (DEDUP_WINDOW_HOURS,)
+        )
+        # Ключ вставляется в той же транзакции, что и изменения: при ошибке он откатится и повтор AlfaCRM пройдёт
+        cur.execute(
+            f'''INSERT INTO {SCHEMA}.webhook_events (idempotency_key, entity, entity_id, event, branch_id, result)
+                VALUES (%s, %s, %s, %s, %s, 'processing')
+                ON CONFLICT (idempotency_key) DO NOTHING
+                RETURNING idempotency_key''',
+            (key, webhook['entity'], webhook['entity_id'], webhook['event'], branch_id)
+        )
+        if cur.fetchone() is None:
+            conn.commit()
+            return metrics.apply(json_response(200, {'success': True, 'result': 'duplicate', 'idempotency_key': key}), event)
+
+        client = AlfaCRMClient(domain, email, api_key)
+        result, stats = apply_webhook(cur, client, webhook, branch_id)
+        cur.execute(
+            f'UPDATE {SCHEMA}.webhook_events SET result = %s WHERE idempotency_key = %s',
+            (result, key)
+        )
+        conn.commit()
+        print(f'🔔 {webhook["entity"]} {webhook["entity_id"]} {webhook["event"]}: {result}')
+
+        response = json_response(200, {
+            'success': True,
+            'result': result,
+            'entity': webhook['entity'],
+            'entity_id': webhook['entity_id'],
+            'added': stats.added,
+            'updated': stats.updated,
+            'errors': stats.errors[:10],
+            'idempotency_key': key
+        })
+        response['headers'].update(lsn_headers(write_position(cur)))
+        return metrics.apply(response, event)
+
+    except Exception as e:
+        conn.rollback()
+        print(f'❌ Ошибка обработки вебхука {webhook["entity"]} {webhook["entity_id"]}: {e}')
+        # 5xx: AlfaCRM повторит доставку, ключ не сохранён
+        return json_response(502, {'success': False, 'error': str(e)})
+    finally:
+        cur.close()
+        conn.close()
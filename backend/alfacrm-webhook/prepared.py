@@ -0,0 +1,32 @@
+'''
+Business: Server-side prepared statements for psycopg2 connections
+Args: execute_prepared(cur, name, sql, params, types) - sql uses $1..$n, types are PostgreSQL types of the params
+Returns: nothing; results are read from cur as after cur.execute
+'''
+import threading
+import weakref
+from typing import Any, Sequence, Set
+
+# Имена подготовленных операторов по соединениям; PREPARE живёт всю сессию и не откатывается вместе с транзакцией
+_prepared: 'weakref.WeakKeyDictionary[Any, Set[str]]' = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def execute_prepared(cur, name: str, sql: str, params: Sequence[Any], types: Sequence[str]) -> None:
+    '''
+    PREPARE sql once per connection, then EXECUTE it: the statement is parsed and planned once
+    instead of on every call. Arguments are cast explicitly, so arrays of NULLs keep their type
+    '''
+    with _lock:
+        names = _prepared.setdefault(cur.connection, set())
+        is_new = name not in names
+    if is_new:
+        cur.execute(f'PREPARE {name} ({", ".join(types)}) AS {sql}')
+        with _lock:
+            names.add(name)
+    cur.execute(f'EXECUTE {name} ({", ".join(f"%s::{type_name}" for type_name in types)})', tuple(params))
+
+
+def columns_of(rows: Sequence[tuple], count: int) -> list:
+    '''Row tuples -> one list per column, the shape unnest($1::T[], $2::T[], ...) expects'''
+    return [list(column) for column in zip(*rows)] if rows else [[] for _ in range(count)]
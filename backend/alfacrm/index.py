@@ -6,9 +6,153 @@ Returns: HTTP response with AlfaCRM data or error
 '''
 import json
 import os
-from typing import Dict, Any, Optional
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Any, Optional, Callable, Tuple, List
+
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from resilience import CircuitOpenError, get_caller
+
+if TYPE_CHECKING:
+    from urllib.request import Request
+
+# Warm instances keep these between invocations: identical concurrent requests
+# share one upstream fetch, and repeated ones within the TTL are served from memory.
+CACHE_TTL_SECONDS = float(os.environ.get('ALFACRM_CACHE_TTL', '30'))
+TOKEN_TTL_SECONDS = float(os.environ.get('ALFACRM_TOKEN_TTL', '600'))
+CACHE_MAX_ENTRIES = 256
+# Expired entries stay in memory and are served (X-Cache: STALE) while AlfaCRM is failing
+STALE_TTL_SECONDS = float(os.environ.get('ALFACRM_STALE_TTL', '3600'))
+
+_cache_lock = threading.Lock()
+_response_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+_inflight: Dict[Tuple, 'InflightFetch'] = {}
+_cache_stats: Dict[str, int] = {'hits': 0, 'misses': 0, 'coalesced': 0}
+_token_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+
+# Fields the frontend actually reads; nested keys use dot notation (details.is_attend)
+DEFAULT_FIELDS: Dict[str, List[str]] = {
+    'students': ['id', 'name', 'phone', 'email', 'status', 'is_study'],
+    'teachers': ['id', 'name', 'phone', 'email'],
+    'lessons': [
+        'id', 'date', 'time_from', 'time_to', 'status', 'lesson_type_id',
+        'subject_id', 'subject_name', 'teacher_ids', 'teacher_name', 'customer_ids',
+        'details.customer_id', 'details.is_attend', 'details.ctt_id'
+    ]
+}
+
+PREFLIGHT = preflight_response('GET, POST, OPTIONS', 'Content-Type, X-User-Id')
+
+
+class InflightFetch:
+    '''Upstream fetch in progress; followers wait on it instead of calling AlfaCRM'''
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+def fetch_coalesced(key: Tuple, fetch: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], str]:
+    '''
+    Return cached data for key, join an in-flight fetch, or perform the fetch
+    Returns: (data, cache status: HIT, COALESCED or MISS)
+    '''
+    with _cache_lock:
+        cached = _response_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            _cache_stats['hits'] += 1
+            return cached[1], 'HIT'
+
+        inflight = _inflight.get(key)
+        is_leader = inflight is None
+        if is_leader:
+            inflight = InflightFetch()
+            _inflight[key] = inflight
+            _cache_stats['misses'] += 1
+        else:
+            _cache_stats['coalesced'] += 1
+
+    if not is_leader:
+        inflight.done.wait()
+        if inflight.error is not None:
+            raise inflight.error
+        return inflight.result, 'COALESCED'
+
+    try:
+        inflight.result = fetch()
+        with _cache_lock:
+            now = time.monotonic()
+            if len(_response_cache) >= CACHE_MAX_ENTRIES:
+                for stale_key in [k for k, (expires, _) in _response_cache.items() if expires + STALE_TTL_SECONDS <= now]:
+                    del _response_cache[stale_key]
+            if len(_response_cache) < CACHE_MAX_ENTRIES:
+                _response_cache[key] = (now + CACHE_TTL_SECONDS, inflight.result)
+        return inflight.result, 'MISS'
+    except BaseException as e:
+        inflight.error = e
+        raise
+    finally:
+        with _cache_lock:
+            _inflight.pop(key, None)
+        inflight.done.set()
+
+
+def get_stale(key: Tuple) -> Optional[Dict[str, Any]]:
+    '''Expired cache entry still within STALE_TTL_SECONDS, for degraded mode'''
+    with _cache_lock:
+        cached = _response_cache.get(key)
+        if cached and cached[0] + STALE_TTL_SECONDS > time.monotonic():
+            _cache_stats['stale'] = _cache_stats.get('stale', 0) + 1
+            return cached[1]
+    return None
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    '''Snapshot of cache counters for this instance'''
+    with _cache_lock:
+        return {
+            **_cache_stats,
+            'entries': len(_response_cache),
+            'inflight': len(_inflight),
+            'ttl_seconds': CACHE_TTL_SECONDS
+        }
+
+
+def build_projection(fields: List[str]) -> Dict[str, Any]:
+    '''
+    Turn ['id', 'details.is_attend'] into a nested key tree {'id': {}, 'details': {'is_attend': {}}}
+    '''
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        for part in field.split('.'):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def project_value(value: Any, tree: Dict[str, Any]) -> Any:
+    '''Keep only the keys of tree; lists of objects are projected element-wise'''
+    if not tree:
+        return value
+    if isinstance(value, dict):
+        return {key: project_value(value[key], subtree) for key, subtree in tree.items() if key in value}
+    if isinstance(value, list):
+        return [project_value(item, tree) for item in value]
+    return value
+
+
+def resolve_fields(entity_type: str, fields_param: Optional[str]) -> Optional[List[str]]:
+    '''
+    Fields requested via fields= or per-type defaults; None means raw items (fields=*)
+    '''
+    if fields_param:
+        if fields_param.strip() in ('*', 'all'):
+            return None
+        return [field.strip() for field in fields_param.split(',') if field.strip()]
+    return DEFAULT_FIELDS.get(entity_type)
+
 
 def get_auth_token(domain: str, email: str, api_key: str) -> str:
     '''
@@ -16,50 +160,103 @@ def get_auth_token(domain: str, email: str, api_key: str) -> str:
     '''
     url = f'https://{domain}/v2api/auth/login'
     headers = {'Content-Type': 'application/json'}
-    
+
     auth_data = json.dumps({
         'email': email,
         'api_key': api_key
     }).encode('utf-8')
-    
+
+    from urllib.request import Request
+
     req = Request(url, data=auth_data, headers=headers, method='POST')
-    with urlopen(req, timeout=10) as response:
-        data = json.loads(response.read().decode('utf-8'))
-    
-    return data.get('token', '')
+    return call_alfacrm(domain, req).get('token', '')
+
+
+def get_cached_auth_token(domain: str, email: str, api_key: str) -> str:
+    '''
+    Reuse the session token of this instance instead of logging in per request
+    '''
+    cache_key = (domain, email)
+    with _cache_lock:
+        cached = _token_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+    token = get_auth_token(domain, email, api_key)
+    if token:
+        with _cache_lock:
+            _token_cache[cache_key] = (time.monotonic() + TOKEN_TTL_SECONDS, token)
+    return token
+
+
+def invalidate_auth_token(domain: str, email: str) -> None:
+    with _cache_lock:
+        _token_cache.pop((domain, email), None)
+
+
+def call_alfacrm(domain: str, req: 'Request') -> Dict[str, Any]:
+    '''
+    Send req through the resilience caller of domain: adaptive timeout per endpoint path, retries, circuit breaker
+    '''
+    from urllib.request import urlopen
+
+    def attempt(timeout: float) -> Dict[str, Any]:
+        with urlopen(req, timeout=timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+    return get_caller(domain).call(attempt, endpoint=req.selector.split('?')[0])
+
+
+def post_alfacrm(domain: str, path: str, auth_token: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    '''
+    POST JSON payload to AlfaCRM endpoint with session token; every proxied call is a read
+    '''
+    headers = {
+        'X-ALFACRM-TOKEN': auth_token,
+        'Content-Type': 'application/json'
+    }
+    from urllib.request import Request
+
+    request_data = json.dumps(payload).encode('utf-8')
+    req = Request(f'https://{domain}/v2api/{path}', data=request_data, headers=headers, method='POST')
+    return call_alfacrm(domain, req)
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
-    
+
     # Handle CORS OPTIONS request
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, X-User-Id',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
-    
+        return PREFLIGHT
+
     if method != 'GET':
+        return METHOD_NOT_ALLOWED
+
+    # Imported here, not at module level: a cold instance answers preflights without loading urllib
+    from urllib.error import HTTPError, URLError
+
+    params = event.get('queryStringParameters') or {}
+    entity_type: str = params.get('type', 'test')
+
+    if entity_type == 'cache_stats':
         return {
-            'statusCode': 405,
+            'statusCode': 200,
             'headers': {
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({'error': 'Method not allowed'})
+            'body': json.dumps({
+                'success': True,
+                'cache': get_cache_stats(),
+                'upstream': get_caller(os.environ.get('ALFACRM_DOMAIN', '')).snapshot()
+            })
         }
-    
+
     # Get AlfaCRM credentials from environment
     api_key: Optional[str] = os.environ.get('ALFACRM_API_KEY')
     branch_id: Optional[str] = os.environ.get('ALFACRM_BRANCH_ID')
     domain: Optional[str] = os.environ.get('ALFACRM_DOMAIN')
     email: Optional[str] = os.environ.get('ALFACRM_EMAIL')
-    
+
     if not api_key or not branch_id or not domain or not email:
         return {
             'statusCode': 500,
@@ -72,49 +269,75 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'details': 'ALFACRM_API_KEY, ALFACRM_BRANCH_ID, ALFACRM_DOMAIN or ALFACRM_EMAIL not configured'
             })
         }
-    
-    params = event.get('queryStringParameters') or {}
-    entity_type: str = params.get('type', 'test')
-    
-    # AlfaCRM API base URL (v2 API) with custom domain
-    base_url = f'https://{domain}/v2api'
-    
-    try:
-        # Get authentication token first
-        auth_token = get_auth_token(domain, email, api_key)
-        
+
+    if not branch_id.strip().isdigit():
+        return {
+            'statusCode': 500,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({
+                'error': 'Invalid AlfaCRM configuration',
+                'details': 'ALFACRM_BRANCH_ID must be an integer'
+            })
+        }
+    customer_id: Optional[str] = params.get('customer_id')
+    if customer_id and not customer_id.strip().isdigit():
+        return {
+            'statusCode': 400,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({
+                'error': 'Invalid customer_id',
+                'details': 'customer_id must be an integer'
+            })
+        }
+
+    if entity_type == 'test':
+        request_path = 'customer/index'
+        request_payload: Dict[str, Any] = {'branch_id': int(branch_id), 'page': 1, 'count': 1}
+    elif entity_type == 'students':
+        request_path = 'customer/index'
+        request_payload = {'branch_id': int(branch_id), 'page': 0, 'count': 100}
+    elif entity_type == 'teachers':
+        request_path = 'teacher/index'
+        request_payload = {'branch_id': int(branch_id)}
+    elif entity_type == 'lessons':
+        request_path = 'lesson/index'
+        request_payload = {'branch_id': int(branch_id), 'page': 0, 'count': 100}
+        if customer_id:
+            request_payload['customer_id'] = int(customer_id)
+    else:
+        return {
+            'statusCode': 400,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({
+                'error': 'Invalid entity type',
+                'details': 'Use type=test, students, teachers, lessons or cache_stats'
+            })
+        }
+
+    def fetch_upstream() -> Dict[str, Any]:
+        auth_token = get_cached_auth_token(domain, email, api_key)
         if not auth_token:
-            return {
-                'statusCode': 401,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'Authentication failed',
-                    'details': 'Could not obtain auth token from AlfaCRM'
-                })
-            }
-        
+            raise PermissionError('Could not obtain auth token from AlfaCRM')
+        try:
+            return post_alfacrm(domain, request_path, auth_token, request_payload)
+        except HTTPError as e:
+            if e.code in (401, 403):
+                invalidate_auth_token(domain, email)
+            raise
+
+    try:
         if entity_type == 'test':
-            # Test connection with simple customer list request
-            url = f'{base_url}/customer/index'
-            headers = {
-                'X-ALFACRM-TOKEN': auth_token,
-                'Content-Type': 'application/json'
-            }
-            
-            # Add branch_id as query parameter
-            request_data = json.dumps({
-                'branch_id': int(branch_id),
-                'page': 1,
-                'count': 1
-            }).encode('utf-8')
-            
-            req = Request(url, data=request_data, headers=headers, method='POST')
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                
+            # Connection check always goes upstream
+            data = fetch_upstream()
             return {
                 'statusCode': 200,
                 'headers': {
@@ -127,132 +350,68 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'response': data
                 })
             }
-        
-        elif entity_type == 'students':
-            # Fetch students list
-            url = f'{base_url}/customer/index'
-            headers = {
-                'X-ALFACRM-TOKEN': auth_token,
-                'Content-Type': 'application/json'
-            }
-            
-            request_data = json.dumps({
-                'branch_id': int(branch_id),
-                'page': 0,
-                'count': 100
-            }).encode('utf-8')
-            
-            print(f'Requesting students from: {url}')
-            print(f'Request data: {request_data.decode("utf-8")}')
-            
-            req = Request(url, data=request_data, headers=headers, method='POST')
-            with urlopen(req, timeout=15) as response:
-                response_text = response.read().decode('utf-8')
-                print(f'Raw response: {response_text[:500]}...')
-                data = json.loads(response_text)
-            
-            print(f'Parsed data keys: {list(data.keys())}')
-            print(f'Items count: {len(data.get("items", []))}')
-            print(f'Total: {data.get("total", 0)}')
-            if data.get('items'):
-                first_item = data["items"][0]
-                print(f'First item keys: {list(first_item.keys())}')
-                print(f'First item id: {first_item.get("id")}')
-                print(f'First item name: {first_item.get("name")}')
-                print(f'First item phone field: {first_item.get("phone", "NOT FOUND")}')
-            
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'success': True,
-                    'students': data.get('items', []),
-                    'total': data.get('total', 0)
-                })
-            }
-        
-        elif entity_type == 'teachers':
-            # Fetch teachers list
-            url = f'{base_url}/teacher/index'
-            headers = {
-                'X-ALFACRM-TOKEN': auth_token,
-                'Content-Type': 'application/json'
-            }
-            
-            request_data = json.dumps({
-                'branch_id': int(branch_id)
-            }).encode('utf-8')
-            
-            req = Request(url, data=request_data, headers=headers, method='POST')
-            with urlopen(req, timeout=15) as response:
-                data = json.loads(response.read().decode('utf-8'))
-            
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'success': True,
-                    'teachers': data.get('items', []),
-                    'total': data.get('total', 0)
-                })
-            }
-        
-        elif entity_type == 'lessons':
-            # Fetch lessons list
-            url = f'{base_url}/lesson/index'
-            headers = {
-                'X-ALFACRM-TOKEN': auth_token,
-                'Content-Type': 'application/json'
-            }
-            
-            customer_id = params.get('customer_id')
-            request_payload = {
-                'branch_id': int(branch_id),
-                'page': 0,
-                'count': 100
-            }
-            
-            if customer_id:
-                request_payload['customer_id'] = int(customer_id)
-            
-            request_data = json.dumps(request_payload).encode('utf-8')
-            
-            req = Request(url, data=request_data, headers=headers, method='POST')
-            with urlopen(req, timeout=15) as response:
-                data = json.loads(response.read().decode('utf-8'))
-            
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'success': True,
-                    'lessons': data.get('items', []),
-                    'total': data.get('total', 0)
-                })
-            }
-        
-        else:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'Invalid entity type',
-                    'details': 'Use type=test, students, teachers, or lessons'
-                })
-            }
-    
+
+        cache_key = (domain, entity_type, json.dumps(request_payload, sort_keys=True))
+        try:
+            data, cache_status = fetch_coalesced(cache_key, fetch_upstream)
+        except (CircuitOpenError, HTTPError, URLError, OSError) as e:
+            # AlfaCRM is unavailable: serve the last known data if there is any
+            if isinstance(e, PermissionError) or (isinstance(e, HTTPError) and e.code < 500 and e.code != 429):
+                raise
+            data = get_stale(cache_key)
+            if data is None:
+                raise
+            cache_status = 'STALE'
+        items = data.get('items', [])
+        print(f'AlfaCRM {entity_type}: cache={cache_status}, items={len(items)}, total={data.get("total", 0)}')
+
+        # Cached data stays raw; each request projects its own field set
+        fields = resolve_fields(entity_type, params.get('fields'))
+        if fields is not None:
+            projection = build_projection(fields)
+            items = [project_value(item, projection) for item in items]
+
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*',
+                'X-Cache': cache_status
+            },
+            'body': json.dumps({
+                'success': True,
+                entity_type: items,
+                'total': data.get('total', 0)
+            })
+        }
+
+    except CircuitOpenError as e:
+        return {
+            'statusCode': 503,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*',
+                'Retry-After': str(max(1, int(e.retry_after)))
+            },
+            'body': json.dumps({
+                'error': 'AlfaCRM temporarily unavailable',
+                'details': str(e)
+            })
+        }
+
+    except PermissionError as e:
+        return {
+            'statusCode': 401,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({
+                'error': 'Authentication failed',
+                'details': str(e)
+            })
+        }
+
     except HTTPError as e:
         error_body = e.read().decode('utf-8') if e.fp else 'No error details'
         return {
@@ -267,7 +426,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'details': error_body
             })
         }
-    
+
     except URLError as e:
         return {
             'statusCode': 500,
@@ -280,7 +439,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'details': str(e.reason)
             })
         }
-    
+
     except Exception as e:
         return {
             'statusCode': 500,
@@ -292,4 +451,4 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'error': 'Internal server error',
                 'details': str(e)
             })
-        }
\ No newline at end of file
+        }
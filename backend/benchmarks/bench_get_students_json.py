@@ -0,0 +1,79 @@
+'''
+Business: Benchmark of get-students list rendering: Python dicts + json.dumps vs JSON built in Postgres (render=db)
+Args: --dsn scratch Postgres URL (or BENCH_DATABASE_URL); the app schema in it is dropped and recreated
+      --assignments N (default 50000), --students, --teachers, --runs per mode (default 5)
+Returns: prints median wall and handler CPU ms, peak Python memory and body size of each mode,
+         and checks that both modes return the same document
+Usage: python backend/benchmarks/bench_get_students_json.py --dsn postgresql://localhost/bench --assignments 50000
+'''
+import argparse
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Dict, Any
+
+import harness
+
+MODES = {
+    'python rows + json.dumps': {},
+    'postgres json_agg (render=db)': {'render': 'db'}
+}
+
+
+def measure(handler: Any, params: Dict[str, str], runs: int) -> Dict[str, Any]:
+    wall_ms = []
+    cpu_ms = []
+    for _ in range(runs):
+        started, started_cpu = time.perf_counter(), time.process_time()
+        response = handler({'httpMethod': 'GET', 'queryStringParameters': dict(params)}, None)
+        wall_ms.append((time.perf_counter() - started) * 1000)
+        cpu_ms.append((time.process_time() - started_cpu) * 1000)
+    # tracemalloc замедляет выделение памяти, поэтому пик меряется отдельным прогоном
+    tracemalloc.start()
+    handler({'httpMethod': 'GET', 'queryStringParameters': dict(params)}, None)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'wall_ms': statistics.median(wall_ms),
+        'cpu_ms': statistics.median(cpu_ms),
+        'peak_mib': peak / 1024 / 1024,
+        'body': response['body']
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', default=os.environ.get('BENCH_DATABASE_URL'))
+    parser.add_argument('--assignments', type=int, default=50000)
+    parser.add_argument('--students', type=int, default=2000)
+    parser.add_argument('--teachers', type=int, default=50)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error('--dsn or BENCH_DATABASE_URL is required')
+
+    harness.reset_database(args.dsn)
+    harness.seed_database(args.dsn, args.students, args.teachers, args.assignments)
+    separator = '&' if '?' in args.dsn else '?'
+    os.environ['DATABASE_URL'] = f'{args.dsn}{separator}options=-csearch_path%3D{harness.SCHEMA}'
+    handler = harness.load_handler('get-students')[0].handler
+
+    print(f'{args.students} students, {args.teachers} teachers, {args.assignments} assignments, {args.runs} runs per mode')
+    print(f'{"mode":<32} {"wall ms":>9} {"CPU ms":>9} {"peak MiB":>9} {"body KiB":>9}')
+    documents = []
+    for name, params in MODES.items():
+        result = measure(handler, params, args.runs)
+        # Порядок строк с одинаковой датой или ФИО не определён, сравниваем по id
+        document = json.loads(result['body'])
+        documents.append({key: sorted(items, key=lambda item: int(item['id'])) for key, items in document.items()})
+        print(
+            f'{name:<32} {result["wall_ms"]:>9.1f} {result["cpu_ms"]:>9.1f} '
+            f'{result["peak_mib"]:>9.1f} {len(result["body"].encode("utf-8")) / 1024:>9.0f}'
+        )
+    print('same document:', documents[0] == documents[1])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+'''
+Business: Cold-start benchmark: module import time of every function (python -X importtime) and a cold OPTIONS call
+Args: --functions comma separated function dirs (default: every backend/<fn>/index.py), --runs fresh interpreters per function (default 5)
+      --root backend directory to measure (default: this checkout), e.g. an exported older revision for comparison
+Returns: prints median import ms of index, median cold import + OPTIONS ms, whether psycopg2 / urllib.request
+         were loaded by then, and the heaviest direct imports of index
+Usage: python backend/benchmarks/bench_import_time.py --runs 7
+'''
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ('psycopg2', 'urllib.request')
+
+# Запускается в свежем интерпретаторе из каталога функции, как это делает облачная среда
+COLD_CALL = '''
+import json, sys, time
+started = time.perf_counter()
+import index
+response = index.handler({'httpMethod': 'OPTIONS', 'headers': {}}, None)
+elapsed = time.perf_counter() - started
+print(json.dumps({'ms': elapsed * 1000, 'status': response['statusCode'], 'loaded': [m for m in %r if m in sys.modules]}))
+''' % (HEAVY_MODULES,)
+
+
+def parse_importtime(stderr: str) -> Tuple[float, List[Tuple[str, float]]]:
+    '''
+    Returns: (cumulative ms of index, direct imports of index as (name, cumulative ms), heaviest first)
+    '''
+    total = 0.0
+    children: List[Tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        if name.strip() == 'index':
+            total = int(cumulative) / 1000
+        elif depth == 1:
+            children.append((name.strip(), int(cumulative) / 1000))
+    return total, sorted(children, key=lambda item: item[1], reverse=True)
+
+
+def measure(function_dir: Path, runs: int) -> Dict[str, Any]:
+    import_ms: List[float] = []
+    cold_ms: List[float] = []
+    children: List[Tuple[str, float]] = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        traced = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import index'],
+            cwd=function_dir, capture_output=True, text=True, check=True
+        )
+        total, children = parse_importtime(traced.stderr)
+        import_ms.append(total)
+
+        cold = subprocess.run([sys.executable, '-c', COLD_CALL], cwd=function_dir, capture_output=True, text=True, check=True)
+        result = json.loads(cold.stdout.strip().splitlines()[-1])
+        cold_ms.append(result['ms'])
+        loaded = result['loaded']
+    return {
+        'import_ms': statistics.median(import_ms),
+        'cold_options_ms': statistics.median(cold_ms),
+        'loaded': loaded,
+        'heaviest': children[:3]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--functions', default='')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--root', default=str(BACKEND_DIR))
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    names = [name for name in args.functions.split(',') if name] or sorted(
+        path.parent.name for path in root.glob('*/index.py')
+    )
+    print(f'{"function":<26} {"import ms":>10} {"OPTIONS ms":>11}  {"loaded on OPTIONS":<26} heaviest imports of index')
+    for name in names:
+        result = measure(root / name, args.runs)
+        heaviest = ', '.join(f'{module} {ms:.1f}' for module, ms in result['heaviest'])
+        loaded = ', '.join(result['loaded']) or '-'
+        print(f'{name:<26} {result["import_ms"]:>10.1f} {result["cold_options_ms"]:>11.1f}  {loaded:<26} {heaviest}')
+
+
+if __name__ == '__main__':
+    main()
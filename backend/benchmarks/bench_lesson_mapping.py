@@ -0,0 +1,108 @@
+'''
+Business: Micro-benchmark of the alfacrm-sync lesson mapping stage (CPU only, no DB)
+Args: --count N synthetic lessons (default 100000), --repeat R runs (default 5)
+Returns: prints best/median time of the legacy per-item loop and map_lessons
+Usage: python backend/benchmarks/bench_lesson_mapping.py --count 100000
+'''
+import argparse
+import importlib.util
+import random
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Callable
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_module(function_dir: str, module_name: str):
+    path = BACKEND_DIR / function_dir / f'{module_name}.py'
+    spec = importlib.util.spec_from_file_location(f'{function_dir}.{module_name}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_lessons(count: int, customers: int, teachers: int) -> List[Dict[str, Any]]:
+    rnd = random.Random(42)
+    lessons = []
+    for i in range(count):
+        lesson: Dict[str, Any] = {
+            'id': 100000 + i,
+            'customer_id': rnd.randint(1, customers),
+            'teacher_id': rnd.randint(1, teachers),
+            'subject_id': rnd.choice([0, 1, 2, 3]),
+            'status_id': rnd.choice([1, 2, 3, 4]),
+            'lesson_type_id': rnd.choice([1, 2, 3]),
+            'time_from': f'{rnd.randint(8, 20):02d}:00'
+        }
+        if i % 10:
+            lesson['lesson_date'] = f'2026-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}'
+        lessons.append(lesson)
+    return lessons
+
+
+def legacy_map(lessons: List[Dict[str, Any]], student_ids: Dict[str, int], teacher_ids: Dict[str, int]) -> List[tuple]:
+    '''The pre-refactor loop body with its DB lookups replaced by dict lookups'''
+    rows = []
+    for lesson in lessons:
+        lesson_id = str(lesson['id'])
+        customer_id = str(lesson.get('customer_id', ''))
+        teacher_id_alfa = str(lesson.get('teacher_id', ''))
+        subject_id = lesson.get('subject_id', '')
+        student_db_id = student_ids.get(customer_id)
+        if student_db_id is None:
+            continue
+        teacher_db_id = teacher_ids.get(teacher_id_alfa)
+        lesson_date = lesson.get('lesson_date', datetime.now().strftime('%Y-%m-%d'))
+        lesson_time = lesson.get('time_from', '00:00')
+        status_map = {1: 'scheduled', 2: 'attended', 3: 'missed'}
+        status = status_map.get(lesson.get('status_id', 1), 'scheduled')
+        lesson_type_map = {1: 'group', 2: 'individual_speech', 3: 'individual_neuro'}
+        lesson_type = lesson_type_map.get(lesson.get('lesson_type_id', 1), 'group')
+        subject_name = f"Предмет {subject_id}" if subject_id else "Урок"
+        rows.append((student_db_id, teacher_db_id, f"Занятие {lesson_id}", subject_name,
+                     lesson_date, lesson_time, 'lesson', status, lesson_type, lesson_id))
+    return rows
+
+
+def measure(fn: Callable[[], List[tuple]], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    mapping = load_module('alfacrm-sync', 'mapping')
+    lessons = make_lessons(args.count, customers=2000, teachers=50)
+    # ~5% of lessons reference customers that are not in the database
+    student_ids = {str(i): i for i in range(1, 1901)}
+    teacher_ids = {str(i): 10000 + i for i in range(1, 51)}
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    legacy_rows = legacy_map(lessons, student_ids, teacher_ids)
+    new_rows = mapping.map_lessons(lessons, student_ids, teacher_ids, today)
+    assert legacy_rows == new_rows, 'map_lessons output differs from the legacy loop'
+
+    results = {
+        'legacy loop': measure(lambda: legacy_map(lessons, student_ids, teacher_ids), args.repeat),
+        'map_lessons': measure(lambda: mapping.map_lessons(lessons, student_ids, teacher_ids, today), args.repeat)
+    }
+
+    print(f'{args.count} lessons, {len(new_rows)} rows, {args.repeat} runs')
+    for name, timings in results.items():
+        print(f'{name:>12}: best {min(timings) * 1000:8.1f} ms  median {statistics.median(timings) * 1000:8.1f} ms  '
+              f'({args.count / min(timings):,.0f} lessons/s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+'''
+Business: Benchmark of per-row vs batched and ad-hoc vs prepared user upserts (the sync-students hot path)
+Args: --dsn PostgreSQL DSN (or BENCH_DATABASE_URL), --rows N students (default 5000), --page P rows per page (default 50)
+Returns: prints time, statements and statements/row of every strategy for an insert pass and an update pass
+Usage: python backend/benchmarks/bench_prepared_statements.py --dsn postgresql://localhost/bench --rows 5000
+'''
+import argparse
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+import harness
+
+sync_modules = harness.load_handler('alfacrm-sync')[1]
+prepared = sync_modules['prepared']
+
+TABLE = 'bench_users'
+COLUMNS = ('alfacrm_id', 'full_name', 'phone', 'lessons_attended', 'lessons_missed', 'lessons_paid')
+TYPES = ('varchar', 'varchar', 'varchar', 'int', 'int', 'int')
+
+
+class CountingCursor:
+    '''Counts statements sent to the server'''
+
+    def __init__(self, cur) -> None:
+        self.cur = cur
+        self.statements = 0
+        self.connection = cur.connection
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self.statements += 1
+        self.cur.execute(sql, params)
+
+    def fetchone(self):
+        return self.cur.fetchone()
+
+    def fetchall(self):
+        return self.cur.fetchall()
+
+
+def make_rows(count: int, version: int) -> List[tuple]:
+    rnd = random.Random(version)
+    return [
+        (str(i), f'Ученик {i} v{version}', f'+7900{i:07d}', rnd.randint(0, 40), rnd.randint(0, 5), rnd.randint(0, 40))
+        for i in range(1, count + 1)
+    ]
+
+
+def per_row_literals(cur, page: List[tuple]) -> None:
+    '''The pre-refactor sync-students shape: SELECT then INSERT or UPDATE per row, values spliced into SQL'''
+    for row in page:
+        alfacrm_id, full_name, phone, attended, missed, paid = row
+        name = full_name.replace("'", "''")
+        cur.execute(f"SELECT id FROM {TABLE} WHERE alfacrm_id = '{alfacrm_id}'")
+        existing = cur.fetchone()
+        if existing:
+            cur.execute(
+                f"UPDATE {TABLE} SET full_name = '{name}', phone = '{phone}', lessons_attended = {attended}, "
+                f"lessons_missed = {missed}, lessons_paid = {paid} WHERE id = {existing[0]}"
+            )
+        else:
+            cur.execute(
+                f"INSERT INTO {TABLE} (login, {', '.join(COLUMNS)}) VALUES "
+                f"('student_{alfacrm_id}', '{alfacrm_id}', '{name}', '{phone}', {attended}, {missed}, {paid})"
+            )
+
+
+def per_row_params(cur, page: List[tuple]) -> None:
+    '''Same statements with psycopg2 parameters: safe, but still parsed and planned on every call'''
+    for row in page:
+        cur.execute(f'SELECT id FROM {TABLE} WHERE alfacrm_id = %s', (row[0],))
+        existing = cur.fetchone()
+        if existing:
+            cur.execute(
+                f'''UPDATE {TABLE} SET full_name = %s, phone = %s, lessons_attended = %s,
+                    lessons_missed = %s, lessons_paid = %s WHERE id = %s''',
+                row[1:] + (existing[0],)
+            )
+        else:
+            cur.execute(f'INSERT INTO {TABLE} (login, {", ".join(COLUMNS)}) VALUES (%s, %s, %s, %s, %s, %s, %s)', (f'student_{row[0]}',) + row)
+
+
+def per_row_prepared(cur, page: List[tuple]) -> None:
+    '''Per-row statements, but PREPAREd once per connection and EXECUTEd per row'''
+    for row in page:
+        prepared.execute_prepared(cur, 'bench_row_select', f'SELECT id FROM {TABLE} WHERE alfacrm_id = $1', (row[0],), ('varchar',))
+        existing = cur.fetchone()
+        if existing:
+            prepared.execute_prepared(
+                cur, 'bench_row_update',
+                f'''UPDATE {TABLE} SET full_name = $1, phone = $2, lessons_attended = $3,
+                    lessons_missed = $4, lessons_paid = $5 WHERE id = $6''',
+                row[1:] + (existing[0],), TYPES[1:] + ('int',)
+            )
+        else:
+            prepared.execute_prepared(
+                cur, 'bench_row_insert',
+                f'INSERT INTO {TABLE} (login, {", ".join(COLUMNS)}) VALUES ($1, $2, $3, $4, $5, $6, $7)',
+                (f'student_{row[0]}',) + row, ('varchar',) + TYPES
+            )
+
+
+def batched_values(cur, page: List[tuple]) -> None:
+    '''One upsert per page with execute_values: statement text changes with the page size'''
+    execute_values(
+        cur.cur,
+        f'''INSERT INTO {TABLE} (login, {', '.join(COLUMNS)}) VALUES %s
+            ON CONFLICT (alfacrm_id) DO UPDATE SET {', '.join(f'{c} = EXCLUDED.{c}' for c in COLUMNS[1:])}''',
+        [(f'student_{row[0]}',) + row for row in page],
+        page_size=500
+    )
+    cur.statements += 1
+
+
+def batched_prepared(cur, page: List[tuple]) -> None:
+    '''One prepared upsert per page with the page passed as arrays (what sync_engine does)'''
+    rows = [(f'student_{row[0]}',) + row for row in page]
+    prepared.execute_prepared(
+        cur, 'bench_batch_upsert',
+        f'''INSERT INTO {TABLE} (login, {', '.join(COLUMNS)})
+            SELECT * FROM unnest($1, $2, $3, $4, $5, $6, $7)
+            ON CONFLICT (alfacrm_id) DO UPDATE SET {', '.join(f'{c} = EXCLUDED.{c}' for c in COLUMNS[1:])}''',
+        prepared.columns_of(rows, len(COLUMNS) + 1),
+        [f'{t}[]' for t in ('varchar',) + TYPES]
+    )
+
+
+STRATEGIES: Dict[str, Callable[[Any, List[tuple]], None]] = {
+    'per-row, literals (legacy)': per_row_literals,
+    'per-row, parameters': per_row_params,
+    'per-row, prepared': per_row_prepared,
+    'batched, execute_values': batched_values,
+    'batched, prepared unnest': batched_prepared
+}
+
+
+def run_pass(conn, strategy: Callable, rows: List[tuple], page_size: int) -> Tuple[float, int]:
+    cur = CountingCursor(conn.cursor())
+    started = time.perf_counter()
+    for start in range(0, len(rows), page_size):
+        strategy(cur, rows[start:start + page_size])
+        conn.commit()
+    return time.perf_counter() - started, cur.statements
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', default=os.environ.get('BENCH_DATABASE_URL'))
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--page', type=int, default=50)
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error('--dsn or BENCH_DATABASE_URL is required')
+
+    inserts = make_rows(args.rows, 1)
+    updates = make_rows(args.rows, 2)
+    print(f'{args.rows} rows, pages of {args.page}')
+    print(f'{"strategy":<28} {"insert s":>9} {"update s":>9} {"stmts":>7} {"stmts/row":>10}')
+    for name, strategy in STRATEGIES.items():
+        # Новое соединение на стратегию: подготовленные операторы не переходят между замерами
+        conn = psycopg2.connect(args.dsn)
+        cur = conn.cursor()
+        cur.execute(f'DROP TABLE IF EXISTS {TABLE}')
+        cur.execute(
+            f'''CREATE TABLE {TABLE} (
+                id SERIAL PRIMARY KEY, login VARCHAR(50) UNIQUE NOT NULL, alfacrm_id VARCHAR(100) UNIQUE,
+                full_name VARCHAR(100), phone VARCHAR(20), lessons_attended INTEGER,
+                lessons_missed INTEGER, lessons_paid INTEGER)'''
+        )
+        conn.commit()
+        insert_time, insert_statements = run_pass(conn, strategy, inserts, args.page)
+        update_time, update_statements = run_pass(conn, strategy, updates, args.page)
+        statements = insert_statements + update_statements
+        print(f'{name:<28} {insert_time:>9.3f} {update_time:>9.3f} {statements:>7} {statements / (2 * args.rows):>10.3f}')
+        cur.execute(f'DROP TABLE {TABLE}')
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
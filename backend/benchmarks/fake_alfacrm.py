@@ -0,0 +1,189 @@
+'''
+Business: Local stand-in for the AlfaCRM v2 API used by benchmarks
+Args: FakeAlfaCRM(customers, teachers, lessons, page_size, latency_ms)
+Returns: threaded HTTP server on 127.0.0.1 serving auth/login and */index endpoints
+'''
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+
+FIRST_NAMES = ['Алиса', 'Борис', 'Вера', 'Глеб', 'Дарья', 'Егор', 'Жанна', 'Захар', 'Ирина', 'Кирилл']
+LAST_NAMES = ['Иванов', 'Петрова', 'Сидоров', 'Кузнецова', 'Смирнов', 'Попова', 'Волков', 'Соколова']
+
+
+class FakeAlfaCRM:
+    '''
+    Deterministic AlfaCRM data set behind a real HTTP server
+    Both API styles used in this repo are served:
+      JSON + X-ALFACRM-TOKEN at /v2api/<entity>/index, page numbers from 0
+      form-encoded email/api_key at /v2api/<branch>/<entity>/index, page numbers from 1
+    '''
+
+    def __init__(
+        self,
+        customers: int = 500,
+        teachers: int = 20,
+        lessons: int = 5000,
+        page_size: int = 50,
+        latency_ms: float = 0.0,
+        branches: int = 1,
+        seed: int = 42,
+        error_rate: float = 0.0
+    ) -> None:
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        # Доля ответов 503 и полный отказ (down = True) - для проверки повторов и circuit breaker
+        self.error_rate = error_rate
+        self.down = False
+        self._errors = random.Random(seed)
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self.data: Dict[str, List[Dict[str, Any]]] = self._generate(customers, teachers, lessons, branches, seed)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _generate(customers: int, teachers: int, lessons: int, branches: int, seed: int) -> Dict[str, List[Dict[str, Any]]]:
+        rnd = random.Random(seed)
+        customer_items = []
+        for i in range(1, customers + 1):
+            customer_items.append({
+                'id': i,
+                'branch_ids': [1 + i % branches],
+                'name': f'{rnd.choice(LAST_NAMES)} {rnd.choice(FIRST_NAMES)}',
+                'phone': [f'+7 (9{rnd.randint(10, 99)}) {rnd.randint(100, 999)}-{rnd.randint(10, 99)}-{i % 100:02d}'],
+                'email': [f'customer{i}@example.com'],
+                'is_study': 1,
+                'lesson_count': rnd.randint(0, 80),
+                'attended_count': rnd.randint(0, 80),
+                'lesson_not_count': rnd.randint(0, 10),
+                'missed_count': rnd.randint(0, 10),
+                'paid_count': rnd.randint(0, 100),
+                'balance': f'{rnd.randint(-5000, 20000)}.00',
+                'note': 'x' * rnd.randint(0, 200)
+            })
+        teacher_items = [
+            {
+                'id': i,
+                'branch_ids': [1 + i % branches],
+                'name': f'{rnd.choice(LAST_NAMES)} {rnd.choice(FIRST_NAMES)}',
+                'phone': [f'+7 (900) 000-00-{i % 100:02d}'],
+                'email': [f'teacher{i}@example.com']
+            }
+            for i in range(1, teachers + 1)
+        ]
+        lesson_items = []
+        for i in range(1, lessons + 1):
+            customer_id = rnd.randint(1, max(customers, 1))
+            lesson_date = f'2026-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}'
+            status = rnd.choice([1, 2, 3])
+            lesson_items.append({
+                'id': i,
+                'branch_id': 1 + customer_id % branches,
+                'customer_id': customer_id,
+                'customer_ids': [customer_id],
+                'teacher_id': rnd.randint(1, max(teachers, 1)),
+                'teacher_ids': [rnd.randint(1, max(teachers, 1))],
+                'subject_id': rnd.randint(0, 5),
+                'status': status,
+                'status_id': status,
+                'lesson_type_id': rnd.choice([1, 2, 3]),
+                'lesson_date': lesson_date,
+                'date': lesson_date,
+                'time_from': f'{lesson_date} {rnd.randint(8, 20):02d}:00:00',
+                'time_to': f'{lesson_date} {rnd.randint(8, 20):02d}:45:00',
+                'details': [{'customer_id': customer_id, 'is_attend': rnd.choice([0, 1]), 'ctt_id': None, 'commission': 0}]
+            })
+        branch_items = [{'id': i, 'name': f'Филиал {i}', 'is_active': 1} for i in range(1, branches + 1)]
+        return {'customer': customer_items, 'teacher': teacher_items, 'lesson': lesson_items, 'branch': branch_items}
+
+    def page(self, entity: str, filters: Dict[str, Any], page: int, count: int) -> Dict[str, Any]:
+        items = self.data.get(entity, [])
+        branch_id = filters.get('branch_id')
+        if branch_id and entity != 'branch':
+            branch_id = int(branch_id)
+            items = [
+                item for item in items
+                if branch_id in item.get('branch_ids', [item.get('branch_id', branch_id)])
+            ]
+        if filters.get('customer_id'):
+            customer_id = int(filters['customer_id'])
+            items = [item for item in items if item.get('customer_id') == customer_id]
+        if filters.get('id'):
+            wanted = {int(value) for value in str(filters['id']).split(',')}
+            items = [item for item in items if item['id'] in wanted]
+        size = min(count or self.page_size, self.page_size)
+        start = page * size
+        return {'total': len(items), 'count': len(items[start:start + size]), 'page': page, 'items': items[start:start + size]}
+
+    def handle(self, path: str, body: bytes, content_type: str) -> Tuple[int, Dict[str, Any]]:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        with self._lock:
+            self.requests_served += 1
+            failing = self.down or (self.error_rate and self._errors.random() < self.error_rate)
+        if failing:
+            return 503, {'errors': ['Service unavailable']}
+
+        parts = [part for part in path.split('?')[0].split('/') if part]
+        if parts[:3] == ['v2api', 'auth', 'login']:
+            return 200, {'token': 'bench-token'}
+        if len(parts) < 3 or parts[0] != 'v2api' or parts[-1] != 'index':
+            return 404, {'errors': ['Not found']}
+
+        entity = parts[-2]
+        if 'json' in content_type:
+            filters = json.loads(body.decode('utf-8') or '{}')
+            page = int(filters.get('page', 0) or 0)
+        else:
+            filters = {key: values[0] for key, values in urllib.parse.parse_qs(body.decode('utf-8')).items()}
+            page = max(int(filters.get('page', 1) or 1) - 1, 0)
+        if parts[1].isdigit() and 'branch_id' not in filters:
+            filters['branch_id'] = parts[1]
+        count = int(filters.get('count') or filters.get('per_page') or self.page_size)
+        return 200, self.page(entity, filters, page, count)
+
+    def start(self) -> str:
+        fake = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                status, payload = fake.handle(self.path, self.rfile.read(length), self.headers.get('Content-Type', ''))
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), RequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'FakeAlfaCRM':
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
@@ -0,0 +1,339 @@
+'''
+Business: Offline benchmark of backend handlers against a fake AlfaCRM and a local Postgres
+Args: --dsn scratch Postgres URL (or BENCH_DATABASE_URL); the app schema in it is dropped and recreated
+      --functions alfacrm-sync,sync-students,get-students,save-game-result,alfacrm
+      --iterations, --latency-ms, --error-rate, --page-size, --customers, --teachers, --lessons, --assignments
+Returns: prints latency percentiles, queries per request and peak Python memory per handler
+Usage: BENCH_DATABASE_URL=postgresql://localhost/lineaschool_bench python backend/benchmarks/harness.py
+'''
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import urllib.request
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from fake_alfacrm import FakeAlfaCRM
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+MIGRATIONS_DIR = BACKEND_DIR.parent / 'db_migrations'
+SCHEMA = 't_p720035_lineaschool_app'
+FAKE_DOMAIN = 'alfacrm.bench.local'
+
+DB_FUNCTIONS = ['alfacrm-sync', 'sync-students', 'get-students', 'save-game-result']
+ALL_FUNCTIONS = DB_FUNCTIONS + ['alfacrm']
+
+
+class QueryCounter:
+    '''Counts statements executed through psycopg2 cursors created by handlers'''
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def install(self) -> None:
+        import psycopg2
+        import psycopg2.extensions
+
+        counter = self
+
+        class CountingCursor(psycopg2.extensions.cursor):
+            def execute(self, query, vars=None):
+                counter.count += 1
+                return super().execute(query, vars)
+
+            def executemany(self, query, vars_list):
+                counter.count += 1
+                return super().executemany(query, vars_list)
+
+            def copy_expert(self, sql, file, size=8192):
+                counter.count += 1
+                return super().copy_expert(sql, file, size)
+
+        original_connect = psycopg2.connect
+
+        def counting_connect(*args: Any, **kwargs: Any):
+            # Instrumented handlers (db_metrics.connect) are counted through attach()
+            if 'connection_factory' not in kwargs:
+                kwargs.setdefault('cursor_factory', CountingCursor)
+            return original_connect(*args, **kwargs)
+
+        psycopg2.connect = counting_connect
+
+    def attach(self, db_metrics: Optional[ModuleType]) -> None:
+        '''Count statements recorded by a handler's own db_metrics module'''
+        if db_metrics is None or getattr(db_metrics.QueryMetrics, 'bench_counted', False):
+            return
+        counter = self
+        original_record = db_metrics.QueryMetrics.record
+
+        def counting_record(metrics: Any, statement: Any, duration: float, rows: int) -> None:
+            counter.count += 1
+            original_record(metrics, statement, duration, rows)
+
+        db_metrics.QueryMetrics.record = counting_record
+        db_metrics.QueryMetrics.bench_counted = True
+
+
+def redirect_alfacrm(base_url: str) -> None:
+    '''Send https://FAKE_DOMAIN/... requests made via urllib to the local fake server'''
+    original_urlopen = urllib.request.urlopen
+    prefix = f'https://{FAKE_DOMAIN}'
+
+    def local_urlopen(url: Any, *args: Any, **kwargs: Any):
+        if isinstance(url, urllib.request.Request) and url.full_url.startswith(prefix):
+            url.full_url = base_url + url.full_url[len(prefix):]
+        elif isinstance(url, str) and url.startswith(prefix):
+            url = base_url + url[len(prefix):]
+        return original_urlopen(url, *args, **kwargs)
+
+    urllib.request.urlopen = local_urlopen
+
+
+def load_handler(function_dir: str) -> Tuple[ModuleType, Dict[str, ModuleType]]:
+    '''
+    Import backend/<function_dir>/index.py the way the cloud runtime does (its dir on sys.path)
+    Returns: (index module, sibling helper modules by name)
+    '''
+    directory = str(BACKEND_DIR / function_dir)
+    sys.path.insert(0, directory)
+    siblings: Dict[str, ModuleType] = {}
+    try:
+        spec = importlib.util.spec_from_file_location(f'bench_{function_dir.replace("-", "_")}', Path(directory) / 'index.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module, siblings
+    finally:
+        sys.path.remove(directory)
+        # Sibling helper modules may share names across functions
+        for name, loaded in list(sys.modules.items()):
+            if getattr(loaded, '__file__', None) and str(Path(loaded.__file__).parent) == directory:
+                siblings[name] = loaded
+                del sys.modules[name]
+
+
+def reset_database(dsn: str) -> None:
+    '''Recreate the app schema from db_migrations (V0001 is unqualified, so search_path points at SCHEMA)'''
+    import psycopg2
+
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    cur = conn.cursor()
+    cur.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+    cur.execute(f'CREATE SCHEMA {SCHEMA}')
+    cur.execute(f'SET search_path TO {SCHEMA}, public')
+    for migration in sorted(MIGRATIONS_DIR.glob('V*.sql')):
+        cur.execute(migration.read_text(encoding='utf-8'))
+    cur.close()
+    conn.close()
+
+
+def seed_database(dsn: str, students: int, teachers: int, assignments: int) -> Dict[str, int]:
+    '''Bulk-load users, assignments and one game for the read/write handlers'''
+    import psycopg2
+    from psycopg2.extras import execute_values
+
+    conn = psycopg2.connect(dsn)
+    cur = conn.cursor()
+    execute_values(
+        cur,
+        f'INSERT INTO {SCHEMA}.users (login, password, full_name, role, phone) VALUES %s',
+        [(f'bench_student_{i}', 'x', f'Ученик {i}', 'student', f'7999{i:07d}') for i in range(students)]
+        + [(f'bench_teacher_{i}', 'x', f'Педагог {i}', 'teacher', f'7900{i:07d}') for i in range(teachers)],
+        page_size=1000
+    )
+    cur.execute(f"SELECT min(id), max(id) FROM {SCHEMA}.users WHERE role = 'student'")
+    first_student, last_student = cur.fetchone()
+    cur.execute(f"SELECT min(id) FROM {SCHEMA}.users WHERE role = 'teacher'")
+    first_teacher = cur.fetchone()[0]
+    cur.execute(
+        f'''INSERT INTO {SCHEMA}.assignments (student_id, teacher_id, title, subject, due_date, due_time, type, status, lesson_type)
+            SELECT %s + (g %% %s), %s + (g %% %s), 'Занятие ' || g, 'Урок', DATE '2024-01-01' + (g %% 1000),
+                   '10:00', 'lesson', 'scheduled', 'group'
+            FROM generate_series(1, %s) AS g''',
+        (first_student, last_student - first_student + 1, first_teacher, max(teachers, 1), assignments)
+    )
+    cur.execute(
+        f'''INSERT INTO {SCHEMA}.games (title, game_type, config, created_by)
+            VALUES ('Бенчмарк', 'filword', '{{}}'::jsonb, %s) RETURNING id''',
+        (first_teacher,)
+    )
+    game_id = cur.fetchone()[0]
+    conn.commit()
+    cur.close()
+    conn.close()
+    return {'game_id': game_id, 'student_id': first_student}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def run_function(
+    name: str,
+    handler: Callable[[Dict[str, Any], Any], Dict[str, Any]],
+    make_event: Callable[[int], Dict[str, Any]],
+    iterations: int,
+    counter: Optional[QueryCounter]
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    queries: List[int] = []
+    peaks: List[int] = []
+    statuses: Dict[Any, int] = {}
+
+    for i in range(iterations + 1):
+        event = make_event(i)
+        if counter:
+            counter.count = 0
+        # tracemalloc slows allocation-heavy handlers several times, so memory gets its own extra run
+        traced = i == iterations
+        if traced:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            response = handler(event, None)
+        except Exception as e:
+            response = {'statusCode': 'exception', 'body': f'{type(e).__name__}: {e}'}
+        elapsed = (time.perf_counter() - started) * 1000
+        if traced:
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        else:
+            latencies.append(elapsed)
+        if counter:
+            queries.append(counter.count)
+        status = response.get('statusCode', 0)
+        statuses[status] = statuses.get(status, 0) + 1
+        if (status == 'exception' or status >= 400) and statuses[status] == 1:
+            print(f'  {name}: {status}: {str(response.get("body"))[:300]}')
+
+    return {
+        'function': name,
+        'iterations': iterations,
+        'statuses': statuses,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'max_ms': max(latencies) if latencies else 0.0,
+        'queries_per_request': statistics.mean(queries) if queries else None,
+        'peak_memory_kib': max(peaks) / 1024 if peaks else 0.0
+    }
+
+
+def build_events(name: str, seeded: Dict[str, int], token: Optional[str] = None) -> Callable[[int], Dict[str, Any]]:
+    '''Benchmark request for the handler; token (an admin session token) goes into Authorization'''
+    headers = {'Authorization': f'Bearer {token}'} if token else {}
+    if name == 'get-students':
+        return lambda i: {'httpMethod': 'GET', 'headers': headers, 'queryStringParameters': {}}
+    if name == 'save-game-result':
+        return lambda i: {
+            'httpMethod': 'POST',
+            'headers': headers,
+            'body': json.dumps({
+                'game_id': seeded['game_id'],
+                'student_id': seeded['student_id'],
+                'score': i % 11,
+                'max_score': 10,
+                'time_spent': 60 + i,
+                'details': {'words_found': i % 11, 'total_words': 10}
+            })
+        }
+    if name == 'alfacrm':
+        return lambda i: {
+            'httpMethod': 'GET', 'headers': headers, 'queryStringParameters': {'type': ('students', 'lessons')[i % 2]}
+        }
+    return lambda i: {'httpMethod': 'POST', 'headers': headers, 'queryStringParameters': {}, 'body': '{}'}
+
+
+def print_report(results: List[Dict[str, Any]], fake: FakeAlfaCRM) -> None:
+    print(f'\n{"function":<18}{"n":>5}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"max ms":>10}{"queries":>10}{"peak KiB":>11}  statuses')
+    for row in results:
+        queries = '-' if row['queries_per_request'] is None else f'{row["queries_per_request"]:.1f}'
+        print(
+            f'{row["function"]:<18}{row["iterations"]:>5}{row["p50_ms"]:>10.1f}{row["p95_ms"]:>10.1f}'
+            f'{row["p99_ms"]:>10.1f}{row["max_ms"]:>10.1f}{queries:>10}{row["peak_memory_kib"]:>11.0f}  {row["statuses"]}'
+        )
+    print(f'\nfake AlfaCRM requests served: {fake.requests_served}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', default=os.environ.get('BENCH_DATABASE_URL'))
+    parser.add_argument('--functions', default=','.join(ALL_FUNCTIONS))
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--latency-ms', type=float, default=30.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of fake AlfaCRM responses that are 503')
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--customers', type=int, default=500)
+    parser.add_argument('--teachers', type=int, default=20)
+    parser.add_argument('--lessons', type=int, default=5000)
+    parser.add_argument('--assignments', type=int, default=20000)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    functions = [name.strip() for name in args.functions.split(',') if name.strip()]
+    needs_db = any(name in DB_FUNCTIONS for name in functions)
+    if needs_db and not args.dsn:
+        parser.error('--dsn or BENCH_DATABASE_URL is required for ' + ', '.join(n for n in functions if n in DB_FUNCTIONS))
+
+    fake = FakeAlfaCRM(
+        customers=args.customers,
+        teachers=args.teachers,
+        lessons=args.lessons,
+        page_size=args.page_size,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate
+    )
+    with fake:
+        redirect_alfacrm(fake.base_url)
+        os.environ.update({
+            'ALFACRM_DOMAIN': FAKE_DOMAIN,
+            'ALFACRM_EMAIL': 'bench@example.com',
+            'ALFACRM_API_KEY': 'bench-key',
+            'ALFACRM_BRANCH_ID': '1'
+        })
+        # Sync handlers are admin-only: every request carries a token signed with this secret
+        os.environ.setdefault('AUTH_TOKEN_SECRET', 'bench-token-secret')
+
+        counter: Optional[QueryCounter] = None
+        seeded: Dict[str, int] = {}
+        if needs_db:
+            os.environ['DATABASE_URL'] = args.dsn
+            counter = QueryCounter()
+            counter.install()
+            reset_database(args.dsn)
+            seeded = seed_database(args.dsn, args.customers, args.teachers, args.assignments)
+
+        results = []
+        for name in functions:
+            module, siblings = load_handler(name)
+            if counter:
+                counter.attach(siblings.get('db_metrics'))
+            tokens = siblings.get('session_tokens')
+            token = tokens.issue_token(1, 'admin')[0] if tokens else None
+            print(f'running {name} x{args.iterations}')
+            results.append(run_function(
+                name,
+                module.handler,
+                build_events(name, seeded, token),
+                args.iterations,
+                counter if name in DB_FUNCTIONS else None
+            ))
+
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_report(results, fake)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+'''
+Business: End-to-end check of read-replica routing (db_routing) against a primary and a streaming standby
+Args: --primary-dsn (or BENCH_DATABASE_URL) scratch primary; the app schema in it is dropped and recreated
+      --replica-dsn (or BENCH_READ_DATABASE_URL) hot standby of that primary, as a role allowed to pause WAL replay
+      --max-lag seconds (default 1)
+Returns: prints each scenario with the route the read took (X-DB-Route) and whether it matches the expected one
+Usage: a standby of a local primary is enough, e.g.
+         pg_basebackup -h /tmp/pgdata -D /tmp/pgreplica -R -X stream -c fast
+         pg_ctl -D /tmp/pgreplica -o "-p 5433 -k /tmp/pgreplica" start
+       python backend/benchmarks/replica_routing_check.py --primary-dsn 'postgresql://postgres@/bench?host=/tmp/pgdata' \
+              --replica-dsn 'postgresql://postgres@/bench?host=/tmp/pgreplica&port=5433'
+'''
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Any, List
+
+import psycopg2
+
+import harness
+
+
+def with_schema(dsn: str) -> str:
+    separator = '&' if '?' in dsn else '?'
+    return f'{dsn}{separator}options=-csearch_path%3D{harness.SCHEMA}'
+
+
+def wait_for_replay(primary: Any, replica: Any, timeout: float = 10.0) -> None:
+    primary.execute('SELECT pg_current_wal_lsn()')
+    target = primary.fetchone()[0]
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        replica.execute('SELECT pg_last_wal_replay_lsn() >= %s::pg_lsn', (target,))
+        if replica.fetchone()[0]:
+            return
+        time.sleep(0.05)
+    raise RuntimeError('replica did not catch up; is it a streaming standby of the primary?')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--primary-dsn', default=os.environ.get('BENCH_DATABASE_URL'))
+    parser.add_argument('--replica-dsn', default=os.environ.get('BENCH_READ_DATABASE_URL'))
+    parser.add_argument('--max-lag', type=float, default=1.0)
+    args = parser.parse_args()
+    if not args.primary_dsn or not args.replica_dsn:
+        parser.error('--primary-dsn and --replica-dsn (or BENCH_DATABASE_URL and BENCH_READ_DATABASE_URL) are required')
+
+    harness.reset_database(args.primary_dsn)
+    seeded = harness.seed_database(args.primary_dsn, 50, 5, 500)
+    primary_conn = psycopg2.connect(args.primary_dsn)
+    primary_conn.autocommit = True
+    replica_conn = psycopg2.connect(args.replica_dsn)
+    replica_conn.autocommit = True
+    primary, replica = primary_conn.cursor(), replica_conn.cursor()
+    wait_for_replay(primary, replica)
+
+    os.environ['DATABASE_URL'] = with_schema(args.primary_dsn)
+    os.environ['DB_READ_MAX_LAG_SECONDS'] = str(args.max_lag)
+    students, students_modules = harness.load_handler('get-students')
+    leaderboard = harness.load_handler('get-leaderboard')[0]
+    save_result = harness.load_handler('save-game-result')[0]
+    routing = students_modules['db_routing']
+
+    def read_students(headers: Dict[str, str] = None) -> str:
+        response = students.handler({'httpMethod': 'GET', 'headers': headers or {}, 'queryStringParameters': {}}, None)
+        return response['headers']['X-DB-Route']
+
+    def read_board(headers: Dict[str, str]) -> Dict[str, Any]:
+        response = leaderboard.handler({
+            'httpMethod': 'GET', 'headers': headers, 'queryStringParameters': {'game_id': str(seeded['game_id'])}
+        }, None)
+        return {'route': response['headers']['X-DB-Route'], 'entries': len(json.loads(response['body'])['entries'])}
+
+    results: List[tuple] = []
+
+    def check(name: str, expected: str, actual: str) -> None:
+        results.append((name, expected, actual))
+        print(f'{name:<58} expected {expected:<8} got {actual:<8} {"ok" if expected == actual else "FAIL"}')
+
+    os.environ.pop('DATABASE_READ_URL', None)
+    check('no DATABASE_READ_URL', 'primary', read_students())
+
+    os.environ['DATABASE_READ_URL'] = with_schema(args.replica_dsn)
+    check('replica caught up', 'replica', read_students())
+
+    # Реплика получает WAL, но не применяет его: запись пользователя на ней пока не видна
+    replica.execute('SELECT pg_wal_replay_pause()')
+    try:
+        saved = save_result.handler({'httpMethod': 'POST', 'body': json.dumps({
+            'game_id': seeded['game_id'], 'student_id': seeded['student_id'], 'score': 9, 'max_score': 10, 'time_spent': 30
+        })}, None)
+        lsn = saved['headers'][routing.LSN_HEADER]
+        own = read_board({routing.LSN_HEADER: lsn})
+        other = read_board({})
+        check('read-your-writes: X-DB-LSN not replayed yet', 'primary', own['route'])
+        check('  ... and the own write is visible', '1 entry', f'{own["entries"]} entry')
+        check('other reader keeps using the replica', 'replica', other['route'])
+        check('  ... and sees the replica state', '0 entry', f'{other["entries"]} entry')
+
+        time.sleep(args.max_lag + 0.5)
+        # Ещё одна запись, чтобы у реплики появился непроигранный WAL
+        save_result.handler({'httpMethod': 'POST', 'body': json.dumps({
+            'game_id': seeded['game_id'], 'student_id': seeded['student_id'], 'score': 5, 'max_score': 10, 'time_spent': 40
+        })}, None)
+        time.sleep(0.2)
+        check(f'replay lag above {args.max_lag}s', 'primary', read_students())
+        check('  ... replica skipped during the retry window', 'primary', read_students())
+    finally:
+        replica.execute('SELECT pg_wal_replay_resume()')
+
+    wait_for_replay(primary, replica)
+    routing._replica_skipped_until = 0.0
+    check('replica caught up again', 'replica', read_students())
+    check('  ... X-DB-LSN already replayed', 'replica', read_board({routing.LSN_HEADER: lsn})['route'])
+
+    # Соединение с репликой есть, но проверка свежести падает: запрос всё равно уходит на primary
+    freshness_sql = routing.FRESHNESS_SQL
+    routing.FRESHNESS_SQL = 'SELECT no_such_function()'
+    try:
+        check('replica freshness query fails', 'primary', read_students())
+    finally:
+        routing.FRESHNESS_SQL = freshness_sql
+    routing._replica_skipped_until = 0.0
+
+    os.environ['DATABASE_READ_URL'] = 'postgresql://postgres@127.0.0.1:1/unreachable'
+    check('replica unreachable', 'primary', read_students())
+
+    failed = [name for name, expected, actual in results if expected != actual]
+    print(f'\n{len(results) - len(failed)}/{len(results)} checks passed')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
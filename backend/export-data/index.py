@@ -0,0 +1,220 @@
+'''
+Business: Bulk export of game_results and assignments as CSV or NDJSON, produced by COPY ... TO STDOUT
+Args: event - dict with httpMethod, queryStringParameters:
+      dataset=game_results|assignments, format=csv|ndjson, gzip=1,
+      game_id, student_id, teacher_id, from, to (YYYY-MM-DD, inclusive), after_id, limit
+      context - object with request_id attribute
+Returns: file body (base64 when gzip=1); X-Export-Rows, X-Export-Last-Id and X-Export-Has-More headers
+         for keyset paging: repeat the call with after_id=X-Export-Last-Id while X-Export-Has-More is 1.
+         A page ends after limit rows or once its rows exceed EXPORT_PAGE_BYTES, whichever comes first
+'''
+import base64
+import gzip
+import io
+import json
+import os
+from datetime import date, timedelta
+from typing import Dict, Any, List, Tuple
+
+from db_metrics import QueryMetrics
+from db_routing import LSN_HEADER, connect_for_read, route_headers
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from session_tokens import authenticate
+
+SCHEMA = 't_p720035_lineaschool_app'
+PAGE_ROWS = int(os.environ.get('EXPORT_PAGE_ROWS', '20000'))
+# Тело ответа функции ограничено: страница заканчивается раньше, если её строки занимают больше
+PAGE_BYTES = int(os.environ.get('EXPORT_PAGE_BYTES', '2000000'))
+# Сжатые данные копятся в памяти, сырые строки нет: уровень 6 - компромисс скорости и размера
+GZIP_LEVEL = int(os.environ.get('EXPORT_GZIP_LEVEL', '6'))
+
+DATASETS: Dict[str, Dict[str, Any]] = {
+    'game_results': {
+        'select': f'''SELECT r.id, r.game_id, g.title AS game_title, r.student_id, u.full_name AS student_name,
+                             r.score, r.max_score, r.time_spent, r.completed_at, r.details
+                      FROM {SCHEMA}.game_results r
+                      LEFT JOIN {SCHEMA}.games g ON g.id = r.game_id
+                      LEFT JOIN {SCHEMA}.users u ON u.id = r.student_id''',
+        'id': 'r.id',
+        'date': 'r.completed_at',
+        'filters': {
+            'game_id': 'r.game_id = %s',
+            'student_id': 'r.student_id = %s',
+            'teacher_id': f'r.student_id IN (SELECT student_id FROM {SCHEMA}.assignments WHERE teacher_id = %s)'
+        }
+    },
+    'assignments': {
+        'select': f'''SELECT a.id, a.student_id, s.full_name AS student_name, a.teacher_id, t.full_name AS teacher_name,
+                             a.title, a.subject, a.type, a.lesson_type, a.status, a.completed,
+                             a.due_date, a.due_time, a.description, a.answer, a.alfacrm_id, a.created_at
+                      FROM {SCHEMA}.assignments a
+                      LEFT JOIN {SCHEMA}.users s ON s.id = a.student_id
+                      LEFT JOIN {SCHEMA}.users t ON t.id = a.teacher_id''',
+        'id': 'a.id',
+        'date': 'a.due_date',
+        'filters': {
+            'student_id': 'a.student_id = %s',
+            'teacher_id': 'a.teacher_id = %s'
+        }
+    }
+}
+
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson; charset=utf-8', 'ndjson')
+}
+
+PREFLIGHT = preflight_response('GET, OPTIONS', f'Content-Type, Authorization, X-Debug-Timing, {LSN_HEADER}')
+
+
+class ExportSink:
+    '''
+    File-like target of copy_expert: COPY hands over chunks of rows as they arrive and they go
+    straight into the (optionally gzip) buffer, so no row is ever materialized as a Python object
+    '''
+
+    def __init__(self, compress: bool) -> None:
+        self.buffer = io.BytesIO()
+        self.raw_bytes = 0
+        self.stream = gzip.GzipFile(fileobj=self.buffer, mode='wb', compresslevel=GZIP_LEVEL, mtime=0) if compress else self.buffer
+
+    def write(self, chunk: Any) -> int:
+        data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+        self.raw_bytes += len(data)
+        return self.stream.write(data)
+
+    def getvalue(self) -> bytes:
+        if self.stream is not self.buffer:
+            self.stream.close()
+        return self.buffer.getvalue()
+
+
+def error_response(status_code: int, message: str) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps({'success': False, 'error': message})
+    }
+
+
+def build_query(dataset: Dict[str, Any], params: Dict[str, str]) -> Tuple[List[str], List[Any]]:
+    '''WHERE conditions and their parameters; raises ValueError on malformed filters'''
+    conditions: List[str] = []
+    values: List[Any] = []
+    for name, condition in dataset['filters'].items():
+        if params.get(name):
+            conditions.append(condition)
+            values.append(int(params[name]))
+    if params.get('from'):
+        conditions.append(f"{dataset['date']} >= %s")
+        values.append(date.fromisoformat(params['from']))
+    if params.get('to'):
+        # Включительно по дате: строго меньше следующего дня, чтобы работало и для TIMESTAMP
+        conditions.append(f"{dataset['date']} < %s")
+        values.append(date.fromisoformat(params['to']) + timedelta(days=1))
+    return conditions, values
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return PREFLIGHT
+
+    if method != 'GET':
+        return METHOD_NOT_ALLOWED
+
+    claims, auth_failure = authenticate(event, ('admin', 'teacher'), required=True)
+    if auth_failure:
+        return auth_failure
+
+    params = dict(event.get('queryStringParameters') or {})
+    dataset_name = params.get('dataset', 'game_results')
+    export_format = params.get('format', 'csv')
+    dataset = DATASETS.get(dataset_name)
+    if dataset is None or export_format not in FORMATS:
+        return error_response(400, f'dataset must be one of {", ".join(DATASETS)} and format one of {", ".join(FORMATS)}')
+    unknown = [name for name in ('game_id', 'student_id', 'teacher_id') if params.get(name) and name not in dataset['filters']]
+    if unknown:
+        return error_response(400, f'{", ".join(unknown)} is not a filter of {dataset_name}')
+    # Педагог выгружает только своих учеников
+    if claims['role'] == 'teacher':
+        params['teacher_id'] = str(claims['sub'])
+
+    try:
+        conditions, values = build_query(dataset, params)
+        after_id = int(params.get('after_id') or 0)
+        limit = min(int(params.get('limit') or PAGE_ROWS), PAGE_ROWS)
+    except ValueError:
+        return error_response(400, 'Filters must be integers and from/to YYYY-MM-DD dates')
+    if limit < 1:
+        return error_response(400, 'limit must be positive')
+    compress = params.get('gzip', '').lower() in ('1', 'true', 'yes')
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        return error_response(500, 'Database URL not configured')
+
+    metrics = QueryMetrics('export-data')
+    conn, route = connect_for_read(metrics, event)
+    try:
+        cur = conn.cursor()
+        id_column = dataset['id']
+        where = ' AND '.join(conditions + [f'{id_column} > %s'])
+
+        # Граница страницы по id: проход по индексу, затем COPY ровно этих строк. Размер строки оценивается
+        # по её JSON; страница берёт строки, пока предыдущие не превысили PAGE_BYTES (первая строка - всегда)
+        cur.execute(
+            f'''SELECT COUNT(*) FILTER (WHERE bytes_before < %s), MAX(id) FILTER (WHERE bytes_before < %s), COUNT(*)
+                FROM (
+                    SELECT id, SUM(size) OVER (ORDER BY id) - size AS bytes_before
+                    FROM (
+                        SELECT page.id, octet_length(row_to_json(page)::text) AS size
+                        FROM ({dataset['select']} WHERE {where} ORDER BY {id_column} LIMIT %s) AS page
+                    ) AS sized
+                ) AS running''',
+            [PAGE_BYTES, PAGE_BYTES] + values + [after_id, limit]
+        )
+        rows, last_id, candidates = cur.fetchone()
+
+        sink = ExportSink(compress)
+        if rows:
+            # COPY не принимает параметры запроса: значения подставляет mogrify с экранированием psycopg2
+            select = cur.mogrify(
+                f"{dataset['select']} WHERE {where} AND {id_column} <= %s ORDER BY {id_column}",
+                values + [after_id, last_id]
+            ).decode('utf-8')
+            if export_format == 'csv':
+                copy_sql = f'COPY ({select}) TO STDOUT WITH (FORMAT csv, HEADER true)'
+            else:
+                # Формат csv с символами, которых нет в JSON-тексте: строки уходят без экранирования COPY text
+                copy_sql = (
+                    f"COPY (SELECT row_to_json(export)::text FROM ({select}) AS export) TO STDOUT "
+                    f"WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')"
+                )
+            cur.copy_expert(copy_sql, sink)
+        cur.close()
+        body = sink.getvalue()
+    finally:
+        conn.close()
+
+    content_type, extension = FORMATS[export_format]
+    filename = f'{dataset_name}.{extension}' + ('.gz' if compress else '')
+    headers = {
+        'Content-Type': 'application/gzip' if compress else content_type,
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Expose-Headers': 'X-Export-Rows, X-Export-Last-Id, X-Export-Has-More, Content-Disposition',
+        'X-Export-Rows': str(rows),
+        'X-Export-Last-Id': str(last_id or after_id),
+        'X-Export-Has-More': '1' if candidates == limit or rows < candidates else '0',
+        'X-Export-Raw-Bytes': str(sink.raw_bytes),
+        **route_headers(route)
+    }
+    return metrics.apply({
+        'statusCode': 200,
+        'headers': headers,
+        'isBase64Encoded': compress,
+        'body': base64.b64encode(body).decode('ascii') if compress else body.decode('utf-8')
+    }, event)
@@ -0,0 +1,179 @@
+'''
+Business: Обслуживание партиций game_results: создание будущих месяцев, архивация старых, список партиций
+Args: event - dict с httpMethod, queryStringParameters (action=ensure|archive, months_ahead, older_than_months, drop)
+      context - объект с атрибутами request_id, function_name
+Returns: JSON с созданными/архивированными партициями или списком партиций
+'''
+
+import json
+import os
+import re
+from datetime import date
+from typing import Dict, Any, List
+
+from db_metrics import QueryMetrics, connect
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from session_tokens import authenticate, token_from_event
+
+SCHEMA = 't_p720035_lineaschool_app'
+MONTHS_AHEAD = int(os.environ.get('GAME_RESULTS_MONTHS_AHEAD', '3'))
+# Анонимный ensure доступен таймеру: ограничиваем, сколько партиций он может создать за вызов
+MAX_MONTHS_AHEAD = 12
+RETENTION_MONTHS = int(os.environ.get('GAME_RESULTS_RETENTION_MONTHS', '24'))
+PARTITION_NAME = re.compile(r'^game_results_(\d{4})_(\d{2})$')
+
+PREFLIGHT = preflight_response('GET, POST, OPTIONS', 'Content-Type, Authorization, X-Debug-Timing')
+
+def json_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps(body, ensure_ascii=False, default=str)
+    }
+
+def list_partitions(cur) -> List[Dict[str, Any]]:
+    cur.execute(
+        f'''SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples::bigint, pg_total_relation_size(c.oid)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = '{SCHEMA}.game_results'::regclass
+            ORDER BY c.relname'''
+    )
+    return [
+        {'name': name, 'bounds': bounds, 'estimated_rows': max(rows, 0), 'total_bytes': size}
+        for name, bounds, rows, size in cur.fetchall()
+    ]
+
+def month_shift(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def archive_partitions(conn, older_than_months: int, drop: bool) -> List[Dict[str, Any]]:
+    '''
+    Partitions that end before (current month - older_than_months): detach, roll up into
+    game_results_monthly, then drop the raw rows or keep them as a compacted archive table
+    '''
+    cutoff = month_shift(date.today().replace(day=1), -older_than_months)
+    cur = conn.cursor()
+    archived = []
+    for partition in list_partitions(cur):
+        match = PARTITION_NAME.match(partition['name'])
+        if not match:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if month_shift(month, 1) > cutoff:
+            continue
+
+        name = partition['name']
+        cur.execute(f'ALTER TABLE {SCHEMA}.game_results DETACH PARTITION {SCHEMA}.{name}')
+        cur.execute(
+            f'''INSERT INTO {SCHEMA}.game_results_monthly
+                    (month, game_id, student_id, plays, score_sum, max_score_sum, best_score, time_spent_sum)
+                SELECT %s, COALESCE(game_id, 0), COALESCE(student_id, 0), COUNT(*), SUM(score), SUM(max_score),
+                       MAX(score), COALESCE(SUM(time_spent), 0)
+                FROM {SCHEMA}.{name}
+                GROUP BY 2, 3
+                ON CONFLICT (month, game_id, student_id) DO UPDATE SET
+                    plays = game_results_monthly.plays + EXCLUDED.plays,
+                    score_sum = game_results_monthly.score_sum + EXCLUDED.score_sum,
+                    max_score_sum = game_results_monthly.max_score_sum + EXCLUDED.max_score_sum,
+                    best_score = GREATEST(game_results_monthly.best_score, EXCLUDED.best_score),
+                    time_spent_sum = game_results_monthly.time_spent_sum + EXCLUDED.time_spent_sum''',
+            (month,)
+        )
+        rolled_up = cur.rowcount
+        if drop:
+            cur.execute(f'DROP TABLE {SCHEMA}.{name}')
+            archive_name = None
+        else:
+            # Архив без индексов: только для выгрузок, запросы приложения его не читают
+            archive_name = name.replace('game_results_', 'game_results_archive_')
+            cur.execute(f'ALTER TABLE {SCHEMA}.{name} RENAME TO {archive_name}')
+            cur.execute(
+                '''SELECT indexrelid::regclass::text FROM pg_index
+                   WHERE indrelid = %s::regclass AND NOT indisprimary''',
+                (f'{SCHEMA}.{archive_name}',)
+            )
+            for (index_name,) in cur.fetchall():
+                cur.execute(f'DROP INDEX {index_name}')
+        conn.commit()
+
+        if archive_name:
+            # VACUUM FULL нельзя выполнять внутри транзакции
+            conn.autocommit = True
+            cur.execute(f'VACUUM FULL {SCHEMA}.{archive_name}')
+            conn.autocommit = False
+        archived.append({
+            'partition': name,
+            'month': month.isoformat(),
+            'rollup_rows': rolled_up,
+            'archive_table': archive_name,
+            'bytes_before': partition['total_bytes']
+        })
+    cur.close()
+    return archived
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return PREFLIGHT
+
+    if method not in ('GET', 'POST'):
+        return METHOD_NOT_ALLOWED
+
+    params = event.get('queryStringParameters') or {}
+    action = params.get('action', 'ensure' if method == 'POST' else 'list')
+
+    # Таймер создаёт партиции без токена; архивация (DETACH/DROP) только для администратора при любом AUTH_REQUIRED
+    if not (action == 'ensure' and token_from_event(event) is None):
+        _, auth_failure = authenticate(event, ('admin',), required=action == 'archive')
+        if auth_failure:
+            return auth_failure
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        return json_response(500, {'error': 'Database URL not configured'})
+
+    try:
+        months_ahead = int(params.get('months_ahead', MONTHS_AHEAD))
+        older_than_months = int(params.get('older_than_months', RETENTION_MONTHS))
+    except ValueError:
+        return json_response(400, {'error': 'months_ahead and older_than_months must be integers'})
+    if not 0 <= months_ahead <= MAX_MONTHS_AHEAD:
+        return json_response(400, {'error': f'months_ahead must be between 0 and {MAX_MONTHS_AHEAD}'})
+
+    metrics = QueryMetrics('game-results-maintenance')
+    conn = connect(database_url, metrics)
+    try:
+        if action == 'list':
+            cur = conn.cursor()
+            partitions = list_partitions(cur)
+            cur.close()
+            return metrics.apply(json_response(200, {'success': True, 'partitions': partitions}), event)
+
+        if method != 'POST':
+            return json_response(405, {'error': 'Use POST for ensure and archive'})
+
+        if action == 'ensure':
+            cur = conn.cursor()
+            cur.execute(f'SELECT {SCHEMA}.ensure_game_results_partitions(%s)', (months_ahead,))
+            created = cur.fetchone()[0]
+            conn.commit()
+            cur.close()
+            return metrics.apply(json_response(200, {'success': True, 'created': created, 'months_ahead': months_ahead}), event)
+
+        if action == 'archive':
+            if older_than_months < 1:
+                return json_response(400, {'error': 'older_than_months must be at least 1'})
+            drop = params.get('drop', '').lower() in ('1', 'true', 'yes')
+            archived = archive_partitions(conn, older_than_months, drop)
+            return metrics.apply(json_response(200, {'success': True, 'archived': archived}), event)
+
+        return json_response(400, {'error': 'Unknown action', 'details': 'Use action=list, ensure or archive'})
+    except Exception as e:
+        conn.rollback()
+        return json_response(500, {'success': False, 'error': str(e)})
+    finally:
+        conn.close()
@@ -0,0 +1,98 @@
+'''
+Business: List AlfaCRM branches with the last sync result of each one
+Args: event - dict with httpMethod
+      context - object with request_id attribute
+Returns: HTTP response with branches: id, name, is_active, configured, last_sync
+'''
+import json
+import os
+from typing import Dict, Any, List
+
+from alfacrm_client import AlfaCRMClient
+from db_metrics import QueryMetrics, connect
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+
+SCHEMA = 't_p720035_lineaschool_app'
+
+PREFLIGHT = preflight_response('GET, OPTIONS', 'Content-Type, X-Debug-Timing')
+
+def last_sync_by_branch(conn) -> Dict[int, Dict[str, Any]]:
+    cur = conn.cursor()
+    cur.execute(
+        f'''SELECT DISTINCT ON (branch_id) branch_id, id, status, error, updated_at, finished_at
+            FROM {SCHEMA}.sync_jobs
+            ORDER BY branch_id, id DESC'''
+    )
+    result = {
+        row[0]: {
+            'job_id': row[1],
+            'status': row[2],
+            'error': row[3],
+            'updated_at': row[4].isoformat() if row[4] else None,
+            'finished_at': row[5].isoformat() if row[5] else None
+        }
+        for row in cur.fetchall()
+    }
+    cur.close()
+    return result
+
+def configured_branch_ids() -> List[int]:
+    value = os.environ.get('ALFACRM_BRANCH_IDS') or os.environ.get('ALFACRM_BRANCH_ID') or ''
+    return [int(part) for part in value.split(',') if part.strip().isdigit()]
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return PREFLIGHT
+
+    if method != 'GET':
+        return METHOD_NOT_ALLOWED
+
+    domain = os.environ.get('ALFACRM_DOMAIN')
+    email = os.environ.get('ALFACRM_EMAIL')
+    api_key = os.environ.get('ALFACRM_API_KEY')
+    if not all([domain, email, api_key]):
+        return {
+            'statusCode': 500,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Missing AlfaCRM credentials'})
+        }
+
+    try:
+        items = AlfaCRMClient(domain, email, api_key).fetch_branches()
+    except Exception as e:
+        return {
+            'statusCode': 502,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'success': False, 'error': str(e)})
+        }
+
+    metrics = QueryMetrics('get-branches')
+    last_sync: Dict[int, Dict[str, Any]] = {}
+    dsn = os.environ.get('DATABASE_URL')
+    if dsn:
+        conn = connect(dsn, metrics)
+        try:
+            last_sync = last_sync_by_branch(conn)
+        finally:
+            conn.close()
+
+    configured = configured_branch_ids()
+    branches = [
+        {
+            'id': int(item['id']),
+            'name': item.get('name', ''),
+            'is_active': bool(item.get('is_active', 1)),
+            'configured': int(item['id']) in configured,
+            'last_sync': last_sync.get(int(item['id']))
+        }
+        for item in items
+    ]
+
+    return metrics.apply({
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps({'success': True, 'branches': branches, 'total': len(branches)}, ensure_ascii=False)
+    }, event)
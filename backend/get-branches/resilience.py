@@ -0,0 +1,213 @@
+'''
+Business: Retry with backoff, adaptive timeouts and a circuit breaker for AlfaCRM calls
+Args: get_caller(upstream).call(fn, endpoint=path) - fn receives the timeout to use for its single attempt;
+      latency (and so the timeout) is tracked per endpoint path, the circuit breaker per upstream host
+Returns: fn result; CircuitOpenError while the upstream is considered down
+'''
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar('T')
+
+RETRY_ATTEMPTS = int(os.environ.get('ALFACRM_RETRY_ATTEMPTS', '3'))
+RETRY_BASE_DELAY = 0.3
+RETRY_MAX_DELAY = 3.0
+
+# Таймаут = p95 последних задержек * множитель, в пределах [min, max]; пока замеров мало - max
+TIMEOUT_MIN = 2.0
+TIMEOUT_MAX = float(os.environ.get('ALFACRM_TIMEOUT_MAX', '15'))
+TIMEOUT_MULTIPLIER = 3.0
+LATENCY_PERCENTILE = 0.95
+LATENCY_WINDOW = 50
+LATENCY_MIN_SAMPLES = 5
+
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get('ALFACRM_BREAKER_THRESHOLD', '5'))
+BREAKER_RESET_SECONDS = float(os.environ.get('ALFACRM_BREAKER_RESET', '30'))
+
+
+class CircuitOpenError(Exception):
+    '''Raised without touching the network while the breaker is open'''
+
+    def __init__(self, upstream: str, retry_after: float) -> None:
+        super().__init__(f'{upstream} is unavailable, retry in {retry_after:.0f}s')
+        self.retry_after = retry_after
+
+
+def is_retryable(error: BaseException) -> bool:
+    '''Throttling, 5xx, timeouts and connection errors; other 4xx are the caller's problem'''
+    # urllib.error тянет tempfile; импорт здесь, чтобы модуль ничего не стоил на холодном старте
+    import socket
+    from urllib.error import HTTPError, URLError
+
+    if isinstance(error, HTTPError):
+        return error.code == 429 or error.code >= 500
+    return isinstance(error, (URLError, socket.timeout, TimeoutError, ConnectionError))
+
+
+def backoff_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+    '''Full jitter: uniform(0, base * 2^attempt), honouring Retry-After on 429/503'''
+    from urllib.error import HTTPError
+
+    if isinstance(error, HTTPError) and error.headers is not None:
+        retry_after = error.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX_DELAY)
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+class LatencyTracker:
+    '''Sliding window of successful call durations'''
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def timeout(self, ceiling: float = TIMEOUT_MAX) -> float:
+        if len(self.samples) < LATENCY_MIN_SAMPLES:
+            return ceiling
+        return max(TIMEOUT_MIN, min(ceiling, self.percentile(LATENCY_PERCENTILE) * TIMEOUT_MULTIPLIER))
+
+
+class CircuitBreaker:
+    '''
+    closed -> open after BREAKER_FAILURE_THRESHOLD consecutive upstream failures;
+    open -> half_open after BREAKER_RESET_SECONDS, where a single probe decides
+    '''
+
+    def __init__(self, threshold: int = BREAKER_FAILURE_THRESHOLD, reset_seconds: float = BREAKER_RESET_SECONDS) -> None:
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def before_call(self, upstream: str) -> None:
+        if self.state == 'closed':
+            return
+        if self.state == 'open':
+            waited = time.monotonic() - self.opened_at
+            if waited < self.reset_seconds:
+                raise CircuitOpenError(upstream, self.reset_seconds - waited)
+            self.state = 'half_open'
+        if self.probe_in_flight:
+            raise CircuitOpenError(upstream, 1)
+        self.probe_in_flight = True
+
+    def record_success(self) -> None:
+        self.state = 'closed'
+        self.failures = 0
+        self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.probe_in_flight = False
+        if self.state == 'half_open' or self.failures >= self.threshold:
+            self.state = 'open'
+            self.opened_at = time.monotonic()
+
+
+class ResilientCaller:
+    '''Per-upstream state shared by every call of a warm instance'''
+
+    def __init__(self, upstream: str) -> None:
+        self.upstream = upstream
+        # Разные методы AlfaCRM отвечают с разной скоростью: у каждого пути свой таймаут
+        self.latency: Dict[str, LatencyTracker] = {}
+        self.breaker = CircuitBreaker()
+        self.retries = 0
+        self.fast_failed = 0
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        fn: Callable[[float], T],
+        idempotent: bool = True,
+        max_timeout: float = TIMEOUT_MAX,
+        deadline: Optional[float] = None,
+        endpoint: str = ''
+    ) -> T:
+        '''
+        Run fn(timeout); idempotent calls are retried on transient errors while
+        time.monotonic() + backoff stays before deadline. endpoint (the request path) selects the latency window
+        '''
+        attempts = RETRY_ATTEMPTS if idempotent else 1
+        with self._lock:
+            latency = self.latency.get(endpoint)
+            if latency is None:
+                latency = self.latency[endpoint] = LatencyTracker()
+        for attempt in range(attempts):
+            with self._lock:
+                try:
+                    self.breaker.before_call(self.upstream)
+                except CircuitOpenError:
+                    self.fast_failed += 1
+                    raise
+                timeout = latency.timeout(max_timeout)
+            started = time.monotonic()
+            try:
+                result = fn(timeout)
+            except Exception as e:
+                retryable = is_retryable(e)
+                with self._lock:
+                    if retryable:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                delay = backoff_delay(attempt, e)
+                out_of_time = deadline is not None and time.monotonic() + delay >= deadline
+                if not retryable or attempt == attempts - 1 or out_of_time:
+                    raise
+                with self._lock:
+                    self.retries += 1
+                time.sleep(delay)
+                continue
+            with self._lock:
+                latency.record(time.monotonic() - started)
+                self.breaker.record_success()
+            return result
+        raise AssertionError('unreachable')
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {}
+            for endpoint, latency in sorted(self.latency.items()):
+                p95 = latency.percentile(LATENCY_PERCENTILE)
+                endpoints[endpoint] = {
+                    'timeout_seconds': round(latency.timeout(), 2),
+                    'p95_ms': round(p95 * 1000, 1) if p95 is not None else None,
+                    'samples': len(latency.samples)
+                }
+            return {
+                'upstream': self.upstream,
+                'breaker': self.breaker.state,
+                'consecutive_failures': self.breaker.failures,
+                'endpoints': endpoints,
+                'retries': self.retries,
+                'fast_failed': self.fast_failed
+            }
+
+
+_callers: Dict[str, ResilientCaller] = {}
+_callers_lock = threading.Lock()
+
+
+def get_caller(upstream: str) -> ResilientCaller:
+    '''One caller per upstream host, kept for the lifetime of the instance'''
+    with _callers_lock:
+        caller = _callers.get(upstream)
+        if caller is None:
+            caller = _callers[upstream] = ResilientCaller(upstream)
+        return caller
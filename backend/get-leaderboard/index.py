@@ -0,0 +1,119 @@
+'''
+Business: Per-game leaderboard from the precomputed game_leaderboards table (one primary key lookup)
+Args: event - dict with httpMethod, queryStringParameters (game_id, scope=all|teacher, teacher_id, period=all|month|week, period_key, limit)
+      POST ?game_id=N&action=rebuild (admin) recomputes the boards of a game from game_results
+      context - object with request_id attribute
+Returns: HTTP response with entries ranked by score, then time_spent
+'''
+import json
+import os
+from typing import Dict, Any
+
+from db_metrics import QueryMetrics, connect
+from db_routing import LSN_HEADER, connect_for_read, route_headers
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from leaderboard import LEADERBOARD_SIZE, PERIODS, PERIOD_KEY_SQL, SCOPES
+from session_tokens import authenticate
+
+SCHEMA = 't_p720035_lineaschool_app'
+
+PREFLIGHT = preflight_response('GET, POST, OPTIONS', f'Content-Type, Authorization, X-Debug-Timing, {LSN_HEADER}')
+
+def json_response(status_code: int, body: Dict[str, Any], cache_seconds: int = 0) -> Dict[str, Any]:
+    headers = {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'}
+    if cache_seconds:
+        headers['Cache-Control'] = f'public, max-age={cache_seconds}'
+    return {
+        'statusCode': status_code,
+        'headers': headers,
+        'isBase64Encoded': False,
+        'body': json.dumps(body, ensure_ascii=False)
+    }
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return PREFLIGHT
+
+    if method not in ('GET', 'POST'):
+        return METHOD_NOT_ALLOWED
+
+    params = event.get('queryStringParameters') or {}
+    try:
+        game_id = int(params.get('game_id', ''))
+        scope_id = int(params.get('teacher_id') or 0)
+        limit = min(int(params.get('limit', LEADERBOARD_SIZE)), LEADERBOARD_SIZE)
+    except ValueError:
+        return json_response(400, {'error': 'game_id is required; game_id, teacher_id and limit must be integers'})
+    if limit < 1:
+        return json_response(400, {'error': 'limit must be at least 1'})
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        return json_response(500, {'error': 'Database URL not configured'})
+
+    if method == 'POST':
+        if params.get('action') != 'rebuild':
+            return json_response(400, {'error': 'Unknown action', 'details': 'Use POST ?action=rebuild'})
+        _, auth_failure = authenticate(event, ('admin',), required=True)
+        if auth_failure:
+            return auth_failure
+        metrics = QueryMetrics('get-leaderboard')
+        conn = connect(database_url, metrics)
+        try:
+            cur = conn.cursor()
+            cur.execute(f'SELECT {SCHEMA}.rebuild_game_leaderboards(%s, %s)', (game_id, LEADERBOARD_SIZE))
+            boards = cur.fetchone()[0]
+            conn.commit()
+            cur.close()
+            return metrics.apply(json_response(200, {'success': True, 'game_id': game_id, 'boards': boards}), event)
+        finally:
+            conn.close()
+
+    scope = params.get('scope', 'all')
+    period = params.get('period', 'all')
+    if scope not in SCOPES or period not in PERIODS:
+        return json_response(400, {'error': 'Invalid scope or period', 'scopes': list(SCOPES), 'periods': list(PERIODS)})
+    if scope == 'teacher' and not scope_id:
+        claims, auth_failure = authenticate(event, ('teacher',))
+        if auth_failure or not claims:
+            return json_response(400, {'error': 'teacher_id is required for scope=teacher'})
+        scope_id = int(claims['sub'])
+    if scope == 'all':
+        scope_id = 0
+
+    metrics = QueryMetrics('get-leaderboard')
+    conn, route = connect_for_read(metrics, event)
+    try:
+        cur = conn.cursor()
+        key_sql = '%s' if params.get('period_key') else PERIOD_KEY_SQL[period]
+        key_params = (params['period_key'],) if params.get('period_key') else ()
+        cur.execute(
+            f'''SELECT {key_sql}, b.entries, b.updated_at
+                FROM (SELECT 1) AS one
+                LEFT JOIN {SCHEMA}.game_leaderboards b
+                  ON b.game_id = %s AND b.scope = %s AND b.scope_id = %s
+                 AND b.period = %s AND b.period_key = {key_sql}''',
+            key_params + (game_id, scope, scope_id, period) + key_params
+        )
+        period_key, entries, updated_at = cur.fetchone()
+        cur.close()
+    finally:
+        conn.close()
+
+    entries = (entries or [])[:limit]
+    for position, entry in enumerate(entries, start=1):
+        entry['position'] = position
+    response = json_response(200, {
+        'success': True,
+        'game_id': game_id,
+        'scope': scope,
+        'scope_id': scope_id,
+        'period': period,
+        'period_key': period_key,
+        'entries': entries,
+        'updated_at': updated_at.isoformat() if updated_at else None
+    }, cache_seconds=5)
+    response['headers'].update(route_headers(route))
+    return metrics.apply(response, event)
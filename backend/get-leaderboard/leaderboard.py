@@ -0,0 +1,119 @@
+'''
+Business: Precomputed per-game leaderboards (table game_leaderboards), merged incrementally on every saved result
+Args: update_leaderboards(cur, game_id, result) inside the transaction that inserted the result
+Returns: number of boards whose top-N changed
+'''
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+LEADERBOARD_SIZE = int(os.environ.get('LEADERBOARD_SIZE', '20'))
+SCOPES = ('all', 'teacher')
+PERIODS = ('all', 'month', 'week')
+# Ключ текущего периода на стороне БД: те же часы, что у completed_at DEFAULT CURRENT_TIMESTAMP
+PERIOD_KEY_SQL = {
+    'all': "'all'",
+    'month': "to_char(CURRENT_DATE, 'YYYY-MM')",
+    'week': "to_char(CURRENT_DATE, 'IYYY-\"W\"IW')"
+}
+
+BoardKey = Tuple[str, int, str, str]
+
+
+def period_key(period: str, at: datetime) -> str:
+    if period == 'month':
+        return at.strftime('%Y-%m')
+    if period == 'week':
+        year, week, _ = at.isocalendar()
+        return f'{year}-W{week:02d}'
+    return 'all'
+
+
+def board_keys(teacher_ids: Sequence[int], at: datetime) -> List[BoardKey]:
+    '''Every board a result lands on: the whole school and each of the student's teachers, for each period'''
+    scopes = [('all', 0)] + [('teacher', teacher_id) for teacher_id in sorted(set(teacher_ids))]
+    return [(scope, scope_id, period, period_key(period, at)) for scope, scope_id in scopes for period in PERIODS]
+
+
+def rank_key(entry: Dict[str, Any]) -> tuple:
+    '''Больше очков, затем меньше время, затем кто раньше; совпадает с ORDER BY в rebuild_game_leaderboards'''
+    time_spent = entry.get('time_spent')
+    return (-entry['score'], time_spent if time_spent is not None else float('inf'), entry['completed_at'])
+
+
+def merge_entry(entries: List[Dict[str, Any]], entry: Dict[str, Any], size: int = LEADERBOARD_SIZE) -> Optional[List[Dict[str, Any]]]:
+    '''
+    One row per student, best result wins. Returns the new top-N, or None when the board does not change
+    '''
+    own = next((e for e in entries if e['student_id'] == entry['student_id']), None)
+    if own is not None and rank_key(own) <= rank_key(entry):
+        return None
+    others = [e for e in entries if e['student_id'] != entry['student_id']]
+    if len(others) >= size and rank_key(entry) >= rank_key(others[size - 1]):
+        return None
+    return sorted(others + [entry], key=rank_key)[:size]
+
+
+def update_leaderboards(cur, game_id: int, result: Dict[str, Any], size: int = LEADERBOARD_SIZE) -> int:
+    '''
+    result: id, student_id, score, max_score, time_spent, completed_at (datetime) of the inserted row.
+    Boards are locked in primary key order, so concurrent saves of one game queue up instead of deadlocking
+    '''
+    cur.execute(
+        '''SELECT u.full_name,
+                  ARRAY(SELECT DISTINCT a.teacher_id FROM t_p720035_lineaschool_app.assignments a
+                        WHERE a.student_id = u.id AND a.teacher_id IS NOT NULL)
+           FROM t_p720035_lineaschool_app.users u WHERE u.id = %s''',
+        (result['student_id'],)
+    )
+    row = cur.fetchone()
+    if not row:
+        return 0
+    student_name, teacher_ids = row
+    completed_at: datetime = result['completed_at']
+    entry = {
+        'result_id': result['id'],
+        'student_id': result['student_id'],
+        'student_name': student_name,
+        'score': result['score'],
+        'max_score': result['max_score'],
+        'time_spent': result.get('time_spent'),
+        'completed_at': completed_at.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+    keys = board_keys(teacher_ids, completed_at)
+    key_columns = [list(column) for column in zip(*keys)]
+    cur.execute(
+        '''INSERT INTO t_p720035_lineaschool_app.game_leaderboards (game_id, scope, scope_id, period, period_key)
+           SELECT %s, * FROM unnest(%s::varchar[], %s::int[], %s::varchar[], %s::varchar[])
+           ON CONFLICT DO NOTHING''',
+        [game_id] + key_columns
+    )
+    cur.execute(
+        '''SELECT scope, scope_id, period, period_key, entries
+           FROM t_p720035_lineaschool_app.game_leaderboards
+           WHERE game_id = %s
+             AND (scope, scope_id, period, period_key) IN (
+                 SELECT * FROM unnest(%s::varchar[], %s::int[], %s::varchar[], %s::varchar[]))
+           ORDER BY scope, scope_id, period, period_key
+           FOR UPDATE''',
+        [game_id] + key_columns
+    )
+
+    changed = []
+    for scope, scope_id, period, key, entries in cur.fetchall():
+        merged = merge_entry(entries, entry, size)
+        if merged is not None:
+            changed.append((scope, scope_id, period, key, json.dumps(merged, ensure_ascii=False)))
+    if changed:
+        cur.execute(
+            '''UPDATE t_p720035_lineaschool_app.game_leaderboards AS b
+               SET entries = c.entries, updated_at = CURRENT_TIMESTAMP
+               FROM unnest(%s::varchar[], %s::int[], %s::varchar[], %s::varchar[], %s::jsonb[])
+                    AS c(scope, scope_id, period, period_key, entries)
+               WHERE b.game_id = %s AND b.scope = c.scope AND b.scope_id = c.scope_id
+                 AND b.period = c.period AND b.period_key = c.period_key''',
+            [list(column) for column in zip(*changed)] + [game_id]
+        )
+    return len(changed)
@@ -0,0 +1,152 @@
+'''
+Business: Per-invocation DB instrumentation for psycopg2 handlers
+Args: connect(dsn, metrics) returns a connection whose cursors record every statement
+Returns: QueryMetrics with statement count, DB time, slowest statements and rows
+'''
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+SLOWEST_KEPT = 5
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_VALUES_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_statement(statement: Any) -> str:
+    '''Collapse literals and multi-row VALUES so equal statements group together'''
+    if isinstance(statement, bytes):
+        statement = statement.decode('utf-8', 'replace')
+    text = _STRING_LITERAL.sub('?', str(statement))
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _VALUES_LIST.sub('(...)', text)
+    return _WHITESPACE.sub(' ', text).strip()[:300]
+
+
+class QueryMetrics:
+    '''Statement statistics collected during one handler invocation; connections of one invocation may share it across threads'''
+
+    def __init__(self, function_name: str = '') -> None:
+        self.function_name = function_name
+        self.statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.slowest: List[Tuple[float, str]] = []
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: Any, duration: float, rows: int) -> None:
+        with self._lock:
+            self._record(statement, duration, rows)
+
+    def _record(self, statement: Any, duration: float, rows: int) -> None:
+        self.statements += 1
+        self.db_time += duration
+        if rows > 0:
+            self.rows += rows
+        if len(self.slowest) < SLOWEST_KEPT or duration > self.slowest[-1][0]:
+            self.slowest.append((duration, normalize_statement(statement)))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'function': self.function_name,
+            'statements': self.statements,
+            'db_ms': round(self.db_time * 1000, 2),
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 2),
+            'rows': self.rows,
+            'slowest': [{'ms': round(duration * 1000, 2), 'sql': sql} for duration, sql in self.slowest]
+        }
+
+    def log(self) -> None:
+        '''One structured line per invocation'''
+        print(json.dumps({'db_metrics': self.summary()}, ensure_ascii=False))
+
+    def server_timing(self) -> str:
+        total_ms = (time.perf_counter() - self.started) * 1000
+        return f'db;dur={self.db_time * 1000:.1f};desc="{self.statements} statements", total;dur={total_ms:.1f}'
+
+    def apply(self, response: Dict[str, Any], event: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        '''Log the summary and attach Server-Timing when requested via DB_SERVER_TIMING or X-Debug-Timing'''
+        self.log()
+        if server_timing_enabled(event):
+            headers = dict(response.get('headers') or {})
+            headers['Server-Timing'] = self.server_timing()
+            # Дополняем список, а не заменяем: X-DB-LSN и заголовки выгрузки должны оставаться видны браузеру
+            exposed = [name.strip() for name in headers.get('Access-Control-Expose-Headers', '').split(',') if name.strip()]
+            if 'server-timing' not in (name.lower() for name in exposed):
+                exposed.append('Server-Timing')
+            headers['Access-Control-Expose-Headers'] = ', '.join(exposed)
+            response['headers'] = headers
+        return response
+
+
+def server_timing_enabled(event: Optional[Dict[str, Any]]) -> bool:
+    if os.environ.get('DB_SERVER_TIMING', '').lower() in ('1', 'true', 'yes'):
+        return True
+    headers = (event or {}).get('headers') or {}
+    return any(key.lower() == 'x-debug-timing' and str(value) == '1' for key, value in headers.items())
+
+
+def _instrumented_connection_class() -> type:
+    '''
+    psycopg2 is imported on the first connect, not at module import: OPTIONS and validation
+    failures on a cold instance return without loading the driver
+    '''
+    global _connection_class
+    if _connection_class is not None:
+        return _connection_class
+
+    import psycopg2.extensions
+
+    class InstrumentedCursor(psycopg2.extensions.cursor):
+        '''Cursor that reports each execute to the QueryMetrics of its connection'''
+
+        def execute(self, query, vars=None):
+            started = time.perf_counter()
+            try:
+                return super().execute(query, vars)
+            finally:
+                self.connection.metrics.record(query, time.perf_counter() - started, self.rowcount)
+
+        def executemany(self, query, vars_list):
+            started = time.perf_counter()
+            try:
+                return super().executemany(query, vars_list)
+            finally:
+                self.connection.metrics.record(query, time.perf_counter() - started, self.rowcount)
+
+        def copy_expert(self, sql, file, size=8192):
+            started = time.perf_counter()
+            try:
+                return super().copy_expert(sql, file, size)
+            finally:
+                self.connection.metrics.record(sql, time.perf_counter() - started, self.rowcount)
+
+    class InstrumentedConnection(psycopg2.extensions.connection):
+        metrics: QueryMetrics
+
+        def cursor(self, *args, **kwargs):
+            kwargs.setdefault('cursor_factory', InstrumentedCursor)
+            return super().cursor(*args, **kwargs)
+
+    _connection_class = InstrumentedConnection
+    return _connection_class
+
+
+_connection_class: Optional[type] = None
+
+
+def connect(dsn: str, metrics: QueryMetrics, **kwargs: Any) -> Any:
+    '''psycopg2.connect whose cursors report into metrics; kwargs go to psycopg2.connect (e.g. connect_timeout)'''
+    import psycopg2
+
+    conn = psycopg2.connect(dsn, connection_factory=_instrumented_connection_class(), **kwargs)
+    conn.metrics = metrics
+    return conn
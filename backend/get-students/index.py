@@ -1,31 +1,240 @@
 """
 Business: Получение списка учеников, педагогов и назначений из базы данных
-Args: event - dict с httpMethod
+Args: event - dict с httpMethod, queryStringParameters
+      (mode=calendar&from=YYYY-MM-DD&to=YYYY-MM-DD[&student_id][&teacher_id][&include=details],
+       mode=search&q=...[&role=student|teacher][&limit], render=db)
       context - объект с request_id
-Returns: JSON со списками students, teachers, assignments
+Returns: JSON со списками students, teachers, assignments; в режиме calendar - назначения по дням,
+         в режиме search - до limit лучших совпадений по ФИО (с опечатками) или началу телефона;
+         render=db - тот же JSON, но собранный в Postgres
 """
 
 import json
 import os
-from typing import Dict, Any
-import psycopg2
+import re
+from datetime import date
+from typing import Dict, Any, Optional
+
+from db_metrics import QueryMetrics
+from db_routing import LSN_HEADER, connect_for_read, route_headers
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from session_tokens import authenticate
+
+# Месяц календаря с захватом соседних недель; больше за один запрос не отдаём
+CALENDAR_MAX_DAYS = 93
+SEARCH_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+# Порог word_similarity: 0.6 по умолчанию в pg_trgm не прощает опечатку в короткой фамилии
+SEARCH_SIMILARITY = os.environ.get('SEARCH_SIMILARITY', '0.4')
+PHONE_QUERY = re.compile(r'^[\d\s()+-]+$')
+
+PREFLIGHT = preflight_response('GET, OPTIONS', f'Content-Type, Authorization, X-Debug-Timing, {LSN_HEADER}')
+
+def calendar_response(cur, params: Dict[str, str], claims: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    '''
+    mode=calendar: assignments with due_date in [from, to], grouped by day.
+    Only columns of the covering (student_id|teacher_id, due_date) indexes are read, so the
+    query is an index-only scan; include=details adds description and answer from the heap
+    '''
+    try:
+        date_from = date.fromisoformat(params.get('from', ''))
+        date_to = date.fromisoformat(params.get('to', ''))
+        student_id = int(params['student_id']) if params.get('student_id') else None
+        teacher_id = int(params['teacher_id']) if params.get('teacher_id') else None
+    except ValueError:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'from and to must be YYYY-MM-DD dates; student_id and teacher_id must be integers'})
+        }
+    if date_to < date_from or (date_to - date_from).days >= CALENDAR_MAX_DAYS:
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'to must be on or after from and the range at most {CALENDAR_MAX_DAYS} days'})
+        }
+    # Педагог без явного фильтра видит свои занятия
+    if student_id is None and teacher_id is None and claims and claims.get('role') == 'teacher':
+        teacher_id = int(claims['sub'])
+
+    with_details = params.get('include') == 'details'
+    conditions = ['a.due_date BETWEEN %s AND %s']
+    query_params: list = [date_from, date_to]
+    if student_id is not None:
+        conditions.append('a.student_id = %s')
+        query_params.append(student_id)
+    if teacher_id is not None:
+        conditions.append('a.teacher_id = %s')
+        query_params.append(teacher_id)
+
+    query = f'''SELECT a.due_date, a.id, a.student_id, a.teacher_id, a.title, a.subject, a.type,
+                       a.lesson_type, a.completed, a.due_time, a.status
+                       {', a.description, a.answer' if with_details else ''}
+                FROM t_p720035_lineaschool_app.assignments a
+                WHERE {' AND '.join(conditions)}
+                ORDER BY a.due_date, a.due_time NULLS LAST, a.id'''
+    cur.execute(query, query_params)
+
+    days: Dict[str, list] = {}
+    total = 0
+    for row in cur.fetchall():
+        assignment = {
+            'id': str(row[1]),
+            'studentId': str(row[2]),
+            'teacherId': str(row[3]) if row[3] is not None else None,
+            'title': row[4],
+            'subject': row[5],
+            'date': row[0].isoformat(),
+            'type': row[6],
+            'lessonType': row[7],
+            'completed': row[8],
+            'dueTime': row[9],
+            'status': row[10] or 'scheduled'
+        }
+        if with_details:
+            assignment['description'] = row[11]
+            assignment['answer'] = row[12]
+        days.setdefault(row[0].isoformat(), []).append(assignment)
+        total += 1
+
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps({
+            'from': date_from.isoformat(),
+            'to': date_to.isoformat(),
+            'total': total,
+            'days': days
+        }, ensure_ascii=False)
+    }
+
+def normalize_phone_prefix(query: str) -> str:
+    '''Same normalization as users.phone_digits, applied to the typed beginning of a number'''
+    digits = re.sub(r'\D', '', query)
+    if digits.startswith('8'):
+        return '7' + digits[1:]
+    if digits.startswith('9'):
+        return '7' + digits
+    return digits
+
+def search_response(cur, params: Dict[str, str]) -> Dict[str, Any]:
+    '''
+    mode=search: ranked top-k people. Digits search phone_digits by prefix (btree text_pattern_ops),
+    anything else is a typo-tolerant word_similarity match on search_name (GIN pg_trgm)
+    '''
+    query = (params.get('q') or '').strip()
+    role = params.get('role')
+    try:
+        limit = min(int(params.get('limit') or SEARCH_LIMIT), SEARCH_MAX_LIMIT)
+    except ValueError:
+        limit = 0
+    if len(query) < 2 or limit < 1 or role not in (None, 'student', 'teacher'):
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'q must have at least 2 characters, limit must be positive, role student or teacher'})
+        }
+    roles = [role] if role else ['student', 'teacher']
+
+    digits = normalize_phone_prefix(query) if PHONE_QUERY.match(query) else ''
+    if len(digits) >= 3:
+        match = 'phone'
+        cur.execute(
+            '''SELECT id, login, full_name, role, phone, 1.0
+               FROM t_p720035_lineaschool_app.users
+               WHERE phone_digits LIKE %s AND role = ANY(%s)
+               ORDER BY phone_digits
+               LIMIT %s''',
+            (digits + '%', roles, limit)
+        )
+    else:
+        match = 'name'
+        name = query.lower().replace('ё', 'е')
+        cur.execute("SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)", (SEARCH_SIMILARITY,))
+        cur.execute(
+            '''SELECT id, login, full_name, role, phone, word_similarity(%s, search_name) AS score
+               FROM t_p720035_lineaschool_app.users
+               WHERE %s <%% search_name AND role = ANY(%s)
+               ORDER BY score DESC, full_name
+               LIMIT %s''',
+            (name, name, roles, limit)
+        )
+
+    results = [
+        {
+            'id': str(row[0]),
+            'login': row[1],
+            'fullName': row[2],
+            'role': row[3],
+            'phone': row[4] or '',
+            'score': round(float(row[5]), 3)
+        }
+        for row in cur.fetchall()
+    ]
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps({'query': query, 'match': match, 'results': results}, ensure_ascii=False)
+    }
+
+def db_rendered_response(cur) -> Dict[str, Any]:
+    '''
+    render=db: the same students/teachers/assignments document as the default mode, built by
+    json_build_object/json_agg in one statement. Python receives a single text value and passes
+    it through as the body instead of building a dict per row and serializing it again
+    '''
+    cur.execute(
+        '''SELECT json_build_object(
+               'students', COALESCE((
+                   SELECT json_agg(json_build_object(
+                       'id', u.id::text, 'login', u.login, 'fullName', u.full_name, 'role', u.role,
+                       'phone', COALESCE(u.phone, ''), 'teacherId', '', 'balance', 0,
+                       'lessonsAttended', COALESCE(u.lessons_attended, 0),
+                       'lessonsMissed', COALESCE(u.lessons_missed, 0),
+                       'lessonsPaid', COALESCE(u.lessons_paid, 0)
+                   ) ORDER BY u.full_name)
+                   FROM t_p720035_lineaschool_app.users u
+                   WHERE u.role = 'student'
+               ), '[]'::json),
+               'teachers', COALESCE((
+                   SELECT json_agg(json_build_object(
+                       'id', u.id::text, 'login', u.login, 'fullName', u.full_name, 'role', u.role,
+                       'phone', COALESCE(u.phone, '')
+                   ) ORDER BY u.full_name)
+                   FROM t_p720035_lineaschool_app.users u
+                   WHERE u.role = 'teacher'
+               ), '[]'::json),
+               'assignments', COALESCE((
+                   SELECT json_agg(json_build_object(
+                       'id', a.id::text, 'studentId', a.student_id::text, 'title', a.title, 'subject', a.subject,
+                       'date', to_char(a.due_date, 'YYYY-MM-DD'), 'type', a.type, 'lessonType', a.lesson_type,
+                       'completed', a.completed, 'dueTime', a.due_time, 'description', a.description,
+                       'answer', a.answer, 'createdBy', 'admin', 'status', COALESCE(a.status, 'scheduled')
+                   ) ORDER BY a.due_date DESC)
+                   FROM t_p720035_lineaschool_app.assignments a
+               ), '[]'::json)
+           )::text'''
+    )
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': cur.fetchone()[0]
+    }
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
+        return PREFLIGHT
     
     if method == 'GET':
+        claims, auth_failure = authenticate(event, ('admin', 'teacher'))
+        if auth_failure:
+            return auth_failure
+        
         database_url = os.environ.get('DATABASE_URL')
         
         if not database_url:
@@ -35,9 +244,29 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'body': json.dumps({'error': 'Database URL not configured'})
             }
         
-        conn = psycopg2.connect(database_url)
+        metrics = QueryMetrics('get-students')
+        # Только чтение: при DATABASE_READ_URL запрос уходит на реплику, если она не отстаёт
+        conn, route = connect_for_read(metrics, event)
         cur = conn.cursor()
-        
+
+        params = event.get('queryStringParameters') or {}
+        if params.get('mode') in ('calendar', 'search'):
+            if params['mode'] == 'calendar':
+                response = calendar_response(cur, params, claims)
+            else:
+                response = search_response(cur, params)
+            cur.close()
+            conn.close()
+            response['headers'] = {**response['headers'], **route_headers(route)}
+            return metrics.apply(response, event)
+
+        if params.get('render') == 'db':
+            response = db_rendered_response(cur)
+            cur.close()
+            conn.close()
+            response['headers'] = {**response['headers'], **route_headers(route)}
+            return metrics.apply(response, event)
+
         # Получение учеников
         query = "SELECT id, login, full_name, role, phone, lessons_attended, lessons_missed, lessons_paid FROM t_p720035_lineaschool_app.users WHERE role = 'student' ORDER BY full_name"
         cur.execute(query)
@@ -100,19 +329,15 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         cur.close()
         conn.close()
         
-        return {
+        return metrics.apply({
             'statusCode': 200,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*', **route_headers(route)},
             'isBase64Encoded': False,
             'body': json.dumps({
                 'students': students,
                 'teachers': teachers,
                 'assignments': assignments
             })
-        }
+        }, event)
     
-    return {
-        'statusCode': 405,
-        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-        'body': json.dumps({'error': 'Method not allowed'})
-    }
\ No newline at end of file
+    return METHOD_NOT_ALLOWED
\ No newline at end of file
@@ -0,0 +1,102 @@
+'''
+Business: Read routing for read-only handler paths: optional replica (DATABASE_READ_URL) with lag and read-your-writes checks
+Args: connect_for_read(metrics, event) opens the replica when it is fresh enough, otherwise the primary (DATABASE_URL);
+      write_position(cur) after a commit returns the primary WAL position the client echoes back in X-DB-LSN
+Returns: (connection, 'replica' | 'primary'); route_headers / lsn_headers build the matching response headers
+'''
+import json
+import os
+import re
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from db_metrics import QueryMetrics, connect
+
+LSN_HEADER = 'X-DB-LSN'
+MAX_LAG_SECONDS = float(os.environ.get('DB_READ_MAX_LAG_SECONDS', '5'))
+# После сбоя или большой задержки реплика пропускается на это время, чтобы не платить за проверку в каждом запросе
+RETRY_SECONDS = float(os.environ.get('DB_READ_RETRY_SECONDS', '15'))
+CONNECT_TIMEOUT = int(os.environ.get('DB_READ_CONNECT_TIMEOUT', '2'))
+
+_LSN = re.compile(r'^[0-9A-Fa-f]{1,8}/[0-9A-Fa-f]{1,8}$')
+
+# Один запрос: задержка воспроизведения в секундах и доиграла ли реплика последнюю запись клиента.
+# Реплика, воспроизведшая всё полученное, не отстаёт, каким бы старым ни был её последний коммит;
+# адрес чтения без recovery (например, пулер перед primary) сравнивается по текущей позиции WAL
+FRESHNESS_SQL = '''
+    SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+           END::float,
+           %(lsn)s::pg_lsn IS NULL
+           OR %(lsn)s::pg_lsn <= CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn() ELSE pg_current_wal_lsn() END
+'''
+
+_replica_skipped_until = 0.0
+
+
+def requested_lsn(event: Optional[Dict[str, Any]]) -> Optional[str]:
+    '''WAL position of the client's own last write (X-DB-LSN), if it sent a valid one'''
+    headers = (event or {}).get('headers') or {}
+    for key, value in headers.items():
+        if key.lower() == LSN_HEADER.lower() and _LSN.match(str(value).strip()):
+            return str(value).strip()
+    return None
+
+
+def log_fallback(reason: str, **details: Any) -> None:
+    print(json.dumps({'db_routing': {'route': 'primary', 'reason': reason, **details}}, ensure_ascii=False))
+
+
+def connect_for_read(metrics: QueryMetrics, event: Optional[Dict[str, Any]] = None) -> Tuple[Any, str]:
+    '''
+    Connection for a read-only path. The replica is used when DATABASE_READ_URL is set, it answers
+    within DB_READ_CONNECT_TIMEOUT, lags at most DB_READ_MAX_LAG_SECONDS and has replayed the
+    X-DB-LSN of the request; otherwise the request falls back to the primary
+    '''
+    global _replica_skipped_until
+    primary_url = os.environ['DATABASE_URL']
+    read_url = os.environ.get('DATABASE_READ_URL')
+    if not read_url or time.monotonic() < _replica_skipped_until:
+        return connect(primary_url, metrics), 'primary'
+
+    min_lsn = requested_lsn(event)
+    conn = None
+    try:
+        conn = connect(read_url, metrics, connect_timeout=CONNECT_TIMEOUT)
+        # Проверка свежести в том же try: реплика может принять соединение и упасть на запросе
+        cur = conn.cursor()
+        cur.execute(FRESHNESS_SQL, {'lsn': min_lsn})
+        lag_seconds, caught_up = cur.fetchone()
+        cur.close()
+    except Exception as e:
+        if conn is not None:
+            conn.close()
+        _replica_skipped_until = time.monotonic() + RETRY_SECONDS
+        log_fallback('replica unavailable', error=str(e).strip()[:200])
+        return connect(primary_url, metrics), 'primary'
+
+    if lag_seconds > MAX_LAG_SECONDS:
+        conn.close()
+        _replica_skipped_until = time.monotonic() + RETRY_SECONDS
+        log_fallback('replica lag', lag_seconds=round(lag_seconds, 2))
+        return connect(primary_url, metrics), 'primary'
+    if not caught_up:
+        # Реплика исправна, просто ещё не доиграла запись этого пользователя: только этот запрос идёт на primary
+        conn.close()
+        log_fallback('read-your-writes', lsn=min_lsn)
+        return connect(primary_url, metrics), 'primary'
+    return conn, 'replica'
+
+
+def write_position(cur) -> str:
+    '''Primary WAL position after the caller's commit: reads that send it back see that write'''
+    cur.execute('SELECT pg_current_wal_lsn()::text')
+    return cur.fetchone()[0]
+
+
+def lsn_headers(lsn: str) -> Dict[str, str]:
+    return {LSN_HEADER: lsn, 'Access-Control-Expose-Headers': LSN_HEADER}
+
+
+def route_headers(route: str) -> Dict[str, str]:
+    return {'X-DB-Route': route}
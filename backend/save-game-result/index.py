@@ -1,36 +1,28 @@
 """
 Business: Save student game result to database
 Args: event with httpMethod, body (game_id, student_id, score, max_score, time_spent, details)
-Returns: HTTP response with result_id
+Returns: HTTP response with result_id and leaderboards_updated (boards whose top-N changed)
 """
 
 import json
 import os
 from typing import Dict, Any
-import psycopg2
-from psycopg2.extras import Json
+
+from db_metrics import QueryMetrics, connect
+from db_routing import lsn_headers, write_position
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from leaderboard import update_leaderboards
+
+PREFLIGHT = preflight_response('POST, OPTIONS', 'Content-Type, X-User-Id, X-Debug-Timing')
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, X-User-Id',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
+        return PREFLIGHT
     
     if method != 'POST':
-        return {
-            'statusCode': 405,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-            'body': json.dumps({'error': 'Method not allowed'})
-        }
+        return METHOD_NOT_ALLOWED
     
     try:
         body_data = json.loads(event.get('body', '{}'))
@@ -49,6 +41,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'body': json.dumps({'error': 'game_id, student_id, score, and max_score are required'})
             }
         
+        # bool - подкласс int, но true/false в счёте - ошибка клиента
+        if not all(isinstance(value, int) and not isinstance(value, bool) and value >= 0 for value in (score, max_score, time_spent)):
+            return {
+                'statusCode': 400,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'score, max_score and time_spent must be non-negative integers'})
+            }
+        
         dsn = os.environ.get('DATABASE_URL')
         if not dsn:
             return {
@@ -57,14 +57,18 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'body': json.dumps({'error': 'Database connection not configured'})
             }
         
-        conn = psycopg2.connect(dsn)
+        # Драйвер загружается только после валидации запроса
+        from psycopg2.extras import Json
+
+        metrics = QueryMetrics('save-game-result')
+        conn = connect(dsn, metrics)
         cur = conn.cursor()
         
         insert_query = """
             INSERT INTO t_p720035_lineaschool_app.game_results 
             (game_id, student_id, score, max_score, time_spent, details)
             VALUES (%s, %s, %s, %s, %s, %s)
-            RETURNING id
+            RETURNING id, completed_at
         """
         
         cur.execute(insert_query, (
@@ -76,34 +80,46 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             Json(details)
         ))
         
-        result_id = cur.fetchone()[0]
+        result_id, completed_at = cur.fetchone()
         
+        # Инкрементальный средний балл: без агрегата по всей истории результатов игры
+        score_percent = float(score) / float(max_score) * 100 if max_score else 0.0
         update_query = """
             UPDATE t_p720035_lineaschool_app.games
-            SET plays_count = plays_count + 1,
-                average_score = (
-                    SELECT AVG(CAST(score AS DECIMAL) / max_score * 100)
-                    FROM t_p720035_lineaschool_app.game_results
-                    WHERE game_id = %s
-                )
+            SET plays_count = COALESCE(plays_count, 0) + 1,
+                score_percent_sum = score_percent_sum + %s::numeric,
+                average_score = ROUND((score_percent_sum + %s::numeric) / (COALESCE(plays_count, 0) + 1), 2)
             WHERE id = %s
         """
         
-        cur.execute(update_query, (game_id, game_id))
+        cur.execute(update_query, (score_percent, score_percent, game_id))
+        
+        # Таблицы лидеров обновляются в той же транзакции, что и результат
+        leaderboards_updated = update_leaderboards(cur, game_id, {
+            'id': result_id,
+            'student_id': student_id,
+            'score': score,
+            'max_score': max_score,
+            'time_spent': time_spent,
+            'completed_at': completed_at
+        })
         conn.commit()
         
+        # Позиция WAL после коммита: чтения с этим X-DB-LSN увидят запись даже на реплике
+        lsn = write_position(cur)
         cur.close()
         conn.close()
         
-        return {
+        return metrics.apply({
             'statusCode': 200,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*', **lsn_headers(lsn)},
             'body': json.dumps({
                 'success': True,
                 'result_id': result_id,
+                'leaderboards_updated': leaderboards_updated,
                 'message': 'Result saved successfully'
             })
-        }
+        }, event)
         
     except json.JSONDecodeError:
         return {
@@ -0,0 +1,36 @@
+'''
+Business: Shared cold-start friendly response building for the handlers
+Args: preflight_response(methods, headers) and method_not_allowed() are built once at import time
+Returns: ready-made response dicts for OPTIONS and 405
+'''
+import json
+from typing import Any, Dict
+
+# Готовые ответы возвращаются как есть, без копирования: вызывающий код не должен их изменять
+JSON_HEADERS = {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'}
+
+
+def preflight_response(methods: str, headers: str = 'Content-Type, X-Debug-Timing', max_age: int = 86400) -> Dict[str, Any]:
+    '''The OPTIONS answer of one function; build it at module level and return it unchanged'''
+    return {
+        'statusCode': 200,
+        'headers': {
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': methods,
+            'Access-Control-Allow-Headers': headers,
+            'Access-Control-Max-Age': str(max_age)
+        },
+        'body': ''
+    }
+
+
+def method_not_allowed() -> Dict[str, Any]:
+    return {
+        'statusCode': 405,
+        'headers': JSON_HEADERS,
+        'body': json.dumps({'error': 'Method not allowed'})
+    }
+
+
+METHOD_NOT_ALLOWED = method_not_allowed()
+
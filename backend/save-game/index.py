@@ -1,46 +1,174 @@
 """
-Business: Save game configuration to database
+Business: Save game configuration to database, one game or a batch
 Args: event with httpMethod, body (game_type, title, description, difficulty, config, created_by)
-Returns: HTTP response with created game_id
+      or batch body {games: [...], template: {...}, template_id}: each item overrides the template
+      (an existing game when template_id is given), config is merged key by key
+Returns: HTTP response with created game_id; for a batch created [{index, game_id}] and errors [{index, error}]
 """
 
 import json
 import os
-from typing import Dict, Any
-import psycopg2
-from psycopg2.extras import Json
+from typing import Dict, Any, List, Optional, Tuple
+
+from db_metrics import QueryMetrics, connect
+from db_routing import lsn_headers, write_position
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from session_tokens import authenticate
+
+PREFLIGHT = preflight_response('POST, OPTIONS', 'Content-Type, Authorization, X-User-Id, X-Debug-Timing')
+
+BATCH_MAX_GAMES = 200
+GAME_FIELDS = ('title', 'description', 'game_type', 'difficulty', 'target_age_min', 'target_age_max', 'image_url', 'config')
+# Ограничения длины колонок games: ошибка одной игры не должна откатывать весь пакет
+MAX_LENGTHS = {'title': 255, 'game_type': 50, 'difficulty': 20}
+TEXT_FIELDS = ('description', 'image_url')
+
+def json_response(status_code: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*', **(headers or {})},
+        'body': json.dumps(body, ensure_ascii=False)
+    }
+
+def is_int(value: Any) -> bool:
+    '''JSON integer; bool is a subclass of int but true/false is not an id or an age'''
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def merge_game(template: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    game = {**template, **item}
+    if isinstance(template.get('config'), dict) and isinstance(item.get('config'), dict):
+        game['config'] = {**template['config'], **item['config']}
+    return game
+
+def validate_game(game: Dict[str, Any]) -> Tuple[Optional[tuple], Optional[str]]:
+    '''Returns: (row in GAME_FIELDS order, None) or (None, error) for one game of a batch'''
+    if not game.get('game_type') or not game.get('title'):
+        return None, 'game_type and title are required'
+    for field, limit in MAX_LENGTHS.items():
+        value = game.get(field)
+        if value is not None and (not isinstance(value, str) or len(value) > limit):
+            return None, f'{field} must be a string of at most {limit} characters'
+    if any(game.get(field) is not None and not isinstance(game.get(field), str) for field in TEXT_FIELDS):
+        return None, 'description and image_url must be strings'
+    ages = (game.get('target_age_min'), game.get('target_age_max'))
+    if any(age is not None and not is_int(age) for age in ages):
+        return None, 'target_age_min and target_age_max must be integers'
+    if None not in ages and ages[0] > ages[1]:
+        return None, 'target_age_min must not exceed target_age_max'
+    config = game.get('config', {})
+    if not isinstance(config, dict):
+        return None, 'config must be an object'
+    return (
+        game['title'], game.get('description', ''), game['game_type'], game.get('difficulty') or 'medium',
+        ages[0], ages[1], game.get('image_url'), json.dumps(config, ensure_ascii=False)
+    ), None
+
+def batch_response(body_data: Dict[str, Any], claims: Optional[Dict[str, Any]], dsn: str, event: Dict[str, Any]) -> Dict[str, Any]:
+    '''
+    games: [...] in one request and one transaction. Items are validated separately and invalid ones
+    are reported without aborting the batch; valid ones go in one multi-row INSERT over unnest arrays.
+    Ids are taken from the sequence next to each item's position, so every id maps back to its item
+    '''
+    items = body_data['games']
+    template = body_data.get('template') or {}
+    if not isinstance(items, list) or not items or len(items) > BATCH_MAX_GAMES or not isinstance(template, dict):
+        return json_response(400, {'error': f'games must contain 1..{BATCH_MAX_GAMES} items, template must be an object'})
+    created_by = claims['sub'] if claims else body_data.get('created_by')
+    if created_by is not None and not is_int(created_by):
+        return json_response(400, {'error': 'created_by must be an integer'})
+    if body_data.get('template_id') is not None and not is_int(body_data['template_id']):
+        return json_response(400, {'error': 'template_id must be an integer'})
+
+    metrics = QueryMetrics('save-game')
+    conn = connect(dsn, metrics)
+    try:
+        cur = conn.cursor()
+        if body_data.get('template_id') is not None:
+            cur.execute(
+                f'''SELECT {', '.join(GAME_FIELDS)} FROM t_p720035_lineaschool_app.games WHERE id = %s''',
+                (body_data['template_id'],)
+            )
+            source = cur.fetchone()
+            if source is None:
+                return json_response(404, {'error': 'Template game not found'})
+            template = merge_game(dict(zip(GAME_FIELDS, source)), template)
+
+        rows: List[tuple] = []
+        positions: List[int] = []
+        errors: List[Dict[str, Any]] = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({'index': index, 'error': 'each game must be an object'})
+                continue
+            row, error = validate_game(merge_game(template, item))
+            if error:
+                errors.append({'index': index, 'error': error})
+                continue
+            rows.append(row)
+            positions.append(index)
+
+        if not rows:
+            return json_response(400, {'success': False, 'created': [], 'errors': errors})
+
+        columns = [list(column) for column in zip(*rows)]
+        cur.execute(
+            f'''WITH input AS (
+                   SELECT nextval('t_p720035_lineaschool_app.games_id_seq') AS id, v.*
+                   FROM unnest(%s::varchar[], %s::text[], %s::varchar[], %s::varchar[], %s::int[], %s::int[],
+                               %s::text[], %s::jsonb[]) WITH ORDINALITY
+                        AS v({', '.join(GAME_FIELDS)}, position)
+               ), inserted AS (
+                   INSERT INTO t_p720035_lineaschool_app.games (id, {', '.join(GAME_FIELDS)}, created_by)
+                   SELECT id, {', '.join(GAME_FIELDS)}, %s FROM input
+                   RETURNING id
+               )
+               SELECT input.position, inserted.id
+               FROM inserted JOIN input USING (id)
+               ORDER BY input.position''',
+            columns + [created_by]
+        )
+        created = [{'index': positions[position - 1], 'game_id': game_id} for position, game_id in cur.fetchall()]
+        conn.commit()
+        lsn = write_position(cur)
+        cur.close()
+    finally:
+        conn.close()
+
+    return metrics.apply(json_response(200, {
+        'success': True,
+        'created': created,
+        'errors': errors,
+        'game_ids': [entry['game_id'] for entry in created]
+    }, lsn_headers(lsn)), event)
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, X-User-Id',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
+        return PREFLIGHT
     
     if method != 'POST':
-        return {
-            'statusCode': 405,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-            'body': json.dumps({'error': 'Method not allowed'})
-        }
+        return METHOD_NOT_ALLOWED
+    
+    claims, auth_failure = authenticate(event, ('admin', 'teacher'))
+    if auth_failure:
+        return auth_failure
     
     try:
         body_data = json.loads(event.get('body', '{}'))
         
+        if 'games' in body_data:
+            dsn = os.environ.get('DATABASE_URL')
+            if not dsn:
+                return json_response(500, {'error': 'Database connection not configured'})
+            return batch_response(body_data, claims, dsn, event)
+        
         game_type = body_data.get('game_type')
         title = body_data.get('title')
         description = body_data.get('description', '')
         difficulty = body_data.get('difficulty', 'medium')
         config = body_data.get('config', {})
-        created_by = body_data.get('created_by')
+        created_by = claims['sub'] if claims else body_data.get('created_by')
         image_url = body_data.get('image_url')
         target_age_min = body_data.get('target_age_min')
         target_age_max = body_data.get('target_age_max')
@@ -51,6 +179,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
                 'body': json.dumps({'error': 'game_type and title are required'})
             }
+        if created_by is not None and not is_int(created_by):
+            return json_response(400, {'error': 'created_by must be an integer'})
         
         dsn = os.environ.get('DATABASE_URL')
         if not dsn:
@@ -60,7 +190,11 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'body': json.dumps({'error': 'Database connection not configured'})
             }
         
-        conn = psycopg2.connect(dsn)
+        # Драйвер загружается только после валидации запроса
+        from psycopg2.extras import Json
+
+        metrics = QueryMetrics('save-game')
+        conn = connect(dsn, metrics)
         cur = conn.cursor()
         
         query = """
@@ -85,18 +219,20 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         game_id = cur.fetchone()[0]
         conn.commit()
         
+        # Позиция WAL после коммита: чтения с этим X-DB-LSN увидят запись даже на реплике
+        lsn = write_position(cur)
         cur.close()
         conn.close()
         
-        return {
+        return metrics.apply({
             'statusCode': 200,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*', **lsn_headers(lsn)},
             'body': json.dumps({
                 'success': True,
                 'game_id': game_id,
                 'message': 'Game saved successfully'
             })
-        }
+        }, event)
         
     except json.JSONDecodeError:
         return {
@@ -1,166 +1,105 @@
 '''
 Business: Sync students from AlfaCRM to database
-Args: event - dict with httpMethod
+Args: event - dict with httpMethod, queryStringParameters (branches=1,2 | all)
       context - object with request_id attribute
 Returns: HTTP response with sync results
 '''
 import json
 import os
-from typing import Dict, Any, Optional, List
-from urllib.request import Request, urlopen
-import psycopg2
+from typing import Dict, Any
 
-def get_auth_token(domain: str, email: str, api_key: str) -> str:
-    '''Get AlfaCRM auth token'''
-    url = f'https://{domain}/v2api/auth/login'
-    headers = {'Content-Type': 'application/json'}
-    auth_data = json.dumps({'email': email, 'api_key': api_key}).encode('utf-8')
-    req = Request(url, data=auth_data, headers=headers, method='POST')
-    with urlopen(req, timeout=10) as response:
-        data = json.loads(response.read().decode('utf-8'))
-    return data.get('token', '')
+from alfacrm_client import AlfaCRMClient
+from db_metrics import QueryMetrics, connect
+from db_routing import lsn_headers, write_position
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+from session_tokens import authenticate
+from sync_engine import EntityStats, SyncEngine, config_from_env, resolve_branch_ids, run_parallel
 
-def fetch_students(domain: str, branch_id: int, auth_token: str) -> List[Dict[str, Any]]:
-    '''Fetch all students from AlfaCRM'''
-    url = f'https://{domain}/v2api/customer/index'
-    headers = {'X-ALFACRM-TOKEN': auth_token, 'Content-Type': 'application/json'}
-    request_data = json.dumps({
-        'branch_id': branch_id, 
-        'page': 0, 
-        'count': 1000,
-        'is_study': 1
-    }).encode('utf-8')
-    req = Request(url, data=request_data, headers=headers, method='POST')
-    with urlopen(req, timeout=15) as response:
-        data = json.loads(response.read().decode('utf-8'))
-        print(f'📄 Ответ API: total={data.get("total", 0)}, items={len(data.get("items", []))}')
-    return data.get('items', [])
+PREFLIGHT = preflight_response('POST, OPTIONS', 'Content-Type, Authorization, X-Debug-Timing')
 
-def normalize_phone(phone: str) -> str:
-    '''Normalize phone number to digits only'''
-    if not phone:
-        return ''
-    return ''.join(filter(str.isdigit, phone))
+def current_write_position(database_url: str, metrics: QueryMetrics) -> Dict[str, str]:
+    '''X-DB-LSN after the branch connections committed: reads that send it back see the synced students'''
+    conn = connect(database_url, metrics)
+    try:
+        cur = conn.cursor()
+        return lsn_headers(write_position(cur))
+    finally:
+        conn.close()
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
-    
+
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
-    
+        return PREFLIGHT
+
     if method != 'POST':
-        return {
-            'statusCode': 405,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-            'body': json.dumps({'error': 'Method not allowed'})
-        }
-    
-    # Get credentials
-    api_key = os.environ.get('ALFACRM_API_KEY')
-    branch_id = os.environ.get('ALFACRM_BRANCH_ID')
-    domain = os.environ.get('ALFACRM_DOMAIN')
-    email = os.environ.get('ALFACRM_EMAIL')
-    db_dsn = os.environ.get('DATABASE_URL')
-    
-    if not all([api_key, branch_id, domain, email, db_dsn]):
+        return METHOD_NOT_ALLOWED
+
+    _, auth_failure = authenticate(event, ('admin',), required=True)
+    if auth_failure:
+        return auth_failure
+
+    config = config_from_env(os.environ)
+    if not config:
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
             'body': json.dumps({'error': 'Missing configuration'})
         }
-    
-    conn = None
+
     try:
-        # Get auth token and fetch students
-        print(f'🔑 Авторизация в AlfaCRM: {domain}, email: {email}')
-        auth_token = get_auth_token(domain, email, api_key)
-        print(f'✅ Получен токен: {auth_token[:20]}...')
-        
-        print(f'📥 Запрос учеников для филиала {branch_id}')
-        students = fetch_students(domain, int(branch_id), auth_token)
-        print(f'📊 Получено учеников из AlfaCRM: {len(students)}')
-        
-        if students:
-            print(f'🔍 Пример данных первого ученика: {json.dumps(students[0], ensure_ascii=False)[:500]}')
-        
-        # Connect to database (use simple query protocol only)
-        conn = psycopg2.connect(db_dsn)
-        cur = conn.cursor()
-        
-        synced = 0
-        skipped = 0
-        errors = []
-        
-        for student in students:
-            phone_data = student.get('phone', [])
-            phone_list = phone_data if isinstance(phone_data, list) else [phone_data]
-            phone = normalize_phone(phone_list[0] if phone_list else '')
-            name = student.get('name', '').replace("'", "''")
-            student_id = str(student.get('id', '')).replace("'", "''")
-            
-            lessons_attended = int(student.get('attended_count', 0))
-            lessons_missed = int(student.get('missed_count', 0))
-            lessons_paid = int(student.get('paid_count', 0))
-            
-            if not name:
-                skipped += 1
-                errors.append(f"Пропущен ученик без имени (ID: {student_id})")
-                continue
-            
-            if not phone:
-                phone = f'nophone_{student_id}'
-            
-            try:
-                # Check if student exists (simple query)
-                query = f"SELECT id FROM t_p720035_lineaschool_app.users WHERE phone = '{phone}'"
-                cur.execute(query)
-                existing = cur.fetchone()
-                
-                if existing:
-                    # Update existing student
-                    query = f"""UPDATE t_p720035_lineaschool_app.users 
-                               SET full_name = '{name}', login = 'student_{student_id}',
-                                   lessons_attended = {lessons_attended},
-                                   lessons_missed = {lessons_missed},
-                                   lessons_paid = {lessons_paid}
-                               WHERE phone = '{phone}'"""
-                    cur.execute(query)
-                else:
-                    # Insert new student
-                    query = f"""INSERT INTO t_p720035_lineaschool_app.users 
-                               (login, password, full_name, role, phone, lessons_attended, lessons_missed, lessons_paid) 
-                               VALUES ('student_{student_id}', '{phone}', '{name}', 'student', '{phone}', 
-                                      {lessons_attended}, {lessons_missed}, {lessons_paid})"""
-                    cur.execute(query)
-                synced += 1
-            except Exception as e:
-                errors.append(f"Ученик {name}: {str(e)}")
-                skipped += 1
-        
-        conn.commit()
-        cur.close()
-        
-        return {
+        params = event.get('queryStringParameters') or {}
+        client = AlfaCRMClient(config['domain'], config['email'], config['api_key'])
+        metrics = QueryMetrics('sync-students')
+        try:
+            branch_ids = resolve_branch_ids(client, config, params.get('branches'))
+        except ValueError:
+            return {
+                'statusCode': 400,
+                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'branches must be a comma-separated list of ids or "all"'})
+            }
+        print(f'📥 Синхронизация учеников филиалов {branch_ids} из {config["domain"]}')
+
+        def sync_branch(branch_id: int, conn) -> EntityStats:
+            students = SyncEngine(client, conn, branch_id, ['customers']).run()['customers']
+            conn.commit()
+            return students
+
+        client.login()
+        outcomes = run_parallel(branch_ids, sync_branch, lambda: connect(config['database_url'], metrics))
+        done = [outcome['result'] for outcome in outcomes.values() if outcome['status'] == 'done']
+        failed = {str(branch_id): outcome['error'] for branch_id, outcome in outcomes.items() if outcome['status'] == 'failed'}
+        if failed and not done:
+            raise RuntimeError('; '.join(f'branch {branch_id}: {error}' for branch_id, error in failed.items()))
+
+        added = sum(students.added for students in done)
+        updated = sum(students.updated for students in done)
+        fetched = sum(students.fetched for students in done)
+        print(f'📊 Получено учеников из AlfaCRM: {fetched}')
+
+        return metrics.apply({
             'statusCode': 200,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*',
+                **current_write_position(config['database_url'], metrics)
+            },
             'body': json.dumps({
-                'success': True,
-                'synced': synced,
-                'skipped': skipped,
-                'errors': errors[:10],
-                'total_students': len(students)
+                'success': not failed,
+                'synced': sum(students.added + students.updated + students.unchanged for students in done),
+                'added': added,
+                'updated': updated,
+                'skipped': sum(students.skipped for students in done),
+                'errors': [error for students in done for error in students.errors][:10],
+                'total_students': fetched,
+                'branches': {
+                    str(branch_id): {'status': outcome['status'], 'duration_ms': outcome['duration_ms'], 'error': outcome.get('error')}
+                    for branch_id, outcome in outcomes.items()
+                }
             })
-        }
-    
+        }, event)
+
     except Exception as e:
         error_msg = str(e)
         print(f'❌ Ошибка синхронизации: {error_msg}')
@@ -175,6 +114,3 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'total_students': 0
             })
         }
-    finally:
-        if conn:
-            conn.close()
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+Business: Преобразование страниц AlfaCRM (клиенты, педагоги, занятия) в строки базы
+Args: items - список объектов из AlfaCRM, словари alfacrm id -> id в базе
+Returns: кортежи, готовые для INSERT/UPDATE
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+
+LESSON_STATUS_MAP: Dict[Any, str] = {
+    1: 'scheduled',
+    2: 'attended',
+    3: 'missed'
+}
+
+LESSON_TYPE_MAP: Dict[Any, str] = {
+    1: 'group',
+    2: 'individual_speech',
+    3: 'individual_neuro'
+}
+
+# Порядок колонок в кортежах map_customers / map_teachers
+STUDENT_COLUMNS: Tuple[str, ...] = (
+    'alfacrm_id', 'full_name', 'phone', 'lessons_attended', 'lessons_missed', 'lessons_paid'
+)
+TEACHER_COLUMNS: Tuple[str, ...] = ('alfacrm_id', 'full_name', 'phone')
+
+# Порядок колонок в кортежах map_lessons
+LESSON_COLUMNS: Tuple[str, ...] = (
+    'student_id', 'teacher_id', 'title', 'subject', 'due_date', 'due_time',
+    'type', 'status', 'lesson_type', 'alfacrm_id'
+)
+
+LessonRow = Tuple[int, Optional[int], str, str, str, str, str, str, str, str]
+
+
+def normalize_phone(phone: Any) -> str:
+    '''Digits of the first phone (AlfaCRM returns either a string or a list)'''
+    if isinstance(phone, list):
+        phone = phone[0] if phone else ''
+    if not phone:
+        return ''
+    return ''.join(filter(str.isdigit, str(phone)))
+
+
+def _first_int(item: Dict[str, Any], *keys: str) -> int:
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, ''):
+            return int(float(value))
+    return 0
+
+
+def _full_name(item: Dict[str, Any]) -> str:
+    return f"{item.get('name') or ''} {item.get('last_name') or ''}".strip()
+
+
+def _clock(value: Any) -> str:
+    '''"2026-01-15 10:00:00" and "10:00" both become "10:00"'''
+    text = str(value or '00:00')
+    if ' ' in text:
+        text = text.rsplit(' ', 1)[1]
+    return text[:5]
+
+
+def map_customers(customers: List[Dict[str, Any]]) -> Tuple[List[tuple], List[str]]:
+    '''
+    Rows in STUDENT_COLUMNS order; customers without a name are reported, not synced
+    Returns: (rows, errors)
+    '''
+    rows = []
+    errors = []
+    for customer in customers:
+        alfacrm_id = str(customer.get('id', ''))
+        full_name = _full_name(customer)
+        if not full_name or not alfacrm_id:
+            errors.append(f"Пропущен ученик без имени (ID: {alfacrm_id})")
+            continue
+        rows.append((
+            alfacrm_id,
+            full_name,
+            normalize_phone(customer.get('phone')) or None,
+            _first_int(customer, 'attended_count', 'lesson_count'),
+            _first_int(customer, 'missed_count', 'lesson_not_count'),
+            _first_int(customer, 'paid_count')
+        ))
+    return rows, errors
+
+
+def map_teachers(teachers: List[Dict[str, Any]]) -> Tuple[List[tuple], List[str]]:
+    '''Rows in TEACHER_COLUMNS order'''
+    rows = []
+    errors = []
+    for teacher in teachers:
+        alfacrm_id = str(teacher.get('id', ''))
+        full_name = _full_name(teacher)
+        if not full_name or not alfacrm_id:
+            errors.append(f"Пропущен педагог без имени (ID: {alfacrm_id})")
+            continue
+        rows.append((alfacrm_id, full_name, normalize_phone(teacher.get('phone')) or None))
+    return rows, errors
+
+
+def map_lessons(
+    lessons: List[Dict[str, Any]],
+    student_ids: Dict[str, int],
+    teacher_ids: Dict[str, int],
+    default_date: str
+) -> List[LessonRow]:
+    '''
+    Column-wise mapping of one page of lessons; no DB or clock access inside
+    Args: lessons - items from lesson/index
+          student_ids, teacher_ids - AlfaCRM id (str) -> users.id
+          default_date - YYYY-MM-DD used when lesson_date is absent
+    Returns: rows in LESSON_COLUMNS order; lessons of unknown students are dropped
+    '''
+    status_get = LESSON_STATUS_MAP.get
+    type_get = LESSON_TYPE_MAP.get
+
+    lesson_ids = [str(lesson['id']) for lesson in lessons]
+    students = [student_ids.get(str(lesson.get('customer_id', ''))) for lesson in lessons]
+    teachers = [teacher_ids.get(str(lesson.get('teacher_id', ''))) for lesson in lessons]
+    titles = ['Занятие ' + lesson_id for lesson_id in lesson_ids]
+    subjects = [
+        f"Предмет {subject_id}" if subject_id else 'Урок'
+        for subject_id in (lesson.get('subject_id', '') for lesson in lessons)
+    ]
+    dates = [lesson.get('lesson_date', default_date) for lesson in lessons]
+    times = [_clock(lesson.get('time_from', '00:00')) for lesson in lessons]
+    statuses = [status_get(lesson.get('status_id', 1), 'scheduled') for lesson in lessons]
+    lesson_types = [type_get(lesson.get('lesson_type_id', 1), 'group') for lesson in lessons]
+
+    return [
+        row for row in zip(
+            students, teachers, titles, subjects, dates, times,
+            ['lesson'] * len(lessons), statuses, lesson_types, lesson_ids
+        )
+        if row[0] is not None
+    ]
@@ -0,0 +1,38 @@
+'''
+Business: Salted slow password hashes (PBKDF2-SHA256), checked only at login
+Args: hash_password(password); verify_password(password, stored)
+Returns: "pbkdf2_sha256$<iterations>$<salt>$<hash>" strings; (matches, needs_rehash)
+'''
+import base64
+import hashlib
+import hmac
+import os
+from typing import Tuple
+
+ALGORITHM = 'pbkdf2_sha256'
+ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', '260000'))
+SALT_BYTES = 16
+
+
+def hash_password(password: str, iterations: int = ITERATIONS) -> str:
+    salt = base64.b64encode(os.urandom(SALT_BYTES)).decode('ascii').rstrip('=')
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('ascii'), iterations)
+    return f'{ALGORITHM}${iterations}${salt}${base64.b64encode(digest).decode("ascii")}'
+
+
+def verify_password(password: str, stored: str) -> Tuple[bool, bool]:
+    '''
+    Returns: (matches, needs_rehash). Rows from before hashing hold the plain password:
+    they still match once and are flagged for rehash so the caller can upgrade them
+    '''
+    if not stored:
+        return False, False
+    if not stored.startswith(ALGORITHM + '$'):
+        return hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8')), True
+    try:
+        _, iterations, salt, expected = stored.split('$', 3)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('ascii'), int(iterations))
+    except ValueError:
+        return False, False
+    matches = hmac.compare_digest(base64.b64encode(digest).decode('ascii'), expected)
+    return matches, matches and int(iterations) < ITERATIONS
@@ -0,0 +1,123 @@
+'''
+Business: Stateless signed session tokens (HMAC-SHA256) shared by the handlers
+Args: issue_token(user_id, role) at login; authenticate(event, roles) in every other handler
+Returns: claims {'sub', 'role', 'iat', 'exp'} without any DB round trip
+'''
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+TOKEN_TTL_SECONDS = int(os.environ.get('AUTH_TOKEN_TTL', str(12 * 3600)))
+# Небольшой допуск на расхождение часов между экземплярами функций
+CLOCK_SKEW_SECONDS = 30
+
+
+class TokenError(Exception):
+    pass
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def _secret(secret: Optional[str]) -> bytes:
+    value = secret or os.environ.get('AUTH_TOKEN_SECRET')
+    if not value:
+        raise TokenError('AUTH_TOKEN_SECRET is not configured')
+    return value.encode('utf-8')
+
+
+def _sign(payload: str, secret: bytes) -> str:
+    return _b64encode(hmac.new(secret, payload.encode('ascii'), hashlib.sha256).digest())
+
+
+def issue_token(user_id: int, role: str, secret: Optional[str] = None, ttl: int = TOKEN_TTL_SECONDS) -> Tuple[str, int]:
+    '''
+    Returns: (token "<payload>.<signature>", expiry as unix time)
+    '''
+    now = int(time.time())
+    claims = {'sub': user_id, 'role': role, 'iat': now, 'exp': now + ttl}
+    payload = _b64encode(json.dumps(claims, separators=(',', ':')).encode('utf-8'))
+    return f'{payload}.{_sign(payload, _secret(secret))}', claims['exp']
+
+
+def verify_token(token: str, secret: Optional[str] = None) -> Dict[str, Any]:
+    '''Check signature and expiry; raises TokenError'''
+    payload, _, signature = token.partition('.')
+    if not payload or not signature:
+        raise TokenError('Malformed token')
+    if not hmac.compare_digest(signature, _sign(payload, _secret(secret))):
+        raise TokenError('Invalid token signature')
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        raise TokenError('Malformed token')
+    if int(claims.get('exp', 0)) + CLOCK_SKEW_SECONDS < time.time():
+        raise TokenError('Token expired')
+    return claims
+
+
+def token_from_event(event: Dict[str, Any]) -> Optional[str]:
+    '''Authorization: Bearer <token>, or X-Auth-Token for clients that cannot set Authorization'''
+    for key, value in (event.get('headers') or {}).items():
+        name = key.lower()
+        if name == 'authorization' and value and value[:7].lower() == 'bearer ':
+            return value[7:].strip()
+        if name == 'x-auth-token' and value:
+            return value.strip()
+    return None
+
+
+def authenticate(
+    event: Dict[str, Any],
+    roles: Optional[Sequence[str]] = None,
+    required: bool = False
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    '''
+    Returns: (claims or None, error response or None). A token that is sent must be valid.
+    A missing token is rejected when required is set (admin-only actions always pass it) or when
+    AUTH_REQUIRED is set; otherwise it is let through so the rollout to other callers can be gradual
+    '''
+    token = token_from_event(event)
+    if token is None:
+        if required or os.environ.get('AUTH_REQUIRED', '').lower() in ('1', 'true', 'yes'):
+            return None, auth_error(401, 'Authorization required')
+        return None, None
+    try:
+        claims = verify_token(token)
+    except TokenError as e:
+        return None, auth_error(401, str(e))
+    if roles and claims.get('role') not in roles:
+        return None, auth_error(403, 'Forbidden for role ' + str(claims.get('role')))
+    return claims, None
+
+
+def service_secret_valid(event: Dict[str, Any], header: str, env_name: str) -> bool:
+    '''
+    Machine callers (timers) authenticate with a shared secret header instead of a session token.
+    Fails closed: without the secret in env_name nobody passes
+    '''
+    expected = os.environ.get(env_name)
+    if not expected:
+        return False
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == header.lower() and value:
+            return hmac.compare_digest(str(value).strip().encode('utf-8'), expected.encode('utf-8'))
+    return False
+
+
+def auth_error(status_code: int, message: str) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'isBase64Encoded': False,
+        'body': json.dumps({'success': False, 'error': message})
+    }
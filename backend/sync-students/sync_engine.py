@@ -0,0 +1,477 @@
+'''
+Business: Единый движок синхронизации AlfaCRM -> база (fetch -> map -> diff -> bulk apply)
+Args: SyncEngine(client, conn, branch_id, entities) - сущности из ENTITIES
+Returns: статистика по сущностям: added, updated, unchanged, skipped, errors
+'''
+import os
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+from alfacrm_client import AlfaCRMClient
+from mapping import (
+    STUDENT_COLUMNS, TEACHER_COLUMNS, LESSON_COLUMNS,
+    map_customers, map_teachers, map_lessons
+)
+from passwords import hash_password
+from prepared import columns_of, execute_prepared
+
+SCHEMA = 't_p720035_lineaschool_app'
+MAX_ERRORS_KEPT = 50
+# Сколько филиалов синхронизируется одновременно - во всех вызовах функции вместе
+MAX_CONCURRENCY = int(os.environ.get('SYNC_MAX_CONCURRENCY', '3'))
+SLOT_WAIT_SECONDS = float(os.environ.get('SYNC_SLOT_WAIT_SECONDS', '60'))
+# Начальные пароли хешируются на каждую новую строку: полные ITERATIONS растянули бы первую синхронизацию
+# на минуты, а verify_password помечает более слабый хеш на перехеширование при первом входе
+INITIAL_PASSWORD_ITERATIONS = int(os.environ.get('SYNC_PASSWORD_HASH_ITERATIONS', '10000'))
+# Первый ключ pg_advisory_lock(int, int) для слотов параллельной синхронизации
+_SLOT_NAMESPACE = 7202
+
+# Типы колонок для подготовленных операторов: страница передаётся массивами в unnest($1, $2, ...),
+# поэтому текст запроса не зависит от размера страницы и план строится один раз на соединение
+COLUMN_TYPES: Dict[str, str] = {
+    'id': 'int', 'login': 'varchar', 'password': 'varchar', 'role': 'varchar',
+    'alfacrm_id': 'varchar', 'full_name': 'varchar', 'phone': 'varchar',
+    'lessons_attended': 'int', 'lessons_missed': 'int', 'lessons_paid': 'int',
+    'student_id': 'int', 'teacher_id': 'int', 'title': 'varchar', 'subject': 'varchar',
+    'due_date': 'date', 'due_time': 'varchar', 'type': 'varchar', 'status': 'varchar', 'lesson_type': 'varchar'
+}
+LESSON_VALUE_COLUMNS = ('student_id', 'teacher_id', 'subject', 'due_date', 'due_time', 'status', 'lesson_type')
+
+
+def array_types(columns: Tuple[str, ...]) -> List[str]:
+    return [COLUMN_TYPES[column] + '[]' for column in columns]
+
+
+def placeholders(count: int) -> str:
+    return ', '.join(f'${i}' for i in range(1, count + 1))
+
+
+class EntityStats:
+    def __init__(self) -> None:
+        self.total = 0
+        self.fetched = 0
+        self.added = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.skipped = 0
+        self.pages = 0
+        self.errors: List[str] = []
+
+    def add_errors(self, errors: List[str]) -> None:
+        self.skipped += len(errors)
+        self.errors.extend(errors[:MAX_ERRORS_KEPT - len(self.errors)])
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'fetched': self.fetched,
+            'added': self.added,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'skipped': self.skipped,
+            'pages': self.pages,
+            'errors': self.errors
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EntityStats':
+        stats = cls()
+        for key, value in data.items():
+            if hasattr(stats, key):
+                setattr(stats, key, value)
+        return stats
+
+
+class EntitySync(ABC):
+    '''
+    Plug-in for one AlfaCRM entity: which endpoint to page through,
+    how to map a page and how to write the difference into the database
+    '''
+    name = ''
+    endpoint = ''
+    filters: Dict[str, Any] = {}
+
+    @abstractmethod
+    def sync_page(self, cur, items: List[Dict[str, Any]], stats: EntityStats) -> None:
+        '''Write one mapped page and count added / updated / unchanged / skipped into stats'''
+
+
+class UserEntitySync(EntitySync):
+    '''customers -> users(role=student), teachers -> users(role=teacher), keyed by (role, alfacrm_id)'''
+
+    def __init__(self, name: str, endpoint: str, role: str, columns: Tuple[str, ...], mapper, filters=None) -> None:
+        self.name = name
+        self.endpoint = endpoint
+        self.role = role
+        self.columns = columns
+        self.mapper = mapper
+        self.filters = filters or {}
+
+    def sync_page(self, cur, items: List[Dict[str, Any]], stats: EntityStats) -> None:
+        rows, errors = self.mapper(items)
+        stats.add_errors(errors)
+        # Один и тот же alfacrm_id на странице - оставляем последнее вхождение
+        rows = list({row[0]: row for row in rows}.values())
+        if not rows:
+            return
+
+        value_columns = self.columns[1:]
+        execute_prepared(
+            cur, f'sync_{self.name}_existing',
+            f'''SELECT alfacrm_id, id, {', '.join(value_columns)}
+                FROM {SCHEMA}.users
+                WHERE role = $1 AND alfacrm_id = ANY($2)''',
+            (self.role, [row[0] for row in rows]),
+            ('varchar', 'varchar[]')
+        )
+        existing = {record[0]: (record[1], tuple(record[2:])) for record in cur.fetchall()}
+
+        rows = self.release_taken_phones(cur, rows, existing)
+
+        inserts = []
+        updates = []
+        for row in rows:
+            current = existing.get(row[0])
+            if current is None:
+                inserts.append(row)
+            elif current[1] != tuple(row[1:]):
+                updates.append((current[0],) + tuple(row[1:]))
+            else:
+                stats.unchanged += 1
+
+        if inserts:
+            insert_columns = ('login', 'password', 'role') + self.columns
+            execute_prepared(
+                cur, f'sync_{self.name}_insert',
+                f'''INSERT INTO {SCHEMA}.users ({', '.join(insert_columns)})
+                    SELECT * FROM unnest({placeholders(len(insert_columns))})
+                    ON CONFLICT (role, alfacrm_id) WHERE alfacrm_id IS NOT NULL
+                    DO UPDATE SET {', '.join(f'{column} = EXCLUDED.{column}' for column in value_columns)}''',
+                columns_of(
+                    [(f'{self.role}_{row[0]}', self.initial_password(row), self.role) + tuple(row) for row in inserts],
+                    len(insert_columns)
+                ),
+                array_types(insert_columns)
+            )
+            stats.added += len(inserts)
+
+        if updates:
+            update_columns = ('id',) + value_columns
+            execute_prepared(
+                cur, f'sync_{self.name}_update',
+                f'''UPDATE {SCHEMA}.users AS u
+                    SET {', '.join(f'{column} = v.{column}' for column in value_columns)}
+                    FROM unnest({placeholders(len(update_columns))}) AS v({', '.join(update_columns)})
+                    WHERE u.id = v.id''',
+                columns_of(updates, len(update_columns)),
+                array_types(update_columns)
+            )
+            stats.updated += len(updates)
+
+    def release_taken_phones(self, cur, rows: List[tuple], existing: Dict[str, tuple]) -> List[tuple]:
+        '''
+        users.phone is unique, but siblings often share a parent's phone:
+        a phone that already belongs to another user (or repeats on the page) is stored as NULL
+        '''
+        phone_index = self.columns.index('phone')
+        phones = [row[phone_index] for row in rows if row[phone_index]]
+        if not phones:
+            return rows
+        execute_prepared(
+            cur, 'sync_users_phones',
+            f'SELECT phone, id FROM {SCHEMA}.users WHERE phone = ANY($1)',
+            (phones,), ('varchar[]',)
+        )
+        owners = dict(cur.fetchall())
+
+        claimed = set()
+        result = []
+        for row in rows:
+            phone = row[phone_index]
+            own_id = existing.get(row[0], (None,))[0]
+            if phone and ((phone in owners and owners[phone] != own_id) or phone in claimed):
+                row = row[:phone_index] + (None,) + row[phone_index + 1:]
+            elif phone:
+                claimed.add(phone)
+            result.append(row)
+        return result
+
+    def initial_password(self, row: tuple) -> str:
+        # Ученики входят по телефону, как и раньше в sync-students
+        phone = row[self.columns.index('phone')]
+        return hash_password(phone if self.role == 'student' and phone else 'temp', INITIAL_PASSWORD_ITERATIONS)
+
+
+class LessonEntitySync(EntitySync):
+    '''lessons -> assignments(type=lesson), keyed by alfacrm_id'''
+    name = 'lessons'
+    endpoint = 'lesson'
+
+    def sync_page(self, cur, items: List[Dict[str, Any]], stats: EntityStats) -> None:
+        customer_ids = list({str(item.get('customer_id', '')) for item in items})
+        teacher_ids = list({str(item.get('teacher_id', '')) for item in items})
+        execute_prepared(
+            cur, 'sync_lessons_users',
+            f'''SELECT role, alfacrm_id, id FROM {SCHEMA}.users
+                WHERE (role = 'student' AND alfacrm_id = ANY($1))
+                   OR (role = 'teacher' AND alfacrm_id = ANY($2))''',
+            (customer_ids, teacher_ids),
+            ('varchar[]', 'varchar[]')
+        )
+        students: Dict[str, int] = {}
+        teachers: Dict[str, int] = {}
+        for role, alfacrm_id, user_id in cur.fetchall():
+            (students if role == 'student' else teachers)[alfacrm_id] = user_id
+
+        rows = map_lessons(items, students, teachers, datetime.now().strftime('%Y-%m-%d'))
+        stats.skipped += len(items) - len(rows)
+        rows = list({row[9]: row for row in rows}.values())
+        if not rows:
+            return
+
+        execute_prepared(
+            cur, 'sync_lessons_existing',
+            f'''SELECT alfacrm_id, id, {', '.join(LESSON_VALUE_COLUMNS)}
+                FROM {SCHEMA}.assignments
+                WHERE alfacrm_id = ANY($1)''',
+            ([row[9] for row in rows],),
+            ('varchar[]',)
+        )
+        existing = {}
+        for record in cur.fetchall():
+            due_date = record[5].isoformat() if isinstance(record[5], date) else record[5]
+            existing[record[0]] = (record[1], (record[2], record[3], record[4], due_date, record[6], record[7], record[8]))
+
+        inserts = []
+        updates = []
+        for row in rows:
+            student_id, teacher_id, _, subject, due_date, due_time, _, status, lesson_type, alfacrm_id = row
+            values = (student_id, teacher_id, subject, due_date, due_time, status, lesson_type)
+            current = existing.get(alfacrm_id)
+            if current is None:
+                inserts.append(row)
+            elif current[1] != values:
+                updates.append((current[0],) + values)
+            else:
+                stats.unchanged += 1
+
+        if inserts:
+            execute_prepared(
+                cur, 'sync_lessons_insert',
+                f'''INSERT INTO {SCHEMA}.assignments ({', '.join(LESSON_COLUMNS)})
+                    SELECT * FROM unnest({placeholders(len(LESSON_COLUMNS))})
+                    ON CONFLICT (alfacrm_id) WHERE alfacrm_id IS NOT NULL
+                    DO UPDATE SET {', '.join(f'{column} = EXCLUDED.{column}' for column in LESSON_VALUE_COLUMNS)}''',
+                columns_of(inserts, len(LESSON_COLUMNS)),
+                array_types(LESSON_COLUMNS)
+            )
+            stats.added += len(inserts)
+
+        if updates:
+            update_columns = ('id',) + LESSON_VALUE_COLUMNS
+            execute_prepared(
+                cur, 'sync_lessons_update',
+                f'''UPDATE {SCHEMA}.assignments AS a
+                    SET {', '.join(f'{column} = v.{column}' for column in LESSON_VALUE_COLUMNS)}
+                    FROM unnest({placeholders(len(update_columns))}) AS v({', '.join(update_columns)})
+                    WHERE a.id = v.id''',
+                columns_of(updates, len(update_columns)),
+                array_types(update_columns)
+            )
+            stats.updated += len(updates)
+
+
+ENTITIES: Dict[str, EntitySync] = {
+    'customers': UserEntitySync('customers', 'customer', 'student', STUDENT_COLUMNS, map_customers, {'is_study': 1}),
+    'teachers': UserEntitySync('teachers', 'teacher', 'teacher', TEACHER_COLUMNS, map_teachers),
+    'lessons': LessonEntitySync()
+}
+
+
+# Позиция синхронизации: (индекс сущности, номер страницы)
+Position = Tuple[int, int]
+
+
+class SyncEngine:
+    '''
+    Pages through each entity in order; lessons go last because they reference users.
+    Work can be split into slices that stop on a deadline and resume from a Position
+    '''
+
+    def __init__(
+        self,
+        client: AlfaCRMClient,
+        conn,
+        branch_id: int,
+        entity_names: List[str],
+        stats: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        self.client = client
+        self.conn = conn
+        self.branch_id = branch_id
+        self.entities = [ENTITIES[name] for name in entity_names]
+        self.stats: Dict[str, EntityStats] = {
+            entity.name: EntityStats.from_dict((stats or {}).get(entity.name, {})) for entity in self.entities
+        }
+
+    def run(self) -> Dict[str, EntityStats]:
+        '''Whole sync in one go; the caller commits'''
+        self.run_slice((0, 0), deadline=float('inf'))
+        return self.stats
+
+    def run_slice(
+        self,
+        position: Position,
+        deadline: float,
+        checkpoint: Optional[Callable[[Position], None]] = None,
+        stop_at: Optional[int] = None
+    ) -> Tuple[Position, bool]:
+        '''
+        Process pages from position until done or time.monotonic() passes deadline
+        Args: checkpoint - called after every page with the next position (persist + commit there)
+              stop_at - entity index not to enter in this slice (e.g. lessons while other branches sync users)
+        Returns: (next position, finished)
+        '''
+        entity_index, page = position
+        end = len(self.entities) if stop_at is None else min(stop_at, len(self.entities))
+        cur = self.conn.cursor()
+        try:
+            while entity_index < end:
+                if time.monotonic() >= deadline:
+                    return (entity_index, page), False
+                entity = self.entities[entity_index]
+                data = self.client.fetch_page(entity.endpoint, self.branch_id, page, entity.filters)
+                items = data.get('items', [])
+                total = int(data.get('total', 0) or 0)
+                stats = self.stats[entity.name]
+                stats.total = total
+                if items:
+                    self.apply_page(cur, entity, items)
+                # AlfaCRM может вернуть меньше PAGE_SIZE записей на страницу: конец сущности определяет
+                # счётчик уже полученных записей, а не page * PAGE_SIZE
+                if not items or stats.fetched >= total:
+                    entity_index, page = entity_index + 1, 0
+                else:
+                    page += 1
+                if checkpoint:
+                    checkpoint((entity_index, page))
+        finally:
+            cur.close()
+        return (entity_index, page), entity_index >= len(self.entities)
+
+    def apply_page(self, cur, entity: EntitySync, items: List[Dict[str, Any]]) -> None:
+        stats = self.stats[entity.name]
+        stats.fetched += len(items)
+        stats.pages += 1
+        entity.sync_page(cur, items, stats)
+
+    def stats_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+
+def parse_branch_ids(value: Optional[str]) -> List[int]:
+    '''"1, 2,3" -> [1, 2, 3]; duplicates dropped, order kept'''
+    branch_ids: List[int] = []
+    for part in (value or '').split(','):
+        part = part.strip()
+        if part and int(part) not in branch_ids:
+            branch_ids.append(int(part))
+    return branch_ids
+
+
+def resolve_branch_ids(client: AlfaCRMClient, config: Dict[str, str], requested: Optional[str] = None) -> List[int]:
+    '''
+    Branches to sync: ?branches= from the request, else ALFACRM_BRANCH_IDS, else ALFACRM_BRANCH_ID.
+    "all" asks AlfaCRM for the active branches of the account
+    '''
+    spec = (requested or config.get('branch_ids') or config['branch_id'] or '').strip()
+    if spec.lower() == 'all':
+        return [int(branch['id']) for branch in client.fetch_branches() if branch.get('is_active', 1)]
+    return parse_branch_ids(spec)
+
+
+def acquire_sync_slot(conn, max_concurrency: int = MAX_CONCURRENCY, wait_seconds: float = SLOT_WAIT_SECONDS) -> int:
+    '''
+    Take one of max_concurrency session advisory locks; parallel invocations share the same slots,
+    so the cap holds across the whole deployment, not only inside one worker pool
+    '''
+    deadline = time.monotonic() + wait_seconds
+    cur = conn.cursor()
+    try:
+        while True:
+            for slot in range(max_concurrency):
+                cur.execute('SELECT pg_try_advisory_lock(%s, %s)', (_SLOT_NAMESPACE, slot))
+                if cur.fetchone()[0]:
+                    conn.commit()
+                    return slot
+            conn.commit()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f'No free sync slot out of {max_concurrency} after {wait_seconds:.0f}s')
+            time.sleep(0.5)
+    finally:
+        cur.close()
+
+
+def release_sync_slot(conn, slot: int) -> None:
+    cur = conn.cursor()
+    cur.execute('SELECT pg_advisory_unlock(%s, %s)', (_SLOT_NAMESPACE, slot))
+    conn.commit()
+    cur.close()
+
+
+def run_parallel(
+    keys: List[int],
+    work: Callable[[int, Any], Any],
+    connect: Callable[[], Any],
+    max_concurrency: int = MAX_CONCURRENCY
+) -> Dict[int, Dict[str, Any]]:
+    '''
+    Run work(key, conn) for every key (branch id or job id) on a thread pool; each key gets its own
+    connection and a sync slot. A failing key does not stop the others
+    Returns: {key: {'status': 'done'|'failed', 'duration_ms', 'result' | 'error'}}
+    '''
+    if not keys:
+        return {}
+
+    def run_one(key: int) -> Dict[str, Any]:
+        started = time.perf_counter()
+        conn = None
+        try:
+            conn = connect()
+            slot = acquire_sync_slot(conn, max_concurrency)
+            try:
+                outcome = {'status': 'done', 'result': work(key, conn)}
+            finally:
+                conn.rollback()
+                release_sync_slot(conn, slot)
+        except Exception as e:
+            outcome = {'status': 'failed', 'error': str(e)}
+        finally:
+            if conn:
+                conn.close()
+        outcome['duration_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return outcome
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max(1, min(max_concurrency, len(keys)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(run_one, keys))
+    return dict(zip(keys, outcomes))
+
+
+def config_from_env(environ: Dict[str, str]) -> Optional[Dict[str, str]]:
+    '''AlfaCRM + DB settings shared by the sync entry points; None when something is missing'''
+    config = {
+        'api_key': environ.get('ALFACRM_API_KEY'),
+        'domain': environ.get('ALFACRM_DOMAIN'),
+        'email': environ.get('ALFACRM_EMAIL'),
+        'database_url': environ.get('DATABASE_URL')
+    }
+    if not all(config.values()):
+        return None
+    config['branch_id'] = environ.get('ALFACRM_BRANCH_ID', '')
+    config['branch_ids'] = environ.get('ALFACRM_BRANCH_IDS', '')
+    return config if config['branch_id'] or config['branch_ids'] else None
@@ -0,0 +1,192 @@
+'''
+Business: Word bank for speech-therapy games: phoneme pairs and random word samples served from an in-memory index
+Args: event - dict with httpMethod, queryStringParameters:
+      action=pairs - list of pairs with word counts;
+      pair=[С]-[Ш]|random, count (default 30), phoneme, position=start|middle|end, min_length, max_length, seed
+      context - object with request_id attribute
+Returns: HTTP response with pairs, or pair, phoneme1, phoneme2 and words [{word, phoneme}]
+'''
+import bisect
+import json
+import os
+import random
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from db_metrics import QueryMetrics, connect
+from handler_core import METHOD_NOT_ALLOWED, preflight_response
+
+SCHEMA = 't_p720035_lineaschool_app'
+CACHE_TTL_SECONDS = float(os.environ.get('WORD_BANK_TTL', '600'))
+DEFAULT_COUNT = 30
+MAX_COUNT = 200
+POSITIONS = ('start', 'middle', 'end')
+
+PREFLIGHT = preflight_response('GET, OPTIONS')
+
+BucketKey = Tuple[Optional[str], int]
+
+
+class WordBank:
+    '''
+    All active words of the bank, indexed once per load:
+    pair -> phoneme -> (position, length) -> words; position is None where it is not defined
+    (a soft phoneme without a soft context). A sample touches only the buckets that match the filters and picks k indices from their virtual concatenation, so it is O(k)
+    in the number of words returned instead of filtering whole lists
+    '''
+
+    def __init__(self, rows: List[Tuple[str, str, str, Optional[str], int]]) -> None:
+        self.pairs: Dict[str, List[str]] = {}
+        self.buckets: Dict[str, Dict[str, Dict[BucketKey, List[str]]]] = {}
+        for pair, phoneme, word, position, length in rows:
+            phonemes = self.pairs.setdefault(pair, [])
+            if phoneme not in phonemes:
+                phonemes.append(phoneme)
+            by_key = self.buckets.setdefault(pair, {}).setdefault(phoneme, {})
+            by_key.setdefault((position, length), []).append(word)
+        self.loaded_at = time.monotonic()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                'pair': pair,
+                'phoneme1': phonemes[0],
+                'phoneme2': phonemes[1] if len(phonemes) > 1 else None,
+                'counts': {
+                    phoneme: sum(len(words) for words in self.buckets[pair][phoneme].values())
+                    for phoneme in phonemes
+                }
+            }
+            for pair, phonemes in self.pairs.items()
+        ]
+
+    def sample(
+        self,
+        pair: str,
+        count: int,
+        rnd: random.Random,
+        phoneme: Optional[str] = None,
+        position: Optional[str] = None,
+        min_length: int = 0,
+        max_length: int = 1000
+    ) -> List[Dict[str, str]]:
+        selected: List[Tuple[str, List[str]]] = []
+        for name in self.pairs[pair]:
+            if phoneme and name != phoneme:
+                continue
+            # position None сортируется первым: порядок корзин стабилен, выборка с seed воспроизводима
+            buckets = sorted(self.buckets[pair][name].items(), key=lambda item: (item[0][0] or '', item[0][1]))
+            for (word_position, length), words in buckets:
+                if (position is None or word_position == position) and min_length <= length <= max_length:
+                    selected.append((name, words))
+
+        # Префиксные суммы размеров корзин: индекс выборки -> корзина через bisect
+        offsets: List[int] = []
+        total = 0
+        for _, words in selected:
+            offsets.append(total)
+            total += len(words)
+        picked = rnd.sample(range(total), min(count, total))
+        result = []
+        for index in picked:
+            bucket = bisect.bisect_right(offsets, index) - 1
+            name, words = selected[bucket]
+            result.append({'word': words[index - offsets[bucket]], 'phoneme': name})
+        return result
+
+
+_bank: Optional[WordBank] = None
+_bank_lock = threading.Lock()
+
+
+def get_bank(database_url: str, metrics: QueryMetrics) -> Tuple[WordBank, str]:
+    '''Warm instances reuse the bank for CACHE_TTL_SECONDS; returns (bank, HIT|MISS)'''
+    global _bank
+    with _bank_lock:
+        if _bank is not None and time.monotonic() - _bank.loaded_at < CACHE_TTL_SECONDS:
+            return _bank, 'HIT'
+        conn = connect(database_url, metrics)
+        try:
+            cur = conn.cursor()
+            cur.execute(
+                f'''SELECT pair, phoneme, word, position, length
+                    FROM {SCHEMA}.word_bank
+                    WHERE is_active
+                    ORDER BY id'''
+            )
+            _bank = WordBank(cur.fetchall())
+            cur.close()
+        finally:
+            conn.close()
+        return _bank, 'MISS'
+
+
+def json_response(status_code: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*', **(headers or {})},
+        'isBase64Encoded': False,
+        'body': json.dumps(body, ensure_ascii=False)
+    }
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    method: str = event.get('httpMethod', 'GET')
+
+    if method == 'OPTIONS':
+        return PREFLIGHT
+
+    if method != 'GET':
+        return METHOD_NOT_ALLOWED
+
+    params = event.get('queryStringParameters') or {}
+    try:
+        count = int(params.get('count') or DEFAULT_COUNT)
+        min_length = int(params.get('min_length') or 0)
+        max_length = int(params.get('max_length') or 1000)
+        seed = int(params['seed']) if params.get('seed') else None
+    except ValueError:
+        return json_response(400, {'error': 'count, min_length, max_length and seed must be integers'})
+    position = params.get('position') or None
+    if not 1 <= count <= MAX_COUNT or (position and position not in POSITIONS):
+        return json_response(400, {'error': f'count must be 1..{MAX_COUNT}, position one of {", ".join(POSITIONS)}'})
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        return json_response(500, {'error': 'Database URL not configured'})
+
+    metrics = QueryMetrics('word-bank')
+    bank, cache_status = get_bank(database_url, metrics)
+    # Банк меняется редко: браузер и CDN могут держать ответ, кроме случайных выборок без seed
+    cache_headers = {'X-Cache': cache_status}
+
+    if params.get('action') == 'pairs':
+        cache_headers['Cache-Control'] = 'public, max-age=600'
+        return metrics.apply(json_response(200, {'success': True, 'pairs': bank.summary()}, cache_headers), event)
+
+    # С seed выборка воспроизводима: конфиг игры может хранить pair, seed и count вместо самих слов
+    rnd = random.Random(seed)
+    pair = params.get('pair') or 'random'
+    if pair == 'random':
+        if not bank.pairs:
+            return json_response(404, {'error': 'Word bank is empty'})
+        pair = rnd.choice(list(bank.pairs))
+    if pair not in bank.pairs:
+        return json_response(404, {'error': 'Unknown phoneme pair', 'pairs': list(bank.pairs)})
+    phoneme = params.get('phoneme') or None
+    if phoneme and phoneme not in bank.pairs[pair]:
+        return json_response(400, {'error': 'phoneme is not part of the pair', 'phonemes': bank.pairs[pair]})
+
+    words = bank.sample(pair, count, rnd, phoneme, position, min_length, max_length)
+    if seed is not None:
+        cache_headers['Cache-Control'] = 'public, max-age=600'
+    phonemes = bank.pairs[pair]
+    return metrics.apply(json_response(200, {
+        'success': True,
+        'pair': pair,
+        'phoneme1': phonemes[0],
+        'phoneme2': phonemes[1] if len(phonemes) > 1 else None,
+        'seed': seed,
+        'words': words
+    }, cache_headers), event)
@@ -0,0 +1,34 @@
+-- Stable AlfaCRM key for users synced from AlfaCRM (replaces login-based matching)
+ALTER TABLE t_p720035_lineaschool_app.users
+ADD COLUMN IF NOT EXISTS alfacrm_id VARCHAR(100);
+
+-- Rows created by alfacrm-sync: login alfacrm_<id>
+UPDATE t_p720035_lineaschool_app.users
+SET alfacrm_id = substring(login FROM 9)
+WHERE alfacrm_id IS NULL AND login ~ '^alfacrm_[0-9]+$';
+
+-- Rows created by sync-students: login student_<id>, unless alfacrm-sync already owns that customer
+UPDATE t_p720035_lineaschool_app.users AS u
+SET alfacrm_id = substring(u.login FROM 9)
+WHERE u.alfacrm_id IS NULL
+  AND u.role = 'student'
+  AND u.login ~ '^student_[0-9]+$'
+  AND NOT EXISTS (
+      SELECT 1 FROM t_p720035_lineaschool_app.users AS o
+      WHERE o.role = 'student' AND o.alfacrm_id = substring(u.login FROM 9)
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_role_alfacrm_id
+ON t_p720035_lineaschool_app.users(role, alfacrm_id)
+WHERE alfacrm_id IS NOT NULL;
+
+-- Lessons are keyed by alfacrm_id as well; keep the oldest copy of any duplicate
+DELETE FROM t_p720035_lineaschool_app.assignments AS a
+USING t_p720035_lineaschool_app.assignments AS b
+WHERE a.alfacrm_id IS NOT NULL
+  AND a.alfacrm_id = b.alfacrm_id
+  AND a.id > b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_assignments_alfacrm_id
+ON t_p720035_lineaschool_app.assignments(alfacrm_id)
+WHERE alfacrm_id IS NOT NULL;
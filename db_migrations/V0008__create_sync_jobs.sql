@@ -0,0 +1,18 @@
+-- Resumable AlfaCRM sync jobs: position (entity, page) and stats are checkpointed after every page
+CREATE TABLE IF NOT EXISTS t_p720035_lineaschool_app.sync_jobs (
+    id SERIAL PRIMARY KEY,
+    branch_id INTEGER NOT NULL,
+    entities VARCHAR(200) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    entity_index INTEGER NOT NULL DEFAULT 0,
+    page INTEGER NOT NULL DEFAULT 0,
+    stats JSONB NOT NULL DEFAULT '{}',
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_unfinished
+ON t_p720035_lineaschool_app.sync_jobs(id)
+WHERE status IN ('pending', 'running');
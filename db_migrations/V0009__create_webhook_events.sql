@@ -0,0 +1,13 @@
+-- Idempotency keys of processed AlfaCRM webhooks; rows older than the dedup window are pruned by the handler
+CREATE TABLE IF NOT EXISTS t_p720035_lineaschool_app.webhook_events (
+    idempotency_key VARCHAR(64) PRIMARY KEY,
+    entity VARCHAR(20) NOT NULL,
+    entity_id INTEGER NOT NULL,
+    event VARCHAR(20) NOT NULL,
+    branch_id INTEGER,
+    result VARCHAR(20) NOT NULL,
+    received_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_webhook_events_received_at
+ON t_p720035_lineaschool_app.webhook_events(received_at);
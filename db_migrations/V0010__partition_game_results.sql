@@ -0,0 +1,130 @@
+-- game_results: monthly range partitions on completed_at, BRIN for time scans, default partition as a safety net.
+-- New partitions are created ahead of time by ensure_game_results_partitions() (game-results-maintenance function)
+
+ALTER TABLE t_p720035_lineaschool_app.game_results RENAME TO game_results_legacy;
+ALTER TABLE t_p720035_lineaschool_app.game_results_legacy RENAME CONSTRAINT game_results_pkey TO game_results_legacy_pkey;
+DROP INDEX IF EXISTS t_p720035_lineaschool_app.idx_game_results_game;
+DROP INDEX IF EXISTS t_p720035_lineaschool_app.idx_game_results_student;
+DROP INDEX IF EXISTS t_p720035_lineaschool_app.idx_game_results_completed;
+ALTER SEQUENCE t_p720035_lineaschool_app.game_results_id_seq OWNED BY NONE;
+
+CREATE TABLE t_p720035_lineaschool_app.game_results (
+    id INTEGER NOT NULL DEFAULT nextval('t_p720035_lineaschool_app.game_results_id_seq'),
+    game_id INTEGER REFERENCES t_p720035_lineaschool_app.games(id),
+    student_id INTEGER REFERENCES t_p720035_lineaschool_app.users(id),
+    score INTEGER NOT NULL,
+    max_score INTEGER NOT NULL,
+    time_spent INTEGER,
+    completed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    details JSONB,
+    PRIMARY KEY (id, completed_at)
+) PARTITION BY RANGE (completed_at);
+
+ALTER SEQUENCE t_p720035_lineaschool_app.game_results_id_seq OWNED BY t_p720035_lineaschool_app.game_results.id;
+
+-- Строки без своей партиции попадают сюда; ensure_game_results_partition переносит их при создании партиции
+CREATE TABLE t_p720035_lineaschool_app.game_results_default
+PARTITION OF t_p720035_lineaschool_app.game_results DEFAULT;
+
+CREATE INDEX idx_game_results_game ON t_p720035_lineaschool_app.game_results(game_id);
+CREATE INDEX idx_game_results_student ON t_p720035_lineaschool_app.game_results(student_id);
+-- Результаты пишутся по времени, поэтому BRIN на completed_at в сотни раз меньше B-tree
+CREATE INDEX idx_game_results_completed_brin ON t_p720035_lineaschool_app.game_results
+USING brin (completed_at) WITH (pages_per_range = 32);
+
+CREATE OR REPLACE FUNCTION t_p720035_lineaschool_app.ensure_game_results_partition(month_start DATE)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    first_day DATE := date_trunc('month', month_start)::date;
+    next_month DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::date;
+    partition_name TEXT := 'game_results_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    IF to_regclass('t_p720035_lineaschool_app.' || partition_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE t_p720035_lineaschool_app.%I (LIKE t_p720035_lineaschool_app.game_results INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name
+    );
+    EXECUTE format(
+        'WITH moved AS (
+             DELETE FROM t_p720035_lineaschool_app.game_results_default
+             WHERE completed_at >= %L AND completed_at < %L
+             RETURNING *
+         )
+         INSERT INTO t_p720035_lineaschool_app.%I SELECT * FROM moved',
+        first_day, next_month, partition_name
+    );
+    EXECUTE format(
+        'ALTER TABLE t_p720035_lineaschool_app.game_results ATTACH PARTITION t_p720035_lineaschool_app.%I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, first_day, next_month
+    );
+    RETURN partition_name;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION t_p720035_lineaschool_app.ensure_game_results_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE;
+    last_month DATE := date_trunc('month', CURRENT_DATE + make_interval(months => months_ahead))::date;
+    created INTEGER := 0;
+BEGIN
+    -- Начинаем с самого старого месяца, застрявшего в default, иначе с текущего
+    SELECT date_trunc('month', LEAST(COALESCE(MIN(completed_at), CURRENT_DATE), CURRENT_DATE))::date
+    INTO month_start
+    FROM t_p720035_lineaschool_app.game_results_default;
+
+    WHILE month_start <= last_month LOOP
+        IF t_p720035_lineaschool_app.ensure_game_results_partition(month_start) IS NOT NULL THEN
+            created := created + 1;
+        END IF;
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+    RETURN created;
+END;
+$$;
+
+-- Перенос истории: сначала строки ложатся в default, затем раскладываются по месячным партициям
+INSERT INTO t_p720035_lineaschool_app.game_results (id, game_id, student_id, score, max_score, time_spent, completed_at, details)
+SELECT id, game_id, student_id, score, max_score, time_spent, COALESCE(completed_at, CURRENT_TIMESTAMP), details
+FROM t_p720035_lineaschool_app.game_results_legacy;
+
+SELECT t_p720035_lineaschool_app.ensure_game_results_partitions(3);
+
+DROP TABLE t_p720035_lineaschool_app.game_results_legacy;
+
+-- Помесячные итоги архивированных партиций: статистика остаётся, сырые строки можно удалить
+CREATE TABLE IF NOT EXISTS t_p720035_lineaschool_app.game_results_monthly (
+    month DATE NOT NULL,
+    game_id INTEGER NOT NULL,
+    student_id INTEGER NOT NULL,
+    plays INTEGER NOT NULL,
+    score_sum BIGINT NOT NULL,
+    max_score_sum BIGINT NOT NULL,
+    best_score INTEGER NOT NULL,
+    time_spent_sum BIGINT NOT NULL,
+    PRIMARY KEY (month, game_id, student_id)
+);
+
+-- Средний балл считается инкрементально: сумма процентов / plays_count, без пересчёта по всей истории
+ALTER TABLE t_p720035_lineaschool_app.games
+ADD COLUMN IF NOT EXISTS score_percent_sum NUMERIC NOT NULL DEFAULT 0;
+
+UPDATE t_p720035_lineaschool_app.games AS g
+SET plays_count = s.plays,
+    score_percent_sum = s.percent_sum,
+    average_score = ROUND(s.percent_sum / s.plays, 2)
+FROM (
+    SELECT game_id,
+           COUNT(*) AS plays,
+           COALESCE(SUM(CAST(score AS DECIMAL) / NULLIF(max_score, 0) * 100), 0) AS percent_sum
+    FROM t_p720035_lineaschool_app.game_results
+    GROUP BY game_id
+) AS s
+WHERE g.id = s.game_id;
@@ -0,0 +1,87 @@
+-- Precomputed leaderboards: one row per (game, scope, period) holding the ranked top-N as JSONB.
+-- save-game-result merges every new result into the affected rows, get-leaderboard reads one row by primary key.
+-- scope 'all' uses scope_id 0, scope 'teacher' uses the teacher's user id; period_key is 'all', 'YYYY-MM' or 'IYYY-WIW'
+CREATE TABLE IF NOT EXISTS t_p720035_lineaschool_app.game_leaderboards (
+    game_id INTEGER NOT NULL REFERENCES t_p720035_lineaschool_app.games(id),
+    scope VARCHAR(20) NOT NULL,
+    scope_id INTEGER NOT NULL DEFAULT 0,
+    period VARCHAR(10) NOT NULL,
+    period_key VARCHAR(10) NOT NULL,
+    entries JSONB NOT NULL DEFAULT '[]'::jsonb,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (game_id, scope, scope_id, period, period_key)
+);
+
+-- Порядок рейтинга: больше очков, меньше время, раньше сыграно; индекс отдаёт строки игры уже в этом порядке
+CREATE INDEX IF NOT EXISTS idx_game_results_leaderboard
+ON t_p720035_lineaschool_app.game_results(game_id, score DESC, time_spent);
+
+-- Полный пересчёт досок игры за текущие периоды: бэкфилл, смена учителей у ученика, ручной ремонт.
+-- Лучший результат каждого ученика, затем top-N; устаревшие недели и месяцы удаляются
+CREATE OR REPLACE FUNCTION t_p720035_lineaschool_app.rebuild_game_leaderboards(p_game_id INTEGER, p_size INTEGER DEFAULT 20)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    boards INTEGER;
+BEGIN
+    DELETE FROM t_p720035_lineaschool_app.game_leaderboards WHERE game_id = p_game_id;
+
+    WITH periods(period, period_key, since) AS (
+        VALUES ('all', 'all', '-infinity'::timestamp),
+               ('month', to_char(CURRENT_DATE, 'YYYY-MM'), date_trunc('month', CURRENT_DATE)::timestamp),
+               ('week', to_char(CURRENT_DATE, 'IYYY-"W"IW'), date_trunc('week', CURRENT_DATE)::timestamp)
+    ),
+    results AS (
+        SELECT id, student_id, score, max_score, time_spent, completed_at
+        FROM t_p720035_lineaschool_app.game_results
+        WHERE game_id = p_game_id AND student_id IS NOT NULL
+    ),
+    scoped AS (
+        SELECT 'all'::varchar AS scope, 0 AS scope_id, r.* FROM results r
+        UNION ALL
+        SELECT 'teacher', t.teacher_id, r.*
+        FROM results r
+        JOIN (
+            SELECT DISTINCT student_id, teacher_id
+            FROM t_p720035_lineaschool_app.assignments
+            WHERE teacher_id IS NOT NULL
+        ) t ON t.student_id = r.student_id
+    ),
+    best AS (
+        SELECT DISTINCT ON (s.scope, s.scope_id, p.period, s.student_id)
+               s.scope, s.scope_id, p.period, p.period_key, s.id, s.student_id,
+               s.score, s.max_score, s.time_spent, s.completed_at
+        FROM scoped s
+        JOIN periods p ON s.completed_at >= p.since
+        ORDER BY s.scope, s.scope_id, p.period, s.student_id, s.score DESC, s.time_spent NULLS LAST, s.completed_at
+    ),
+    ranked AS (
+        SELECT b.*, row_number() OVER (
+            PARTITION BY b.scope, b.scope_id, b.period
+            ORDER BY b.score DESC, b.time_spent NULLS LAST, b.completed_at
+        ) AS position
+        FROM best b
+    )
+    INSERT INTO t_p720035_lineaschool_app.game_leaderboards (game_id, scope, scope_id, period, period_key, entries)
+    SELECT p_game_id, r.scope, r.scope_id, r.period, r.period_key,
+           jsonb_agg(jsonb_build_object(
+               'result_id', r.id,
+               'student_id', r.student_id,
+               'student_name', u.full_name,
+               'score', r.score,
+               'max_score', r.max_score,
+               'time_spent', r.time_spent,
+               'completed_at', to_char(r.completed_at, 'YYYY-MM-DD"T"HH24:MI:SS')
+           ) ORDER BY r.position)
+    FROM ranked r
+    JOIN t_p720035_lineaschool_app.users u ON u.id = r.student_id
+    WHERE r.position <= p_size
+    GROUP BY r.scope, r.scope_id, r.period, r.period_key;
+
+    GET DIAGNOSTICS boards = ROW_COUNT;
+    RETURN boards;
+END;
+$$;
+
+SELECT t_p720035_lineaschool_app.rebuild_game_leaderboards(id) FROM t_p720035_lineaschool_app.games;
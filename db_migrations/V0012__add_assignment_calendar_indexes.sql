@@ -0,0 +1,15 @@
+-- Calendar range reads (get-students ?mode=calendar): every column the calendar shows is in the index,
+-- so a month of one student or teacher is an index-only scan over a few pages regardless of history size.
+-- (student_id, due_date) also serves plain student_id lookups, so it replaces idx_assignments_student
+CREATE INDEX IF NOT EXISTS idx_assignments_student_due
+ON t_p720035_lineaschool_app.assignments(student_id, due_date)
+INCLUDE (id, teacher_id, type, status, completed, lesson_type, due_time, title, subject);
+
+CREATE INDEX IF NOT EXISTS idx_assignments_teacher_due
+ON t_p720035_lineaschool_app.assignments(teacher_id, due_date)
+INCLUDE (id, student_id, type, status, completed, lesson_type, due_time, title, subject);
+
+DROP INDEX IF EXISTS t_p720035_lineaschool_app.idx_assignments_student;
+
+-- Миграция идёт в транзакции, поэтому только ANALYZE; карту видимости для index-only scan ведёт autovacuum
+ANALYZE t_p720035_lineaschool_app.assignments;
@@ -0,0 +1,26 @@
+-- Поиск людей в get-students (?mode=search): триграммы по нормализованному ФИО и префикс нормализованного телефона.
+-- pg_trgm разбирает кириллицу только при UTF-8 LC_CTYPE базы (не C), как и lower()
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ё и е пишут вперемешку: сравниваем без регистра и без ё
+ALTER TABLE t_p720035_lineaschool_app.users
+ADD COLUMN IF NOT EXISTS search_name TEXT
+GENERATED ALWAYS AS (translate(lower(full_name), 'ё', 'е')) STORED;
+
+-- Только цифры, российские номера приведены к 7XXXXXXXXXX: "+7 (900) 123-45-67", "89001234567" и "9001234567" совпадают
+ALTER TABLE t_p720035_lineaschool_app.users
+ADD COLUMN IF NOT EXISTS phone_digits TEXT
+GENERATED ALWAYS AS (
+    CASE
+        WHEN regexp_replace(phone, '\D', '', 'g') ~ '^8\d{10}$' THEN '7' || substr(regexp_replace(phone, '\D', '', 'g'), 2)
+        WHEN regexp_replace(phone, '\D', '', 'g') ~ '^9\d{9}$' THEN '7' || regexp_replace(phone, '\D', '', 'g')
+        ELSE NULLIF(regexp_replace(phone, '\D', '', 'g'), '')
+    END
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_users_search_name_trgm
+ON t_p720035_lineaschool_app.users USING gin (search_name gin_trgm_ops);
+
+-- text_pattern_ops: LIKE '7900%' идёт по индексу при любой collation
+CREATE INDEX IF NOT EXISTS idx_users_phone_digits
+ON t_p720035_lineaschool_app.users(phone_digits text_pattern_ops);
@@ -0,0 +1,2458 @@
+-- Банк слов для логопедических игр: пары фонем из src/data/phonemicWords.ts.
+-- position - где в слове стоит буква фонемы (start, middle, end); word-bank строит по нему и длине индексы в памяти.
+-- Для мягких фонем (Сь, Кь, ...) учитывается только буква перед ь, е, ё, и, ю, я; без такого места - NULL
+CREATE TABLE IF NOT EXISTS t_p720035_lineaschool_app.word_bank (
+    id SERIAL PRIMARY KEY,
+    pair VARCHAR(20) NOT NULL,
+    phoneme VARCHAR(10) NOT NULL,
+    word VARCHAR(50) NOT NULL,
+    position VARCHAR(10),
+    length SMALLINT GENERATED ALWAYS AS (char_length(word)) STORED,
+    is_active BOOLEAN NOT NULL DEFAULT true,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (pair, phoneme, word)
+);
+
+CREATE INDEX IF NOT EXISTS idx_word_bank_pair
+ON t_p720035_lineaschool_app.word_bank(pair, phoneme, position, length) WHERE is_active;
+
+INSERT INTO t_p720035_lineaschool_app.word_bank (pair, phoneme, word, position) VALUES
+('[С]-[Ш]', 'С', 'сабля', 'start'),
+('[С]-[Ш]', 'С', 'сад', 'start'),
+('[С]-[Ш]', 'С', 'сайка', 'start'),
+('[С]-[Ш]', 'С', 'салат', 'start'),
+('[С]-[Ш]', 'С', 'сало', 'start'),
+('[С]-[Ш]', 'С', 'салфетка', 'start'),
+('[С]-[Ш]', 'С', 'сальто', 'start'),
+('[С]-[Ш]', 'С', 'салют', 'start'),
+('[С]-[Ш]', 'С', 'самолёт', 'start'),
+('[С]-[Ш]', 'С', 'сани', 'start'),
+('[С]-[Ш]', 'С', 'санитар', 'start'),
+('[С]-[Ш]', 'С', 'сапоги', 'start'),
+('[С]-[Ш]', 'С', 'сарафан', 'start'),
+('[С]-[Ш]', 'С', 'сахар', 'start'),
+('[С]-[Ш]', 'С', 'сода', 'start'),
+('[С]-[Ш]', 'С', 'сок', 'start'),
+('[С]-[Ш]', 'С', 'сокол', 'start'),
+('[С]-[Ш]', 'С', 'соль', 'start'),
+('[С]-[Ш]', 'С', 'сом', 'start'),
+('[С]-[Ш]', 'С', 'сон', 'start'),
+('[С]-[Ш]', 'С', 'сувенир', 'start'),
+('[С]-[Ш]', 'С', 'сугроб', 'start'),
+('[С]-[Ш]', 'С', 'суд', 'start'),
+('[С]-[Ш]', 'С', 'судно', 'start'),
+('[С]-[Ш]', 'С', 'сук', 'start'),
+('[С]-[Ш]', 'С', 'сукно', 'start'),
+('[С]-[Ш]', 'С', 'суп', 'start'),
+('[С]-[Ш]', 'С', 'сын', 'start'),
+('[С]-[Ш]', 'С', 'сыр', 'start'),
+('[С]-[Ш]', 'С', 'абрикос', 'end'),
+('[С]-[Ш]', 'С', 'автобус', 'end'),
+('[С]-[Ш]', 'С', 'брус', 'end'),
+('[С]-[Ш]', 'С', 'вес', 'end'),
+('[С]-[Ш]', 'С', 'вкус', 'end'),
+('[С]-[Ш]', 'С', 'вопрос', 'end'),
+('[С]-[Ш]', 'С', 'глобус', 'end'),
+('[С]-[Ш]', 'С', 'интерес', 'end'),
+('[С]-[Ш]', 'С', 'мусс', 'end'),
+('[С]-[Ш]', 'С', 'мыс', 'end'),
+('[С]-[Ш]', 'С', 'кактус', 'end'),
+('[С]-[Ш]', 'С', 'пас', 'end'),
+('[С]-[Ш]', 'С', 'лес', 'end'),
+('[С]-[Ш]', 'С', 'нос', 'end'),
+('[С]-[Ш]', 'С', 'парус', 'end'),
+('[С]-[Ш]', 'С', 'покос', 'end'),
+('[С]-[Ш]', 'С', 'ребус', 'end'),
+('[С]-[Ш]', 'С', 'рис', 'end'),
+('[С]-[Ш]', 'С', 'тёс', 'end'),
+('[С]-[Ш]', 'С', 'троллейбус', 'end'),
+('[С]-[Ш]', 'С', 'ус', 'end'),
+('[С]-[Ш]', 'С', 'фокус', 'end'),
+('[С]-[Ш]', 'С', 'бусы', 'middle'),
+('[С]-[Ш]', 'С', 'весы', 'middle'),
+('[С]-[Ш]', 'С', 'волосок', 'middle'),
+('[С]-[Ш]', 'С', 'досуг', 'middle'),
+('[С]-[Ш]', 'С', 'колбаса', 'middle'),
+('[С]-[Ш]', 'С', 'колёса', 'middle'),
+('[С]-[Ш]', 'С', 'коса', 'middle'),
+('[С]-[Ш]', 'С', 'краса', 'middle'),
+('[С]-[Ш]', 'С', 'кусок', 'middle'),
+('[С]-[Ш]', 'С', 'лесок', 'middle'),
+('[С]-[Ш]', 'С', 'лиса', 'middle'),
+('[С]-[Ш]', 'С', 'оса', 'middle'),
+('[С]-[Ш]', 'С', 'осока', 'middle'),
+('[С]-[Ш]', 'С', 'песок', 'middle'),
+('[С]-[Ш]', 'С', 'писатель', 'middle'),
+('[С]-[Ш]', 'С', 'полоса', 'middle'),
+('[С]-[Ш]', 'С', 'посадка', 'middle'),
+('[С]-[Ш]', 'С', 'посол', 'middle'),
+('[С]-[Ш]', 'С', 'посуда', 'middle'),
+('[С]-[Ш]', 'С', 'посылка', 'middle'),
+('[С]-[Ш]', 'С', 'роса', 'middle'),
+('[С]-[Ш]', 'С', 'фасоль', 'middle'),
+('[С]-[Ш]', 'С', 'стык', 'start'),
+('[С]-[Ш]', 'С', 'стыковка', 'start'),
+('[С]-[Ш]', 'С', 'стынет', 'start'),
+('[С]-[Ш]', 'С', 'остыть', 'middle'),
+('[С]-[Ш]', 'С', 'пустырь', 'middle'),
+('[С]-[Ш]', 'С', 'пустыня', 'middle'),
+('[С]-[Ш]', 'С', 'риск', 'middle'),
+('[С]-[Ш]', 'С', 'треск', 'middle'),
+('[С]-[Ш]', 'С', 'плеск', 'middle'),
+('[С]-[Ш]', 'С', 'блеск', 'middle'),
+('[С]-[Ш]', 'С', 'лоск', 'middle'),
+('[С]-[Ш]', 'С', 'киоск', 'middle'),
+('[С]-[Ш]', 'С', 'пуск', 'middle'),
+('[С]-[Ш]', 'Ш', 'шаг', 'start'),
+('[С]-[Ш]', 'Ш', 'шайба', 'start'),
+('[С]-[Ш]', 'Ш', 'шапка', 'start'),
+('[С]-[Ш]', 'Ш', 'шар', 'start'),
+('[С]-[Ш]', 'Ш', 'шарф', 'start'),
+('[С]-[Ш]', 'Ш', 'шахматы', 'start'),
+('[С]-[Ш]', 'Ш', 'шахта', 'start'),
+('[С]-[Ш]', 'Ш', 'шея', 'start'),
+('[С]-[Ш]', 'Ш', 'шёлк', 'start'),
+('[С]-[Ш]', 'Ш', 'шёпот', 'start'),
+('[С]-[Ш]', 'Ш', 'шило', 'start'),
+('[С]-[Ш]', 'Ш', 'шина', 'start'),
+('[С]-[Ш]', 'Ш', 'шорох', 'start'),
+('[С]-[Ш]', 'Ш', 'шуба', 'start'),
+('[С]-[Ш]', 'Ш', 'шум', 'start'),
+('[С]-[Ш]', 'Ш', 'шуруп', 'start'),
+('[С]-[Ш]', 'Ш', 'шут', 'start'),
+('[С]-[Ш]', 'Ш', 'горошина', 'middle'),
+('[С]-[Ш]', 'Ш', 'гребешок', 'middle'),
+('[С]-[Ш]', 'Ш', 'калоши', 'middle'),
+('[С]-[Ш]', 'Ш', 'камыши', 'middle'),
+('[С]-[Ш]', 'Ш', 'каша', 'middle'),
+('[С]-[Ш]', 'Ш', 'крыша', 'middle'),
+('[С]-[Ш]', 'Ш', 'ландыши', 'middle'),
+('[С]-[Ш]', 'Ш', 'лошадка', 'middle'),
+('[С]-[Ш]', 'Ш', 'малыши', 'middle'),
+('[С]-[Ш]', 'Ш', 'машина', 'middle'),
+('[С]-[Ш]', 'Ш', 'мешок', 'middle'),
+('[С]-[Ш]', 'Ш', 'мишень', 'middle'),
+('[С]-[Ш]', 'Ш', 'мышата', 'middle'),
+('[С]-[Ш]', 'Ш', 'мыши', 'middle'),
+('[С]-[Ш]', 'Ш', 'мышонок', 'middle'),
+('[С]-[Ш]', 'Ш', 'ноша', 'middle'),
+('[С]-[Ш]', 'Ш', 'ошейник', 'middle'),
+('[С]-[Ш]', 'Ш', 'ошибка', 'middle'),
+('[С]-[Ш]', 'Ш', 'петушок', 'middle'),
+('[С]-[Ш]', 'Ш', 'пушок', 'middle'),
+('[С]-[Ш]', 'Ш', 'ремешок', 'middle'),
+('[С]-[Ш]', 'Ш', 'решение', 'middle'),
+('[С]-[Ш]', 'Ш', 'тишина', 'middle'),
+('[С]-[Ш]', 'Ш', 'ушанка', 'middle'),
+('[С]-[Ш]', 'Ш', 'уши', 'middle'),
+('[С]-[Ш]', 'Ш', 'ушиб', 'middle'),
+('[С]-[Ш]', 'Ш', 'гуляш', 'end'),
+('[С]-[Ш]', 'Ш', 'детёныш', 'end'),
+('[С]-[Ш]', 'Ш', 'камыш', 'end'),
+('[С]-[Ш]', 'Ш', 'карандаш', 'end'),
+('[С]-[Ш]', 'Ш', 'ландыш', 'end'),
+('[С]-[Ш]', 'Ш', 'малыш', 'end'),
+('[С]-[Ш]', 'Ш', 'мышь', 'end'),
+('[С]-[Ш]', 'Ш', 'мякиш', 'end'),
+('[С]-[Ш]', 'Ш', 'тушь', 'end'),
+('[С]-[Ш]', 'Ш', 'финиш', 'end'),
+('[З]-[Ж]', 'З', 'зал', 'start'),
+('[З]-[Ж]', 'З', 'завал', 'start'),
+('[З]-[Ж]', 'З', 'задира', 'start'),
+('[З]-[Ж]', 'З', 'зарево', 'start'),
+('[З]-[Ж]', 'З', 'закат', 'start'),
+('[З]-[Ж]', 'З', 'засветло', 'start'),
+('[З]-[Ж]', 'З', 'заря', 'start'),
+('[З]-[Ж]', 'З', 'замок', 'start'),
+('[З]-[Ж]', 'З', 'загар', 'start'),
+('[З]-[Ж]', 'З', 'завод', 'start'),
+('[З]-[Ж]', 'З', 'затея', 'start'),
+('[З]-[Ж]', 'З', 'забор', 'start'),
+('[З]-[Ж]', 'З', 'заставка', 'start'),
+('[З]-[Ж]', 'З', 'застава', 'start'),
+('[З]-[Ж]', 'З', 'забава', 'start'),
+('[З]-[Ж]', 'З', 'загадка', 'start'),
+('[З]-[Ж]', 'З', 'заноза', 'start'),
+('[З]-[Ж]', 'З', 'зуд', 'start'),
+('[З]-[Ж]', 'З', 'зуб', 'start'),
+('[З]-[Ж]', 'З', 'зубок', 'start'),
+('[З]-[Ж]', 'З', 'зубы', 'start'),
+('[З]-[Ж]', 'З', 'зоб', 'start'),
+('[З]-[Ж]', 'З', 'зов', 'start'),
+('[З]-[Ж]', 'З', 'зонт', 'start'),
+('[З]-[Ж]', 'З', 'зол', 'start'),
+('[З]-[Ж]', 'З', 'ваза', 'middle'),
+('[З]-[Ж]', 'З', 'база', 'middle'),
+('[З]-[Ж]', 'З', 'роза', 'middle'),
+('[З]-[Ж]', 'З', 'коза', 'middle'),
+('[З]-[Ж]', 'З', 'базар', 'middle'),
+('[З]-[Ж]', 'З', 'берёза', 'middle'),
+('[З]-[Ж]', 'З', 'польза', 'middle'),
+('[З]-[Ж]', 'З', 'фазан', 'middle'),
+('[З]-[Ж]', 'З', 'глаза', 'middle'),
+('[З]-[Ж]', 'З', 'пазуха', 'middle'),
+('[З]-[Ж]', 'З', 'газон', 'middle'),
+('[З]-[Ж]', 'З', 'узор', 'middle'),
+('[З]-[Ж]', 'З', 'козырёк', 'middle'),
+('[З]-[Ж]', 'З', 'музыка', 'middle'),
+('[З]-[Ж]', 'З', 'пузырёк', 'middle'),
+('[З]-[Ж]', 'З', 'называть', 'middle'),
+('[З]-[Ж]', 'З', 'блуза', 'middle'),
+('[З]-[Ж]', 'З', 'Лиза', 'middle'),
+('[З]-[Ж]', 'З', 'гроза', 'middle'),
+('[З]-[Ж]', 'З', 'дереза', 'middle'),
+('[З]-[Ж]', 'З', 'казак', 'middle'),
+('[З]-[Ж]', 'З', 'мозоль', 'middle'),
+('[З]-[Ж]', 'З', 'позолота', 'middle'),
+('[З]-[Ж]', 'З', 'доза', 'middle'),
+('[З]-[Ж]', 'З', 'знак', 'start'),
+('[З]-[Ж]', 'З', 'звон', 'start'),
+('[З]-[Ж]', 'З', 'звук', 'start'),
+('[З]-[Ж]', 'З', 'зной', 'start'),
+('[З]-[Ж]', 'З', 'здание', 'start'),
+('[З]-[Ж]', 'З', 'звание', 'start'),
+('[З]-[Ж]', 'З', 'звонок', 'start'),
+('[З]-[Ж]', 'З', 'звонить', 'start'),
+('[З]-[Ж]', 'З', 'звенеть', 'start'),
+('[З]-[Ж]', 'З', 'звучать', 'start'),
+('[З]-[Ж]', 'З', 'знания', 'start'),
+('[З]-[Ж]', 'З', 'звонкий', 'start'),
+('[З]-[Ж]', 'З', 'знакомый', 'start'),
+('[З]-[Ж]', 'З', 'знакомить', 'start'),
+('[З]-[Ж]', 'З', 'езда', 'middle'),
+('[З]-[Ж]', 'З', 'изба', 'middle'),
+('[З]-[Ж]', 'З', 'узда', 'middle'),
+('[З]-[Ж]', 'З', 'казна', 'middle'),
+('[З]-[Ж]', 'З', 'узнать', 'middle'),
+('[З]-[Ж]', 'З', 'поздно', 'middle'),
+('[З]-[Ж]', 'З', 'гнездо', 'middle'),
+('[З]-[Ж]', 'З', 'лезвие', 'middle'),
+('[З]-[Ж]', 'З', 'назвать', 'middle'),
+('[З]-[Ж]', 'З', 'обозный', 'middle'),
+('[З]-[Ж]', 'З', 'сквозной', 'middle'),
+('[З]-[Ж]', 'З', 'сквозняк', 'middle'),
+('[З]-[Ж]', 'З', 'изнывать', 'middle'),
+('[З]-[Ж]', 'З', 'опоздание', 'middle'),
+('[З]-[Ж]', 'Ж', 'жаба', 'start'),
+('[З]-[Ж]', 'Ж', 'жакет', 'start'),
+('[З]-[Ж]', 'Ж', 'жатва', 'start'),
+('[З]-[Ж]', 'Ж', 'жалоба', 'start'),
+('[З]-[Ж]', 'Ж', 'жалела', 'start'),
+('[З]-[Ж]', 'Ж', 'жаль', 'start'),
+('[З]-[Ж]', 'Ж', 'жало', 'start'),
+('[З]-[Ж]', 'Ж', 'живот', 'start'),
+('[З]-[Ж]', 'Ж', 'жидкий', 'start'),
+('[З]-[Ж]', 'Ж', 'живопись', 'start'),
+('[З]-[Ж]', 'Ж', 'жилет', 'start'),
+('[З]-[Ж]', 'Ж', 'жижа', 'start'),
+('[З]-[Ж]', 'Ж', 'желудок', 'start'),
+('[З]-[Ж]', 'Ж', 'жетон', 'start'),
+('[З]-[Ж]', 'Ж', 'желатин', 'start'),
+('[З]-[Ж]', 'Ж', 'желание', 'start'),
+('[З]-[Ж]', 'Ж', 'желе', 'start'),
+('[З]-[Ж]', 'Ж', 'жёсткий', 'start'),
+('[З]-[Ж]', 'Ж', 'жёлтый', 'start'),
+('[З]-[Ж]', 'Ж', 'желоб', 'start'),
+('[З]-[Ж]', 'Ж', 'желудь', 'start'),
+('[З]-[Ж]', 'Ж', 'жук', 'start'),
+('[З]-[Ж]', 'Ж', 'жуткий', 'start'),
+('[З]-[Ж]', 'Ж', 'лужа', 'middle'),
+('[З]-[Ж]', 'Ж', 'сажа', 'middle'),
+('[З]-[Ж]', 'Ж', 'стужа', 'middle'),
+('[З]-[Ж]', 'Ж', 'пижама', 'middle'),
+('[З]-[Ж]', 'Ж', 'кожа', 'middle'),
+('[З]-[Ж]', 'Ж', 'лыжи', 'middle'),
+('[З]-[Ж]', 'Ж', 'ножи', 'middle'),
+('[З]-[Ж]', 'Ж', 'пыжик', 'middle'),
+('[З]-[Ж]', 'Ж', 'лежи', 'middle'),
+('[З]-[Ж]', 'Ж', 'наживка', 'middle'),
+('[З]-[Ж]', 'Ж', 'ожог', 'middle'),
+('[З]-[Ж]', 'Ж', 'сапожок', 'middle'),
+('[З]-[Ж]', 'Ж', 'лужок', 'middle'),
+('[З]-[Ж]', 'Ж', 'лежу', 'middle'),
+('[З]-[Ж]', 'Ж', 'хожу', 'middle'),
+('[З]-[Ж]', 'Ж', 'вижу', 'middle'),
+('[З]-[Ж]', 'Ж', 'покажу', 'middle'),
+('[З]-[Ж]', 'Ж', 'мажу', 'middle'),
+('[З]-[Ж]', 'Ж', 'ниже', 'middle'),
+('[З]-[Ж]', 'Ж', 'ближе', 'middle'),
+('[З]-[Ж]', 'Ж', 'ежевика', 'middle'),
+('[З]-[Ж]', 'Ж', 'тоже', 'middle'),
+('[З]-[Ж]', 'Ж', 'уже', 'middle'),
+('[З]-[Ж]', 'Ж', 'нужно', 'middle'),
+('[З]-[Ж]', 'Ж', 'нужда', 'middle'),
+('[З]-[Ж]', 'Ж', 'важно', 'middle'),
+('[З]-[Ж]', 'Ж', 'можно', 'middle'),
+('[З]-[Ж]', 'Ж', 'ножны', 'middle'),
+('[З]-[Ж]', 'Ж', 'дождик', 'middle'),
+('[З]-[Ж]', 'Ж', 'лыжник', 'middle'),
+('[З]-[Ж]', 'Ж', 'важный', 'middle'),
+('[З]-[Ж]', 'Ж', 'каждый', 'middle'),
+('[З]-[Ж]', 'Ж', 'нижний', 'middle'),
+('[З]-[Ж]', 'Ж', 'ножницы', 'middle'),
+('[З]-[Ж]', 'Ж', 'таёжный', 'middle'),
+('[З]-[Ж]', 'Ж', 'ближний', 'middle'),
+('[З]-[Ж]', 'Ж', 'книжный', 'middle'),
+('[З]-[Ж]', 'Ж', 'надежда', 'middle'),
+('[З]-[Ж]', 'Ж', 'багажный', 'middle'),
+('[З]-[Ж]', 'Ж', 'художник', 'middle'),
+('[З]-[Ж]', 'Ж', 'булыжник', 'middle'),
+('[З]-[Ж]', 'Ж', 'вежливый', 'middle'),
+('[З]-[Ж]', 'Ж', 'пирожное', 'middle'),
+('[С]-[З]', 'С', 'сабля', 'start'),
+('[С]-[З]', 'С', 'сад', 'start'),
+('[С]-[З]', 'С', 'сайка', 'start'),
+('[С]-[З]', 'С', 'салат', 'start'),
+('[С]-[З]', 'С', 'сало', 'start'),
+('[С]-[З]', 'С', 'салфетка', 'start'),
+('[С]-[З]', 'С', 'сальто', 'start'),
+('[С]-[З]', 'С', 'салют', 'start'),
+('[С]-[З]', 'С', 'самолёт', 'start'),
+('[С]-[З]', 'С', 'сани', 'start'),
+('[С]-[З]', 'С', 'санитар', 'start'),
+('[С]-[З]', 'С', 'сапоги', 'start'),
+('[С]-[З]', 'С', 'сарафан', 'start'),
+('[С]-[З]', 'С', 'сахар', 'start'),
+('[С]-[З]', 'С', 'сода', 'start'),
+('[С]-[З]', 'С', 'сок', 'start'),
+('[С]-[З]', 'С', 'сокол', 'start'),
+('[С]-[З]', 'С', 'соль', 'start'),
+('[С]-[З]', 'С', 'сом', 'start'),
+('[С]-[З]', 'С', 'сон', 'start'),
+('[С]-[З]', 'С', 'сувенир', 'start'),
+('[С]-[З]', 'С', 'сугроб', 'start'),
+('[С]-[З]', 'С', 'суд', 'start'),
+('[С]-[З]', 'С', 'судно', 'start'),
+('[С]-[З]', 'С', 'сук', 'start'),
+('[С]-[З]', 'С', 'сукно', 'start'),
+('[С]-[З]', 'С', 'суп', 'start'),
+('[С]-[З]', 'С', 'сын', 'start'),
+('[С]-[З]', 'С', 'сыр', 'start'),
+('[С]-[З]', 'С', 'абрикос', 'end'),
+('[С]-[З]', 'С', 'автобус', 'end'),
+('[С]-[З]', 'С', 'брус', 'end'),
+('[С]-[З]', 'С', 'вес', 'end'),
+('[С]-[З]', 'С', 'вкус', 'end'),
+('[С]-[З]', 'С', 'вопрос', 'end'),
+('[С]-[З]', 'С', 'глобус', 'end'),
+('[С]-[З]', 'С', 'интерес', 'end'),
+('[С]-[З]', 'С', 'мусс', 'end'),
+('[С]-[З]', 'С', 'мыс', 'end'),
+('[С]-[З]', 'С', 'кактус', 'end'),
+('[С]-[З]', 'С', 'пас', 'end'),
+('[С]-[З]', 'С', 'лес', 'end'),
+('[С]-[З]', 'С', 'нос', 'end'),
+('[С]-[З]', 'С', 'парус', 'end'),
+('[С]-[З]', 'С', 'покос', 'end'),
+('[С]-[З]', 'С', 'ребус', 'end'),
+('[С]-[З]', 'С', 'рис', 'end'),
+('[С]-[З]', 'С', 'тёс', 'end'),
+('[С]-[З]', 'С', 'троллейбус', 'end'),
+('[С]-[З]', 'С', 'ус', 'end'),
+('[С]-[З]', 'С', 'фокус', 'end'),
+('[С]-[З]', 'С', 'бусы', 'middle'),
+('[С]-[З]', 'С', 'весы', 'middle'),
+('[С]-[З]', 'С', 'волосок', 'middle'),
+('[С]-[З]', 'С', 'досуг', 'middle'),
+('[С]-[З]', 'С', 'колбаса', 'middle'),
+('[С]-[З]', 'С', 'колёса', 'middle'),
+('[С]-[З]', 'С', 'коса', 'middle'),
+('[С]-[З]', 'С', 'краса', 'middle'),
+('[С]-[З]', 'С', 'кусок', 'middle'),
+('[С]-[З]', 'С', 'лесок', 'middle'),
+('[С]-[З]', 'С', 'лиса', 'middle'),
+('[С]-[З]', 'С', 'оса', 'middle'),
+('[С]-[З]', 'С', 'осока', 'middle'),
+('[С]-[З]', 'С', 'песок', 'middle'),
+('[С]-[З]', 'С', 'писатель', 'middle'),
+('[С]-[З]', 'С', 'полоса', 'middle'),
+('[С]-[З]', 'С', 'посадка', 'middle'),
+('[С]-[З]', 'С', 'посол', 'middle'),
+('[С]-[З]', 'С', 'посуда', 'middle'),
+('[С]-[З]', 'С', 'посылка', 'middle'),
+('[С]-[З]', 'С', 'роса', 'middle'),
+('[С]-[З]', 'С', 'фасоль', 'middle'),
+('[С]-[З]', 'С', 'стык', 'start'),
+('[С]-[З]', 'С', 'стыковка', 'start'),
+('[С]-[З]', 'С', 'стынет', 'start'),
+('[С]-[З]', 'С', 'остыть', 'middle'),
+('[С]-[З]', 'С', 'пустырь', 'middle'),
+('[С]-[З]', 'С', 'пустыня', 'middle'),
+('[С]-[З]', 'С', 'риск', 'middle'),
+('[С]-[З]', 'С', 'треск', 'middle'),
+('[С]-[З]', 'С', 'плеск', 'middle'),
+('[С]-[З]', 'С', 'блеск', 'middle'),
+('[С]-[З]', 'С', 'лоск', 'middle'),
+('[С]-[З]', 'С', 'киоск', 'middle'),
+('[С]-[З]', 'С', 'пуск', 'middle'),
+('[С]-[З]', 'З', 'зал', 'start'),
+('[С]-[З]', 'З', 'завал', 'start'),
+('[С]-[З]', 'З', 'задира', 'start'),
+('[С]-[З]', 'З', 'зарево', 'start'),
+('[С]-[З]', 'З', 'закат', 'start'),
+('[С]-[З]', 'З', 'засветло', 'start'),
+('[С]-[З]', 'З', 'заря', 'start'),
+('[С]-[З]', 'З', 'замок', 'start'),
+('[С]-[З]', 'З', 'загар', 'start'),
+('[С]-[З]', 'З', 'завод', 'start'),
+('[С]-[З]', 'З', 'затея', 'start'),
+('[С]-[З]', 'З', 'забор', 'start'),
+('[С]-[З]', 'З', 'заставка', 'start'),
+('[С]-[З]', 'З', 'застава', 'start'),
+('[С]-[З]', 'З', 'забава', 'start'),
+('[С]-[З]', 'З', 'загадка', 'start'),
+('[С]-[З]', 'З', 'заноза', 'start'),
+('[С]-[З]', 'З', 'зуд', 'start'),
+('[С]-[З]', 'З', 'зуб', 'start'),
+('[С]-[З]', 'З', 'зубок', 'start'),
+('[С]-[З]', 'З', 'зубы', 'start'),
+('[С]-[З]', 'З', 'зоб', 'start'),
+('[С]-[З]', 'З', 'зов', 'start'),
+('[С]-[З]', 'З', 'зонт', 'start'),
+('[С]-[З]', 'З', 'зол', 'start'),
+('[С]-[З]', 'З', 'ваза', 'middle'),
+('[С]-[З]', 'З', 'база', 'middle'),
+('[С]-[З]', 'З', 'роза', 'middle'),
+('[С]-[З]', 'З', 'коза', 'middle'),
+('[С]-[З]', 'З', 'базар', 'middle'),
+('[С]-[З]', 'З', 'берёза', 'middle'),
+('[С]-[З]', 'З', 'польза', 'middle'),
+('[С]-[З]', 'З', 'фазан', 'middle'),
+('[С]-[З]', 'З', 'глаза', 'middle'),
+('[С]-[З]', 'З', 'пазуха', 'middle'),
+('[С]-[З]', 'З', 'газон', 'middle'),
+('[С]-[З]', 'З', 'узор', 'middle'),
+('[С]-[З]', 'З', 'козырёк', 'middle'),
+('[С]-[З]', 'З', 'музыка', 'middle'),
+('[С]-[З]', 'З', 'пузырёк', 'middle'),
+('[С]-[З]', 'З', 'называть', 'middle'),
+('[С]-[З]', 'З', 'блуза', 'middle'),
+('[С]-[З]', 'З', 'Лиза', 'middle'),
+('[С]-[З]', 'З', 'гроза', 'middle'),
+('[С]-[З]', 'З', 'дереза', 'middle'),
+('[С]-[З]', 'З', 'казак', 'middle'),
+('[С]-[З]', 'З', 'мозоль', 'middle'),
+('[С]-[З]', 'З', 'позолота', 'middle'),
+('[С]-[З]', 'З', 'доза', 'middle'),
+('[С]-[З]', 'З', 'знак', 'start'),
+('[С]-[З]', 'З', 'звон', 'start'),
+('[С]-[З]', 'З', 'звук', 'start'),
+('[С]-[З]', 'З', 'зной', 'start'),
+('[С]-[З]', 'З', 'здание', 'start'),
+('[С]-[З]', 'З', 'звание', 'start'),
+('[С]-[З]', 'З', 'звонок', 'start'),
+('[С]-[З]', 'З', 'звонить', 'start'),
+('[С]-[З]', 'З', 'звенеть', 'start'),
+('[С]-[З]', 'З', 'звучать', 'start'),
+('[С]-[З]', 'З', 'знания', 'start'),
+('[С]-[З]', 'З', 'звонкий', 'start'),
+('[С]-[З]', 'З', 'знакомый', 'start'),
+('[С]-[З]', 'З', 'знакомить', 'start'),
+('[С]-[З]', 'З', 'езда', 'middle'),
+('[С]-[З]', 'З', 'изба', 'middle'),
+('[С]-[З]', 'З', 'узда', 'middle'),
+('[С]-[З]', 'З', 'казна', 'middle'),
+('[С]-[З]', 'З', 'узнать', 'middle'),
+('[С]-[З]', 'З', 'поздно', 'middle'),
+('[С]-[З]', 'З', 'гнездо', 'middle'),
+('[С]-[З]', 'З', 'лезвие', 'middle'),
+('[С]-[З]', 'З', 'назвать', 'middle'),
+('[С]-[З]', 'З', 'обозный', 'middle'),
+('[С]-[З]', 'З', 'сквозной', 'middle'),
+('[С]-[З]', 'З', 'сквозняк', 'middle'),
+('[С]-[З]', 'З', 'изнывать', 'middle'),
+('[С]-[З]', 'З', 'опоздание', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'шаг', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шайба', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шапка', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шар', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шарф', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шахматы', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шахта', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шея', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шёлк', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шёпот', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шило', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шина', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шорох', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шуба', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шум', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шуруп', 'start'),
+('[Ш]-[Ж]', 'Ш', 'шут', 'start'),
+('[Ш]-[Ж]', 'Ш', 'горошина', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'гребешок', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'калоши', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'камыши', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'каша', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'крыша', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'ландыши', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'лошадка', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'малыши', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'машина', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'мешок', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'мишень', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'мышата', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'мыши', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'мышонок', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'ноша', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'ошейник', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'ошибка', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'петушок', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'пушок', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'ремешок', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'решение', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'тишина', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'ушанка', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'уши', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'ушиб', 'middle'),
+('[Ш]-[Ж]', 'Ш', 'гуляш', 'end'),
+('[Ш]-[Ж]', 'Ш', 'детёныш', 'end'),
+('[Ш]-[Ж]', 'Ш', 'камыш', 'end'),
+('[Ш]-[Ж]', 'Ш', 'карандаш', 'end'),
+('[Ш]-[Ж]', 'Ш', 'ландыш', 'end'),
+('[Ш]-[Ж]', 'Ш', 'малыш', 'end'),
+('[Ш]-[Ж]', 'Ш', 'мышь', 'end'),
+('[Ш]-[Ж]', 'Ш', 'мякиш', 'end'),
+('[Ш]-[Ж]', 'Ш', 'тушь', 'end'),
+('[Ш]-[Ж]', 'Ш', 'финиш', 'end'),
+('[Ш]-[Ж]', 'Ж', 'жаба', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жакет', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жатва', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жалоба', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жалела', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жаль', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жало', 'start'),
+('[Ш]-[Ж]', 'Ж', 'живот', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жидкий', 'start'),
+('[Ш]-[Ж]', 'Ж', 'живопись', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жилет', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жижа', 'start'),
+('[Ш]-[Ж]', 'Ж', 'желудок', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жетон', 'start'),
+('[Ш]-[Ж]', 'Ж', 'желатин', 'start'),
+('[Ш]-[Ж]', 'Ж', 'желание', 'start'),
+('[Ш]-[Ж]', 'Ж', 'желе', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жёсткий', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жёлтый', 'start'),
+('[Ш]-[Ж]', 'Ж', 'желоб', 'start'),
+('[Ш]-[Ж]', 'Ж', 'желудь', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жук', 'start'),
+('[Ш]-[Ж]', 'Ж', 'жуткий', 'start'),
+('[Ш]-[Ж]', 'Ж', 'лужа', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'сажа', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'стужа', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'пижама', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'кожа', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'лыжи', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ножи', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'пыжик', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'лежи', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'наживка', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ожог', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'сапожок', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'лужок', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'лежу', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'хожу', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'вижу', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'покажу', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'мажу', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ниже', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ближе', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ежевика', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'тоже', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'уже', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'нужно', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'нужда', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'важно', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'можно', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ножны', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'дождик', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'лыжник', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'важный', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'каждый', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'нижний', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ножницы', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'таёжный', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'ближний', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'книжный', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'надежда', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'багажный', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'художник', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'булыжник', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'вежливый', 'middle'),
+('[Ш]-[Ж]', 'Ж', 'пирожное', 'middle'),
+('[С'']-[Щ]', 'Сь', 'сено', 'start'),
+('[С'']-[Щ]', 'Сь', 'сель', 'start'),
+('[С'']-[Щ]', 'Сь', 'сельдь', 'start'),
+('[С'']-[Щ]', 'Сь', 'семеро', 'start'),
+('[С'']-[Щ]', 'Сь', 'серый', 'start'),
+('[С'']-[Щ]', 'Сь', 'седенький', 'start'),
+('[С'']-[Щ]', 'Сь', 'синтетика', 'start'),
+('[С'']-[Щ]', 'Сь', 'синус', 'start'),
+('[С'']-[Щ]', 'Сь', 'синь', 'start'),
+('[С'']-[Щ]', 'Сь', 'синьор', 'start'),
+('[С'']-[Щ]', 'Сь', 'синяк', 'start'),
+('[С'']-[Щ]', 'Сь', 'сипеть', 'start'),
+('[С'']-[Щ]', 'Сь', 'сёмга', 'start'),
+('[С'']-[Щ]', 'Сь', 'Сёма', 'start'),
+('[С'']-[Щ]', 'Сь', 'сёла', 'start'),
+('[С'']-[Щ]', 'Сь', 'сюда', 'start'),
+('[С'']-[Щ]', 'Сь', 'сюита', 'start'),
+('[С'']-[Щ]', 'Сь', 'сюртук', 'start'),
+('[С'']-[Щ]', 'Сь', 'сюсюкать', 'start'),
+('[С'']-[Щ]', 'Сь', 'сюрприз', 'start'),
+('[С'']-[Щ]', 'Сь', 'гусята', 'middle'),
+('[С'']-[Щ]', 'Сь', 'косят', 'middle'),
+('[С'']-[Щ]', 'Сь', 'весят', 'middle'),
+('[С'']-[Щ]', 'Сь', 'носят', 'middle'),
+('[С'']-[Щ]', 'Сь', 'десятый', 'middle'),
+('[С'']-[Щ]', 'Сь', 'косяк', 'middle'),
+('[С'']-[Щ]', 'Сь', 'десяток', 'middle'),
+('[С'']-[Щ]', 'Сь', 'лосятина', 'middle'),
+('[С'']-[Щ]', 'Сь', 'росянка', 'middle'),
+('[С'']-[Щ]', 'Сь', 'косить', 'middle'),
+('[С'']-[Щ]', 'Сь', 'спросить', 'middle'),
+('[С'']-[Щ]', 'Сь', 'наквасить', 'middle'),
+('[С'']-[Щ]', 'Сь', 'наседать', 'middle'),
+('[С'']-[Щ]', 'Сь', 'насекомое', 'middle'),
+('[С'']-[Щ]', 'Сь', 'население', 'middle'),
+('[С'']-[Щ]', 'Сь', 'насилие', 'middle'),
+('[С'']-[Щ]', 'Сь', 'насилу', 'middle'),
+('[С'']-[Щ]', 'Сь', 'насильник', 'middle'),
+('[С'']-[Щ]', 'Сь', 'месить', 'middle'),
+('[С'']-[Щ]', 'Сь', 'просить', 'middle'),
+('[С'']-[Щ]', 'Сь', 'укусить', 'middle'),
+('[С'']-[Щ]', 'Сь', 'погасить', 'middle'),
+('[С'']-[Щ]', 'Сь', 'осина', 'middle'),
+('[С'']-[Щ]', 'Сь', 'косичка', 'middle'),
+('[С'']-[Щ]', 'Сь', 'лисичка', 'middle'),
+('[С'']-[Щ]', 'Сь', 'бассейн', 'middle'),
+('[С'']-[Щ]', 'Сь', 'весенний', 'middle'),
+('[С'']-[Щ]', 'Сь', 'осенний', 'middle'),
+('[С'']-[Щ]', 'Сь', 'непоседа', 'middle'),
+('[С'']-[Щ]', 'Сь', 'брось', 'end'),
+('[С'']-[Щ]', 'Сь', 'гусь', 'end'),
+('[С'']-[Щ]', 'Сь', 'мчусь', 'end'),
+('[С'']-[Щ]', 'Сь', 'весь', 'end'),
+('[С'']-[Щ]', 'Сь', 'повесь', 'end'),
+('[С'']-[Щ]', 'Сь', 'торопитесь', 'end'),
+('[С'']-[Щ]', 'Сь', 'берегись', 'end'),
+('[С'']-[Щ]', 'Сь', 'мазь', NULL),
+('[С'']-[Щ]', 'Сь', 'грязь', NULL),
+('[С'']-[Щ]', 'Сь', 'крась', 'end'),
+('[С'']-[Щ]', 'Сь', 'карась', 'end'),
+('[С'']-[Щ]', 'Сь', 'ось', 'end'),
+('[С'']-[Щ]', 'Сь', 'авось', 'end'),
+('[С'']-[Щ]', 'Сь', 'здесь', 'end'),
+('[С'']-[Щ]', 'Сь', 'смесь', 'end'),
+('[С'']-[Щ]', 'Сь', 'вкось', 'end'),
+('[С'']-[Щ]', 'Сь', 'Люська', 'middle'),
+('[С'']-[Щ]', 'Сь', 'Муська', 'middle'),
+('[С'']-[Щ]', 'Сь', 'Дуська', 'middle'),
+('[С'']-[Щ]', 'Сь', 'Маруська', 'middle'),
+('[С'']-[Щ]', 'Сь', 'Моська', 'middle'),
+('[С'']-[Щ]', 'Сь', 'письменный', 'middle'),
+('[С'']-[Щ]', 'Сь', 'овсянка', 'middle'),
+('[С'']-[Щ]', 'Сь', 'отсюда', 'middle'),
+('[С'']-[Щ]', 'Сь', 'Ксюша', 'middle'),
+('[С'']-[Щ]', 'Сь', 'апельсин', 'middle'),
+('[С'']-[Щ]', 'Сь', 'такси', 'middle'),
+('[С'']-[Щ]', 'Сь', 'персик', 'middle'),
+('[С'']-[Щ]', 'Сь', 'лось', 'end'),
+('[С'']-[Щ]', 'Сь', 'рысь', 'end'),
+('[С'']-[Щ]', 'Сь', 'брысь', 'end'),
+('[С'']-[Щ]', 'Сь', 'всё', 'middle'),
+('[С'']-[Щ]', 'Щ', 'щавель', 'start'),
+('[С'']-[Щ]', 'Щ', 'щека', 'start'),
+('[С'']-[Щ]', 'Щ', 'щебень', 'start'),
+('[С'']-[Щ]', 'Щ', 'щенок', 'start'),
+('[С'']-[Щ]', 'Щ', 'щетина', 'start'),
+('[С'']-[Щ]', 'Щ', 'щебетать', 'start'),
+('[С'']-[Щ]', 'Щ', 'щекотать', 'start'),
+('[С'']-[Щ]', 'Щ', 'щётка', 'start'),
+('[С'']-[Щ]', 'Щ', 'щёки', 'start'),
+('[С'']-[Щ]', 'Щ', 'щёлкать', 'start'),
+('[С'']-[Щ]', 'Щ', 'щелочь', 'start'),
+('[С'']-[Щ]', 'Щ', 'щука', 'start'),
+('[С'']-[Щ]', 'Щ', 'щуп', 'start'),
+('[С'']-[Щ]', 'Щ', 'щит', 'start'),
+('[С'']-[Щ]', 'Щ', 'щи', 'start'),
+('[С'']-[Щ]', 'Щ', 'щипать', 'start'),
+('[С'']-[Щ]', 'Щ', 'щипцы', 'start'),
+('[С'']-[Щ]', 'Щ', 'щипание', 'start'),
+('[С'']-[Щ]', 'Щ', 'угощать', 'middle'),
+('[С'']-[Щ]', 'Щ', 'пищать', 'middle'),
+('[С'']-[Щ]', 'Щ', 'вещать', 'middle'),
+('[С'']-[Щ]', 'Щ', 'дощатый', 'middle'),
+('[С'']-[Щ]', 'Щ', 'замечать', 'middle'),
+('[С'']-[Щ]', 'Щ', 'ущелье', 'middle'),
+('[С'']-[Щ]', 'Щ', 'ищейка', 'middle'),
+('[С'']-[Щ]', 'Щ', 'угощение', 'middle'),
+('[С'']-[Щ]', 'Щ', 'мощеный', 'middle'),
+('[С'']-[Щ]', 'Щ', 'лущеный', 'middle'),
+('[С'']-[Щ]', 'Щ', 'блещут', 'middle'),
+('[С'']-[Щ]', 'Щ', 'плещут', 'middle'),
+('[С'']-[Щ]', 'Щ', 'трещу', 'middle'),
+('[С'']-[Щ]', 'Щ', 'ищут', 'middle'),
+('[С'']-[Щ]', 'Щ', 'общий', 'middle'),
+('[С'']-[Щ]', 'Щ', 'кладовщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'ящик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'вещи', 'middle'),
+('[С'']-[Щ]', 'Щ', 'овощи', 'middle'),
+('[С'']-[Щ]', 'Щ', 'упаковщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'зимовщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'хищник', 'middle'),
+('[С'']-[Щ]', 'Щ', 'изящный', 'middle'),
+('[С'']-[Щ]', 'Щ', 'помощник', 'middle'),
+('[С'']-[Щ]', 'Щ', 'мощный', 'middle'),
+('[С'']-[Щ]', 'Щ', 'овощной', 'middle'),
+('[С'']-[Щ]', 'Щ', 'насущный', 'middle'),
+('[С'']-[Щ]', 'Щ', 'банщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'взломщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'музейщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'пильщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'натурщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'ныряльщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'мойщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'уборщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'каменщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'гонщик', 'middle'),
+('[С'']-[Щ]', 'Щ', 'выдумщик', 'middle'),
+('[С'']-[З'']', 'Сь', 'сено', 'start'),
+('[С'']-[З'']', 'Сь', 'сель', 'start'),
+('[С'']-[З'']', 'Сь', 'сельдь', 'start'),
+('[С'']-[З'']', 'Сь', 'семеро', 'start'),
+('[С'']-[З'']', 'Сь', 'серый', 'start'),
+('[С'']-[З'']', 'Сь', 'седенький', 'start'),
+('[С'']-[З'']', 'Сь', 'синтетика', 'start'),
+('[С'']-[З'']', 'Сь', 'синус', 'start'),
+('[С'']-[З'']', 'Сь', 'синь', 'start'),
+('[С'']-[З'']', 'Сь', 'синьор', 'start'),
+('[С'']-[З'']', 'Сь', 'синяк', 'start'),
+('[С'']-[З'']', 'Сь', 'сипеть', 'start'),
+('[С'']-[З'']', 'Сь', 'сёмга', 'start'),
+('[С'']-[З'']', 'Сь', 'Сёма', 'start'),
+('[С'']-[З'']', 'Сь', 'сёла', 'start'),
+('[С'']-[З'']', 'Сь', 'сюда', 'start'),
+('[С'']-[З'']', 'Сь', 'сюита', 'start'),
+('[С'']-[З'']', 'Сь', 'сюртук', 'start'),
+('[С'']-[З'']', 'Сь', 'сюсюкать', 'start'),
+('[С'']-[З'']', 'Сь', 'сюрприз', 'start'),
+('[С'']-[З'']', 'Сь', 'гусята', 'middle'),
+('[С'']-[З'']', 'Сь', 'косят', 'middle'),
+('[С'']-[З'']', 'Сь', 'весят', 'middle'),
+('[С'']-[З'']', 'Сь', 'носят', 'middle'),
+('[С'']-[З'']', 'Сь', 'десятый', 'middle'),
+('[С'']-[З'']', 'Сь', 'косяк', 'middle'),
+('[С'']-[З'']', 'Сь', 'десяток', 'middle'),
+('[С'']-[З'']', 'Сь', 'лосятина', 'middle'),
+('[С'']-[З'']', 'Сь', 'росянка', 'middle'),
+('[С'']-[З'']', 'Сь', 'косить', 'middle'),
+('[С'']-[З'']', 'Сь', 'спросить', 'middle'),
+('[С'']-[З'']', 'Сь', 'наквасить', 'middle'),
+('[С'']-[З'']', 'Сь', 'наседать', 'middle'),
+('[С'']-[З'']', 'Сь', 'насекомое', 'middle'),
+('[С'']-[З'']', 'Сь', 'население', 'middle'),
+('[С'']-[З'']', 'Сь', 'насилие', 'middle'),
+('[С'']-[З'']', 'Сь', 'насилу', 'middle'),
+('[С'']-[З'']', 'Сь', 'насильник', 'middle'),
+('[С'']-[З'']', 'Сь', 'месить', 'middle'),
+('[С'']-[З'']', 'Сь', 'просить', 'middle'),
+('[С'']-[З'']', 'Сь', 'укусить', 'middle'),
+('[С'']-[З'']', 'Сь', 'погасить', 'middle'),
+('[С'']-[З'']', 'Сь', 'осина', 'middle'),
+('[С'']-[З'']', 'Сь', 'косичка', 'middle'),
+('[С'']-[З'']', 'Сь', 'лисичка', 'middle'),
+('[С'']-[З'']', 'Сь', 'бассейн', 'middle'),
+('[С'']-[З'']', 'Сь', 'весенний', 'middle'),
+('[С'']-[З'']', 'Сь', 'осенний', 'middle'),
+('[С'']-[З'']', 'Сь', 'непоседа', 'middle'),
+('[С'']-[З'']', 'Сь', 'брось', 'end'),
+('[С'']-[З'']', 'Сь', 'гусь', 'end'),
+('[С'']-[З'']', 'Сь', 'мчусь', 'end'),
+('[С'']-[З'']', 'Сь', 'весь', 'end'),
+('[С'']-[З'']', 'Сь', 'повесь', 'end'),
+('[С'']-[З'']', 'Сь', 'торопитесь', 'end'),
+('[С'']-[З'']', 'Сь', 'берегись', 'end'),
+('[С'']-[З'']', 'Сь', 'мазь', NULL),
+('[С'']-[З'']', 'Сь', 'грязь', NULL),
+('[С'']-[З'']', 'Сь', 'крась', 'end'),
+('[С'']-[З'']', 'Сь', 'карась', 'end'),
+('[С'']-[З'']', 'Сь', 'ось', 'end'),
+('[С'']-[З'']', 'Сь', 'авось', 'end'),
+('[С'']-[З'']', 'Сь', 'здесь', 'end'),
+('[С'']-[З'']', 'Сь', 'смесь', 'end'),
+('[С'']-[З'']', 'Сь', 'вкось', 'end'),
+('[С'']-[З'']', 'Сь', 'Люська', 'middle'),
+('[С'']-[З'']', 'Сь', 'Муська', 'middle'),
+('[С'']-[З'']', 'Сь', 'Дуська', 'middle'),
+('[С'']-[З'']', 'Сь', 'Маруська', 'middle'),
+('[С'']-[З'']', 'Сь', 'Моська', 'middle'),
+('[С'']-[З'']', 'Сь', 'письменный', 'middle'),
+('[С'']-[З'']', 'Сь', 'овсянка', 'middle'),
+('[С'']-[З'']', 'Сь', 'отсюда', 'middle'),
+('[С'']-[З'']', 'Сь', 'Ксюша', 'middle'),
+('[С'']-[З'']', 'Сь', 'апельсин', 'middle'),
+('[С'']-[З'']', 'Сь', 'такси', 'middle'),
+('[С'']-[З'']', 'Сь', 'персик', 'middle'),
+('[С'']-[З'']', 'Сь', 'лось', 'end'),
+('[С'']-[З'']', 'Сь', 'рысь', 'end'),
+('[С'']-[З'']', 'Сь', 'брысь', 'end'),
+('[С'']-[З'']', 'Сь', 'всё', 'middle'),
+('[С'']-[З'']', 'Зь', 'зяблик', 'start'),
+('[С'']-[З'']', 'Зь', 'зябнуть', 'start'),
+('[С'']-[З'']', 'Зь', 'зябь', 'start'),
+('[С'']-[З'']', 'Зь', 'зять', 'start'),
+('[С'']-[З'']', 'Зь', 'зебра', 'start'),
+('[С'']-[З'']', 'Зь', 'зев', 'start'),
+('[С'']-[З'']', 'Зь', 'зевать', 'start'),
+('[С'']-[З'']', 'Зь', 'земский', 'start'),
+('[С'']-[З'']', 'Зь', 'зеркало', 'start'),
+('[С'']-[З'']', 'Зь', 'зернистый', 'start'),
+('[С'']-[З'']', 'Зь', 'зелень', 'start'),
+('[С'']-[З'']', 'Зь', 'зелёнка', 'start'),
+('[С'']-[З'']', 'Зь', 'зелье', 'start'),
+('[С'']-[З'']', 'Зь', 'земли', 'start'),
+('[С'']-[З'']', 'Зь', 'зерно', 'start'),
+('[С'']-[З'']', 'Зь', 'зенит', 'start'),
+('[С'']-[З'']', 'Зь', 'хозяин', 'middle'),
+('[С'']-[З'']', 'Зь', 'нельзя', 'middle'),
+('[С'']-[З'']', 'Зь', 'друзья', 'middle'),
+('[С'']-[З'']', 'Зь', 'козявка', 'middle'),
+('[С'']-[З'']', 'Зь', 'озяб', 'middle'),
+('[С'']-[З'']', 'Зь', 'изящный', 'middle'),
+('[С'']-[З'']', 'Зь', 'грозят', 'middle'),
+('[С'']-[З'']', 'Зь', 'возят', 'middle'),
+('[С'']-[З'']', 'Зь', 'магазин', 'middle'),
+('[С'']-[З'']', 'Зь', 'бузина', 'middle'),
+('[С'']-[З'']', 'Зь', 'резина', 'middle'),
+('[С'']-[З'']', 'Зь', 'лазить', 'middle'),
+('[С'']-[З'']', 'Зь', 'нагрузить', 'middle'),
+('[С'']-[З'']', 'Зь', 'грузить', 'middle'),
+('[С'']-[З'']', 'Зь', 'физик', 'middle'),
+('[С'']-[З'']', 'Зь', 'физика', 'middle'),
+('[С'']-[З'']', 'Зь', 'физиолог', 'middle'),
+('[С'']-[З'']', 'Зь', 'фантазия', 'middle'),
+('[С'']-[З'']', 'Зь', 'Грузия', 'middle'),
+('[С'']-[З'']', 'Зь', 'Бразилия', 'middle'),
+('[С'']-[З'']', 'Зь', 'погрузить', 'middle'),
+('[С'']-[З'']', 'Зь', 'подморозить', 'middle'),
+('[С'']-[З'']', 'Зь', 'козерог', 'middle'),
+('[С'']-[З'']', 'Зь', 'корзинка', 'middle'),
+('[С'']-[З'']', 'Зь', 'кузина', 'middle'),
+('[С'']-[З'']', 'Зь', 'Зина', 'start'),
+('[С'']-[З'']', 'Зь', 'низина', 'middle'),
+('[С'']-[З'']', 'Зь', 'зимний', 'start'),
+('[С'']-[З'']', 'Зь', 'озимая', 'middle'),
+('[С'']-[З'']', 'Зь', 'возить', 'middle'),
+('[С'']-[З'']', 'Зь', 'зима', 'start'),
+('[С'']-[З'']', 'Зь', 'Тузик', 'middle'),
+('[С'']-[З'']', 'Зь', 'дивизия', 'middle'),
+('[С'']-[З'']', 'Зь', 'зимовать', 'start'),
+('[С'']-[З'']', 'Зь', 'морозить', 'middle'),
+('[С'']-[З'']', 'Зь', 'корзина', 'middle'),
+('[С'']-[З'']', 'Зь', 'Мурзилка', 'middle'),
+('[С'']-[З'']', 'Зь', 'наземь', 'middle'),
+('[С'']-[З'']', 'Зь', 'озеро', 'middle'),
+('[С'']-[З'']', 'Зь', 'возьми', 'middle'),
+('[С'']-[З'']', 'Зь', 'полозья', 'middle'),
+('[С'']-[З'']', 'Зь', 'Кузьма', 'middle'),
+('[С'']-[З'']', 'Зь', 'друзья', 'middle'),
+('[Ц]-[С]', 'Ц', 'цапля', 'start'),
+('[Ц]-[С]', 'Ц', 'цех', 'start'),
+('[Ц]-[С]', 'Ц', 'целый', 'start'),
+('[Ц]-[С]', 'Ц', 'цена', 'start'),
+('[Ц]-[С]', 'Ц', 'цель', 'start'),
+('[Ц]-[С]', 'Ц', 'цепь', 'start'),
+('[Ц]-[С]', 'Ц', 'цукат', 'start'),
+('[Ц]-[С]', 'Ц', 'цитата', 'start'),
+('[Ц]-[С]', 'Ц', 'цокать', 'start'),
+('[Ц]-[С]', 'Ц', 'цинга', 'start'),
+('[Ц]-[С]', 'Ц', 'цыплёнок', 'start'),
+('[Ц]-[С]', 'Ц', 'цыганка', 'start'),
+('[Ц]-[С]', 'Ц', 'цинковый', 'start'),
+('[Ц]-[С]', 'Ц', 'лица', 'middle'),
+('[Ц]-[С]', 'Ц', 'теплица', 'middle'),
+('[Ц]-[С]', 'Ц', 'лицо', 'middle'),
+('[Ц]-[С]', 'Ц', 'мыльница', 'middle'),
+('[Ц]-[С]', 'Ц', 'салфетница', 'middle'),
+('[Ц]-[С]', 'Ц', 'больница', 'middle'),
+('[Ц]-[С]', 'Ц', 'мельница', 'middle'),
+('[Ц]-[С]', 'Ц', 'пыльца', 'middle'),
+('[Ц]-[С]', 'Ц', 'кольцо', 'middle'),
+('[Ц]-[С]', 'Ц', 'пунцовый', 'middle'),
+('[Ц]-[С]', 'Ц', 'овцы', 'middle'),
+('[Ц]-[С]', 'Ц', 'отцы', 'middle'),
+('[Ц]-[С]', 'Ц', 'гонцы', 'middle'),
+('[Ц]-[С]', 'Ц', 'певцы', 'middle'),
+('[Ц]-[С]', 'Ц', 'концы', 'middle'),
+('[Ц]-[С]', 'Ц', 'умница', 'middle'),
+('[Ц]-[С]', 'Ц', 'рукавица', 'middle'),
+('[Ц]-[С]', 'Ц', 'пуговица', 'middle'),
+('[Ц]-[С]', 'Ц', 'акация', 'middle'),
+('[Ц]-[С]', 'Ц', 'авиация', 'middle'),
+('[Ц]-[С]', 'Ц', 'луковица', 'middle'),
+('[Ц]-[С]', 'Ц', 'боец', 'end'),
+('[Ц]-[С]', 'Ц', 'отец', 'end'),
+('[Ц]-[С]', 'Ц', 'конец', 'end'),
+('[Ц]-[С]', 'Ц', 'молодец', 'end'),
+('[Ц]-[С]', 'Ц', 'певец', 'end'),
+('[Ц]-[С]', 'Ц', 'леденец', 'end'),
+('[Ц]-[С]', 'Ц', 'колодец', 'end'),
+('[Ц]-[С]', 'Ц', 'индеец', 'end'),
+('[Ц]-[С]', 'Ц', 'птенец', 'end'),
+('[Ц]-[С]', 'Ц', 'пловец', 'end'),
+('[Ц]-[С]', 'Ц', 'китаец', 'end'),
+('[Ц]-[С]', 'Ц', 'мизинец', 'end'),
+('[Ц]-[С]', 'Ц', 'заяц', 'end'),
+('[Ц]-[С]', 'Ц', 'паяц', 'end'),
+('[Ц]-[С]', 'Ц', 'месяц', 'end'),
+('[Ц]-[С]', 'Ц', 'цвет', 'start'),
+('[Ц]-[С]', 'Ц', 'цветник', 'start'),
+('[Ц]-[С]', 'Ц', 'семицветик', 'middle'),
+('[Ц]-[С]', 'Ц', 'цвести', 'start'),
+('[Ц]-[С]', 'Ц', 'цветение', 'start'),
+('[Ц]-[С]', 'Ц', 'самоцветы', 'middle'),
+('[Ц]-[С]', 'Ц', 'боцман', 'middle'),
+('[Ц]-[С]', 'Ц', 'сцена', 'middle'),
+('[Ц]-[С]', 'Ц', 'цветик', 'start'),
+('[Ц]-[С]', 'С', 'сабля', 'start'),
+('[Ц]-[С]', 'С', 'сад', 'start'),
+('[Ц]-[С]', 'С', 'сайка', 'start'),
+('[Ц]-[С]', 'С', 'салат', 'start'),
+('[Ц]-[С]', 'С', 'сало', 'start'),
+('[Ц]-[С]', 'С', 'салфетка', 'start'),
+('[Ц]-[С]', 'С', 'сальто', 'start'),
+('[Ц]-[С]', 'С', 'салют', 'start'),
+('[Ц]-[С]', 'С', 'самолёт', 'start'),
+('[Ц]-[С]', 'С', 'сани', 'start'),
+('[Ц]-[С]', 'С', 'санитар', 'start'),
+('[Ц]-[С]', 'С', 'сапоги', 'start'),
+('[Ц]-[С]', 'С', 'сарафан', 'start'),
+('[Ц]-[С]', 'С', 'сахар', 'start'),
+('[Ц]-[С]', 'С', 'сода', 'start'),
+('[Ц]-[С]', 'С', 'сок', 'start'),
+('[Ц]-[С]', 'С', 'сокол', 'start'),
+('[Ц]-[С]', 'С', 'соль', 'start'),
+('[Ц]-[С]', 'С', 'сом', 'start'),
+('[Ц]-[С]', 'С', 'сон', 'start'),
+('[Ц]-[С]', 'С', 'сувенир', 'start'),
+('[Ц]-[С]', 'С', 'сугроб', 'start'),
+('[Ц]-[С]', 'С', 'суд', 'start'),
+('[Ц]-[С]', 'С', 'судно', 'start'),
+('[Ц]-[С]', 'С', 'сук', 'start'),
+('[Ц]-[С]', 'С', 'сукно', 'start'),
+('[Ц]-[С]', 'С', 'суп', 'start'),
+('[Ц]-[С]', 'С', 'сын', 'start'),
+('[Ц]-[С]', 'С', 'сыр', 'start'),
+('[Ц]-[С]', 'С', 'абрикос', 'end'),
+('[Ц]-[С]', 'С', 'автобус', 'end'),
+('[Ц]-[С]', 'С', 'брус', 'end'),
+('[Ц]-[С]', 'С', 'вес', 'end'),
+('[Ц]-[С]', 'С', 'вкус', 'end'),
+('[Ц]-[С]', 'С', 'вопрос', 'end'),
+('[Ц]-[С]', 'С', 'глобус', 'end'),
+('[Ц]-[С]', 'С', 'интерес', 'end'),
+('[Ц]-[С]', 'С', 'мусс', 'end'),
+('[Ц]-[С]', 'С', 'мыс', 'end'),
+('[Ц]-[С]', 'С', 'кактус', 'end'),
+('[Ц]-[С]', 'С', 'пас', 'end'),
+('[Ц]-[С]', 'С', 'лес', 'end'),
+('[Ц]-[С]', 'С', 'нос', 'end'),
+('[Ц]-[С]', 'С', 'парус', 'end'),
+('[Ц]-[С]', 'С', 'покос', 'end'),
+('[Ц]-[С]', 'С', 'ребус', 'end'),
+('[Ц]-[С]', 'С', 'рис', 'end'),
+('[Ц]-[С]', 'С', 'тёс', 'end'),
+('[Ц]-[С]', 'С', 'троллейбус', 'end'),
+('[Ц]-[С]', 'С', 'ус', 'end'),
+('[Ц]-[С]', 'С', 'фокус', 'end'),
+('[Ц]-[С]', 'С', 'бусы', 'middle'),
+('[Ц]-[С]', 'С', 'весы', 'middle'),
+('[Ц]-[С]', 'С', 'волосок', 'middle'),
+('[Ц]-[С]', 'С', 'досуг', 'middle'),
+('[Ц]-[С]', 'С', 'колбаса', 'middle'),
+('[Ц]-[С]', 'С', 'колёса', 'middle'),
+('[Ц]-[С]', 'С', 'коса', 'middle'),
+('[Ц]-[С]', 'С', 'краса', 'middle'),
+('[Ц]-[С]', 'С', 'кусок', 'middle'),
+('[Ц]-[С]', 'С', 'лесок', 'middle'),
+('[Ц]-[С]', 'С', 'лиса', 'middle'),
+('[Ц]-[С]', 'С', 'оса', 'middle'),
+('[Ц]-[С]', 'С', 'осока', 'middle'),
+('[Ц]-[С]', 'С', 'песок', 'middle'),
+('[Ц]-[С]', 'С', 'писатель', 'middle'),
+('[Ц]-[С]', 'С', 'полоса', 'middle'),
+('[Ц]-[С]', 'С', 'посадка', 'middle'),
+('[Ц]-[С]', 'С', 'посол', 'middle'),
+('[Ц]-[С]', 'С', 'посуда', 'middle'),
+('[Ц]-[С]', 'С', 'посылка', 'middle'),
+('[Ц]-[С]', 'С', 'роса', 'middle'),
+('[Ц]-[С]', 'С', 'фасоль', 'middle'),
+('[Ц]-[С]', 'С', 'стык', 'start'),
+('[Ц]-[С]', 'С', 'стыковка', 'start'),
+('[Ц]-[С]', 'С', 'стынет', 'start'),
+('[Ц]-[С]', 'С', 'остыть', 'middle'),
+('[Ц]-[С]', 'С', 'пустырь', 'middle'),
+('[Ц]-[С]', 'С', 'пустыня', 'middle'),
+('[Ц]-[С]', 'С', 'риск', 'middle'),
+('[Ц]-[С]', 'С', 'треск', 'middle'),
+('[Ц]-[С]', 'С', 'плеск', 'middle'),
+('[Ц]-[С]', 'С', 'блеск', 'middle'),
+('[Ц]-[С]', 'С', 'лоск', 'middle'),
+('[Ц]-[С]', 'С', 'киоск', 'middle'),
+('[Ц]-[С]', 'С', 'пуск', 'middle'),
+('[Ц]-[Т]', 'Ц', 'цапля', 'start'),
+('[Ц]-[Т]', 'Ц', 'цех', 'start'),
+('[Ц]-[Т]', 'Ц', 'целый', 'start'),
+('[Ц]-[Т]', 'Ц', 'цена', 'start'),
+('[Ц]-[Т]', 'Ц', 'цель', 'start'),
+('[Ц]-[Т]', 'Ц', 'цепь', 'start'),
+('[Ц]-[Т]', 'Ц', 'цукат', 'start'),
+('[Ц]-[Т]', 'Ц', 'цитата', 'start'),
+('[Ц]-[Т]', 'Ц', 'цокать', 'start'),
+('[Ц]-[Т]', 'Ц', 'цинга', 'start'),
+('[Ц]-[Т]', 'Ц', 'цыплёнок', 'start'),
+('[Ц]-[Т]', 'Ц', 'цыганка', 'start'),
+('[Ц]-[Т]', 'Ц', 'цинковый', 'start'),
+('[Ц]-[Т]', 'Ц', 'лица', 'middle'),
+('[Ц]-[Т]', 'Ц', 'теплица', 'middle'),
+('[Ц]-[Т]', 'Ц', 'лицо', 'middle'),
+('[Ц]-[Т]', 'Ц', 'мыльница', 'middle'),
+('[Ц]-[Т]', 'Ц', 'салфетница', 'middle'),
+('[Ц]-[Т]', 'Ц', 'больница', 'middle'),
+('[Ц]-[Т]', 'Ц', 'мельница', 'middle'),
+('[Ц]-[Т]', 'Ц', 'пыльца', 'middle'),
+('[Ц]-[Т]', 'Ц', 'кольцо', 'middle'),
+('[Ц]-[Т]', 'Ц', 'пунцовый', 'middle'),
+('[Ц]-[Т]', 'Ц', 'овцы', 'middle'),
+('[Ц]-[Т]', 'Ц', 'отцы', 'middle'),
+('[Ц]-[Т]', 'Ц', 'гонцы', 'middle'),
+('[Ц]-[Т]', 'Ц', 'певцы', 'middle'),
+('[Ц]-[Т]', 'Ц', 'концы', 'middle'),
+('[Ц]-[Т]', 'Ц', 'умница', 'middle'),
+('[Ц]-[Т]', 'Ц', 'рукавица', 'middle'),
+('[Ц]-[Т]', 'Ц', 'пуговица', 'middle'),
+('[Ц]-[Т]', 'Ц', 'акация', 'middle'),
+('[Ц]-[Т]', 'Ц', 'авиация', 'middle'),
+('[Ц]-[Т]', 'Ц', 'луковица', 'middle'),
+('[Ц]-[Т]', 'Ц', 'боец', 'end'),
+('[Ц]-[Т]', 'Ц', 'отец', 'end'),
+('[Ц]-[Т]', 'Ц', 'конец', 'end'),
+('[Ц]-[Т]', 'Ц', 'молодец', 'end'),
+('[Ц]-[Т]', 'Ц', 'певец', 'end'),
+('[Ц]-[Т]', 'Ц', 'леденец', 'end'),
+('[Ц]-[Т]', 'Ц', 'колодец', 'end'),
+('[Ц]-[Т]', 'Ц', 'индеец', 'end'),
+('[Ц]-[Т]', 'Ц', 'птенец', 'end'),
+('[Ц]-[Т]', 'Ц', 'пловец', 'end'),
+('[Ц]-[Т]', 'Ц', 'китаец', 'end'),
+('[Ц]-[Т]', 'Ц', 'мизинец', 'end'),
+('[Ц]-[Т]', 'Ц', 'заяц', 'end'),
+('[Ц]-[Т]', 'Ц', 'паяц', 'end'),
+('[Ц]-[Т]', 'Ц', 'месяц', 'end'),
+('[Ц]-[Т]', 'Ц', 'цвет', 'start'),
+('[Ц]-[Т]', 'Ц', 'цветник', 'start'),
+('[Ц]-[Т]', 'Ц', 'семицветик', 'middle'),
+('[Ц]-[Т]', 'Ц', 'цвести', 'start'),
+('[Ц]-[Т]', 'Ц', 'цветение', 'start'),
+('[Ц]-[Т]', 'Ц', 'самоцветы', 'middle'),
+('[Ц]-[Т]', 'Ц', 'боцман', 'middle'),
+('[Ц]-[Т]', 'Ц', 'сцена', 'middle'),
+('[Ц]-[Т]', 'Ц', 'цветик', 'start'),
+('[Ц]-[Т]', 'Т', 'там', 'start'),
+('[Ц]-[Т]', 'Т', 'так', 'start'),
+('[Ц]-[Т]', 'Т', 'таз', 'start'),
+('[Ц]-[Т]', 'Т', 'ты', 'start'),
+('[Ц]-[Т]', 'Т', 'Том', 'start'),
+('[Ц]-[Т]', 'Т', 'ток', 'start'),
+('[Ц]-[Т]', 'Т', 'топ', 'start'),
+('[Ц]-[Т]', 'Т', 'тушь', 'start'),
+('[Ц]-[Т]', 'Т', 'Таня', 'start'),
+('[Ц]-[Т]', 'Т', 'тапки', 'start'),
+('[Ц]-[Т]', 'Т', 'тачка', 'start'),
+('[Ц]-[Т]', 'Т', 'такси', 'start'),
+('[Ц]-[Т]', 'Т', 'тайна', 'start'),
+('[Ц]-[Т]', 'Т', 'табун', 'start'),
+('[Ц]-[Т]', 'Т', 'тазик', 'start'),
+('[Ц]-[Т]', 'Т', 'такой', 'start'),
+('[Ц]-[Т]', 'Т', 'тащит', 'start'),
+('[Ц]-[Т]', 'Т', 'Тоня', 'start'),
+('[Ц]-[Т]', 'Т', 'Тома', 'start'),
+('[Ц]-[Т]', 'Т', 'талон', 'start'),
+('[Ц]-[Т]', 'Т', 'топот', 'start'),
+('[Ц]-[Т]', 'Т', 'торба', 'start'),
+('[Ц]-[Т]', 'Т', 'точка', 'start'),
+('[Ц]-[Т]', 'Т', 'торт', 'start'),
+('[Ц]-[Т]', 'Т', 'только', 'start'),
+('[Ц]-[Т]', 'Т', 'тополь', 'start'),
+('[Ц]-[Т]', 'Т', 'туча', 'start'),
+('[Ц]-[Т]', 'Т', 'туя', 'start'),
+('[Ц]-[Т]', 'Т', 'тучки', 'start'),
+('[Ц]-[Т]', 'Т', 'туфли', 'start'),
+('[Ц]-[Т]', 'Т', 'Тузик', 'start'),
+('[Ц]-[Т]', 'Т', 'тыкать', 'start'),
+('[Ц]-[Т]', 'Т', 'тыква', 'start'),
+('[Ц]-[Т]', 'Т', 'Тамара', 'start'),
+('[Ц]-[Т]', 'Т', 'таракан', 'start'),
+('[Ц]-[Т]', 'Т', 'тарелка', 'start'),
+('[Ц]-[Т]', 'Т', 'топанье', 'start'),
+('[Ц]-[Т]', 'Т', 'тыковка', 'start'),
+('[Ц]-[Т]', 'Т', 'ата', 'middle'),
+('[Ц]-[Т]', 'Т', 'лето', 'middle'),
+('[Ц]-[Т]', 'Т', 'это', 'middle'),
+('[Ц]-[Т]', 'Т', 'сито', 'middle'),
+('[Ц]-[Т]', 'Т', 'коты', 'middle'),
+('[Ц]-[Т]', 'Т', 'ноты', 'middle'),
+('[Ц]-[Т]', 'Т', 'батон', 'middle'),
+('[Ц]-[Т]', 'Т', 'бетон', 'middle'),
+('[Ц]-[Т]', 'Т', 'бутон', 'middle'),
+('[Ц]-[Т]', 'Т', 'петух', 'middle'),
+('[Ц]-[Т]', 'Т', 'пятак', 'middle'),
+('[Ц]-[Т]', 'Т', 'кофта', 'middle'),
+('[Ц]-[Т]', 'Т', 'шутка', 'middle'),
+('[Ц]-[Т]', 'Т', 'щётка', 'middle'),
+('[Ц]-[Т]', 'Т', 'каток', 'middle'),
+('[Ц]-[Т]', 'Т', 'пальто', 'middle'),
+('[Ц]-[Т]', 'Т', 'Антон', 'middle'),
+('[Ц]-[Т]', 'Т', 'платок', 'middle'),
+('[Ц]-[Т]', 'Т', 'цветок', 'middle'),
+('[Ц]-[Т]', 'Т', 'завтрак', 'middle'),
+('[Ц]-[Т]', 'Т', 'Виталий', 'middle'),
+('[Ц]-[Т]', 'Т', 'капитан', 'middle'),
+('[Ц]-[Т]', 'Т', 'сметана', 'middle'),
+('[Ц]-[Т]', 'Т', 'копыто', 'middle'),
+('[Ц]-[Т]', 'Т', 'конфеты', 'middle'),
+('[Ц]-[Т]', 'Т', 'молоток', 'middle'),
+('[Ц]-[Т]', 'Т', 'веточка', 'middle'),
+('[Ц]-[Т]', 'Т', 'автобус', 'middle'),
+('[Ц]-[Т]', 'Т', 'кот', 'end'),
+('[Ц]-[Т]', 'Т', 'кит', 'end'),
+('[Ц]-[Т]', 'Т', 'рот', 'end'),
+('[Ц]-[Т]', 'Т', 'тут', 'start'),
+('[Ц]-[Т]', 'Т', 'енот', 'end'),
+('[Ц]-[Т]', 'Т', 'балет', 'end'),
+('[Ц]-[Т]', 'Т', 'батут', 'end'),
+('[Ц]-[Т]', 'Т', 'живот', 'end'),
+('[Ц]-[Т]', 'Т', 'канат', 'end'),
+('[Ц]-[Т]', 'Т', 'торт', 'start'),
+('[Ц]-[Т]', 'Т', 'порт', 'end'),
+('[Ц]-[Т]', 'Т', 'март', 'end'),
+('[Ц]-[Т]', 'Т', 'портфель', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'цапля', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цех', 'start'),
+('[Ц]-[Ч]', 'Ц', 'целый', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цена', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цель', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цепь', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цукат', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цитата', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цокать', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цинга', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цыплёнок', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цыганка', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цинковый', 'start'),
+('[Ц]-[Ч]', 'Ц', 'лица', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'теплица', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'лицо', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'мыльница', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'салфетница', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'больница', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'мельница', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'пыльца', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'кольцо', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'пунцовый', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'овцы', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'отцы', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'гонцы', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'певцы', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'концы', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'умница', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'рукавица', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'пуговица', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'акация', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'авиация', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'луковица', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'боец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'отец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'конец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'молодец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'певец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'леденец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'колодец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'индеец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'птенец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'пловец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'китаец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'мизинец', 'end'),
+('[Ц]-[Ч]', 'Ц', 'заяц', 'end'),
+('[Ц]-[Ч]', 'Ц', 'паяц', 'end'),
+('[Ц]-[Ч]', 'Ц', 'месяц', 'end'),
+('[Ц]-[Ч]', 'Ц', 'цвет', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цветник', 'start'),
+('[Ц]-[Ч]', 'Ц', 'семицветик', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'цвести', 'start'),
+('[Ц]-[Ч]', 'Ц', 'цветение', 'start'),
+('[Ц]-[Ч]', 'Ц', 'самоцветы', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'боцман', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'сцена', 'middle'),
+('[Ц]-[Ч]', 'Ц', 'цветик', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чай', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чайка', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чайник', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чабан', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чашка', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чадо', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чаинка', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чан', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чаша', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чудо', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чугун', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чугунок', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чуб', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чудак', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чугунный', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чудной', 'start'),
+('[Ц]-[Ч]', 'Ч', 'Чукотка', 'start'),
+('[Ц]-[Ч]', 'Ч', 'чуткий', 'start'),
+('[Ц]-[Ч]', 'Ч', 'кочан', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'туча', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'бахча', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'бачок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'бычок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'пучок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'значок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'кабачок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'башмачок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'бочонок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'зайчонок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'паучок', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'хочу', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'каучук', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'жемчуг', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'мячи', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'овчинка', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'зайчик', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'мячик', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'могучий', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'пахучий', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'пончик', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'заячий', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'ученик', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'учение', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'учебник', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'пугач', 'end'),
+('[Ц]-[Ч]', 'Ч', 'тягач', 'end'),
+('[Ц]-[Ч]', 'Ч', 'ткач', 'end'),
+('[Ц]-[Ч]', 'Ч', 'богач', 'end'),
+('[Ц]-[Ч]', 'Ч', 'кумач', 'end'),
+('[Ц]-[Ч]', 'Ч', 'могуч', 'end'),
+('[Ц]-[Ч]', 'Ч', 'тягуч', 'end'),
+('[Ц]-[Ч]', 'Ч', 'тянуч', 'end'),
+('[Ц]-[Ч]', 'Ч', 'дичь', 'end'),
+('[Ц]-[Ч]', 'Ч', 'меч', 'end'),
+('[Ц]-[Ч]', 'Ч', 'течь', 'end'),
+('[Ц]-[Ч]', 'Ч', 'мяч', 'end'),
+('[Ц]-[Ч]', 'Ч', 'Камчатка', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'ячмень', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'вечно', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'вечный', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'отличник', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'ночник', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'больничный', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'клубничный', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'печник', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'точно', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'прочно', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'лично', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'удачно', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'дачный', 'middle'),
+('[Ц]-[Ч]', 'Ч', 'кучка', 'middle'),
+('[Т]-[Ч]', 'Т', 'там', 'start'),
+('[Т]-[Ч]', 'Т', 'так', 'start'),
+('[Т]-[Ч]', 'Т', 'таз', 'start'),
+('[Т]-[Ч]', 'Т', 'ты', 'start'),
+('[Т]-[Ч]', 'Т', 'Том', 'start'),
+('[Т]-[Ч]', 'Т', 'ток', 'start'),
+('[Т]-[Ч]', 'Т', 'топ', 'start'),
+('[Т]-[Ч]', 'Т', 'тушь', 'start'),
+('[Т]-[Ч]', 'Т', 'Таня', 'start'),
+('[Т]-[Ч]', 'Т', 'тапки', 'start'),
+('[Т]-[Ч]', 'Т', 'тачка', 'start'),
+('[Т]-[Ч]', 'Т', 'такси', 'start'),
+('[Т]-[Ч]', 'Т', 'тайна', 'start'),
+('[Т]-[Ч]', 'Т', 'табун', 'start'),
+('[Т]-[Ч]', 'Т', 'тазик', 'start'),
+('[Т]-[Ч]', 'Т', 'такой', 'start'),
+('[Т]-[Ч]', 'Т', 'тащит', 'start'),
+('[Т]-[Ч]', 'Т', 'Тоня', 'start'),
+('[Т]-[Ч]', 'Т', 'Тома', 'start'),
+('[Т]-[Ч]', 'Т', 'талон', 'start'),
+('[Т]-[Ч]', 'Т', 'топот', 'start'),
+('[Т]-[Ч]', 'Т', 'торба', 'start'),
+('[Т]-[Ч]', 'Т', 'точка', 'start'),
+('[Т]-[Ч]', 'Т', 'торт', 'start'),
+('[Т]-[Ч]', 'Т', 'только', 'start'),
+('[Т]-[Ч]', 'Т', 'тополь', 'start'),
+('[Т]-[Ч]', 'Т', 'туча', 'start'),
+('[Т]-[Ч]', 'Т', 'туя', 'start'),
+('[Т]-[Ч]', 'Т', 'тучки', 'start'),
+('[Т]-[Ч]', 'Т', 'туфли', 'start'),
+('[Т]-[Ч]', 'Т', 'Тузик', 'start'),
+('[Т]-[Ч]', 'Т', 'тыкать', 'start'),
+('[Т]-[Ч]', 'Т', 'тыква', 'start'),
+('[Т]-[Ч]', 'Т', 'Тамара', 'start'),
+('[Т]-[Ч]', 'Т', 'таракан', 'start'),
+('[Т]-[Ч]', 'Т', 'тарелка', 'start'),
+('[Т]-[Ч]', 'Т', 'топанье', 'start'),
+('[Т]-[Ч]', 'Т', 'тыковка', 'start'),
+('[Т]-[Ч]', 'Т', 'ата', 'middle'),
+('[Т]-[Ч]', 'Т', 'лето', 'middle'),
+('[Т]-[Ч]', 'Т', 'это', 'middle'),
+('[Т]-[Ч]', 'Т', 'сито', 'middle'),
+('[Т]-[Ч]', 'Т', 'коты', 'middle'),
+('[Т]-[Ч]', 'Т', 'ноты', 'middle'),
+('[Т]-[Ч]', 'Т', 'батон', 'middle'),
+('[Т]-[Ч]', 'Т', 'бетон', 'middle'),
+('[Т]-[Ч]', 'Т', 'бутон', 'middle'),
+('[Т]-[Ч]', 'Т', 'петух', 'middle'),
+('[Т]-[Ч]', 'Т', 'пятак', 'middle'),
+('[Т]-[Ч]', 'Т', 'кофта', 'middle'),
+('[Т]-[Ч]', 'Т', 'шутка', 'middle'),
+('[Т]-[Ч]', 'Т', 'щётка', 'middle'),
+('[Т]-[Ч]', 'Т', 'каток', 'middle'),
+('[Т]-[Ч]', 'Т', 'пальто', 'middle'),
+('[Т]-[Ч]', 'Т', 'Антон', 'middle'),
+('[Т]-[Ч]', 'Т', 'платок', 'middle'),
+('[Т]-[Ч]', 'Т', 'цветок', 'middle'),
+('[Т]-[Ч]', 'Т', 'завтрак', 'middle'),
+('[Т]-[Ч]', 'Т', 'Виталий', 'middle'),
+('[Т]-[Ч]', 'Т', 'капитан', 'middle'),
+('[Т]-[Ч]', 'Т', 'сметана', 'middle'),
+('[Т]-[Ч]', 'Т', 'копыто', 'middle'),
+('[Т]-[Ч]', 'Т', 'конфеты', 'middle'),
+('[Т]-[Ч]', 'Т', 'молоток', 'middle'),
+('[Т]-[Ч]', 'Т', 'веточка', 'middle'),
+('[Т]-[Ч]', 'Т', 'автобус', 'middle'),
+('[Т]-[Ч]', 'Т', 'кот', 'end'),
+('[Т]-[Ч]', 'Т', 'кит', 'end'),
+('[Т]-[Ч]', 'Т', 'рот', 'end'),
+('[Т]-[Ч]', 'Т', 'тут', 'start'),
+('[Т]-[Ч]', 'Т', 'енот', 'end'),
+('[Т]-[Ч]', 'Т', 'балет', 'end'),
+('[Т]-[Ч]', 'Т', 'батут', 'end'),
+('[Т]-[Ч]', 'Т', 'живот', 'end'),
+('[Т]-[Ч]', 'Т', 'канат', 'end'),
+('[Т]-[Ч]', 'Т', 'торт', 'start'),
+('[Т]-[Ч]', 'Т', 'порт', 'end'),
+('[Т]-[Ч]', 'Т', 'март', 'end'),
+('[Т]-[Ч]', 'Т', 'портфель', 'middle'),
+('[Т]-[Ч]', 'Ч', 'чай', 'start'),
+('[Т]-[Ч]', 'Ч', 'чайка', 'start'),
+('[Т]-[Ч]', 'Ч', 'чайник', 'start'),
+('[Т]-[Ч]', 'Ч', 'чабан', 'start'),
+('[Т]-[Ч]', 'Ч', 'чашка', 'start'),
+('[Т]-[Ч]', 'Ч', 'чадо', 'start'),
+('[Т]-[Ч]', 'Ч', 'чаинка', 'start'),
+('[Т]-[Ч]', 'Ч', 'чан', 'start'),
+('[Т]-[Ч]', 'Ч', 'чаша', 'start'),
+('[Т]-[Ч]', 'Ч', 'чудо', 'start'),
+('[Т]-[Ч]', 'Ч', 'чугун', 'start'),
+('[Т]-[Ч]', 'Ч', 'чугунок', 'start'),
+('[Т]-[Ч]', 'Ч', 'чуб', 'start'),
+('[Т]-[Ч]', 'Ч', 'чудак', 'start'),
+('[Т]-[Ч]', 'Ч', 'чугунный', 'start'),
+('[Т]-[Ч]', 'Ч', 'чудной', 'start'),
+('[Т]-[Ч]', 'Ч', 'Чукотка', 'start'),
+('[Т]-[Ч]', 'Ч', 'чуткий', 'start'),
+('[Т]-[Ч]', 'Ч', 'кочан', 'middle'),
+('[Т]-[Ч]', 'Ч', 'туча', 'middle'),
+('[Т]-[Ч]', 'Ч', 'бахча', 'middle'),
+('[Т]-[Ч]', 'Ч', 'бачок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'бычок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'пучок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'значок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'кабачок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'башмачок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'бочонок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'зайчонок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'паучок', 'middle'),
+('[Т]-[Ч]', 'Ч', 'хочу', 'middle'),
+('[Т]-[Ч]', 'Ч', 'каучук', 'middle'),
+('[Т]-[Ч]', 'Ч', 'жемчуг', 'middle'),
+('[Т]-[Ч]', 'Ч', 'мячи', 'middle'),
+('[Т]-[Ч]', 'Ч', 'овчинка', 'middle'),
+('[Т]-[Ч]', 'Ч', 'зайчик', 'middle'),
+('[Т]-[Ч]', 'Ч', 'мячик', 'middle'),
+('[Т]-[Ч]', 'Ч', 'могучий', 'middle'),
+('[Т]-[Ч]', 'Ч', 'пахучий', 'middle'),
+('[Т]-[Ч]', 'Ч', 'пончик', 'middle'),
+('[Т]-[Ч]', 'Ч', 'заячий', 'middle'),
+('[Т]-[Ч]', 'Ч', 'ученик', 'middle'),
+('[Т]-[Ч]', 'Ч', 'учение', 'middle'),
+('[Т]-[Ч]', 'Ч', 'учебник', 'middle'),
+('[Т]-[Ч]', 'Ч', 'пугач', 'end'),
+('[Т]-[Ч]', 'Ч', 'тягач', 'end'),
+('[Т]-[Ч]', 'Ч', 'ткач', 'end'),
+('[Т]-[Ч]', 'Ч', 'богач', 'end'),
+('[Т]-[Ч]', 'Ч', 'кумач', 'end'),
+('[Т]-[Ч]', 'Ч', 'могуч', 'end'),
+('[Т]-[Ч]', 'Ч', 'тягуч', 'end'),
+('[Т]-[Ч]', 'Ч', 'тянуч', 'end'),
+('[Т]-[Ч]', 'Ч', 'дичь', 'end'),
+('[Т]-[Ч]', 'Ч', 'меч', 'end'),
+('[Т]-[Ч]', 'Ч', 'течь', 'end'),
+('[Т]-[Ч]', 'Ч', 'мяч', 'end'),
+('[Т]-[Ч]', 'Ч', 'Камчатка', 'middle'),
+('[Т]-[Ч]', 'Ч', 'ячмень', 'middle'),
+('[Т]-[Ч]', 'Ч', 'вечно', 'middle'),
+('[Т]-[Ч]', 'Ч', 'вечный', 'middle'),
+('[Т]-[Ч]', 'Ч', 'отличник', 'middle'),
+('[Т]-[Ч]', 'Ч', 'ночник', 'middle'),
+('[Т]-[Ч]', 'Ч', 'больничный', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'щавель', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щека', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щебень', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щенок', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щетина', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щебетать', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щекотать', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щётка', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щёки', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щёлкать', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щелочь', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щука', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щуп', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щит', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щи', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щипать', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щипцы', 'start'),
+('[Щ]-[Ч]', 'Щ', 'щипание', 'start'),
+('[Щ]-[Ч]', 'Щ', 'угощать', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'пищать', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'вещать', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'дощатый', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'замечать', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'ущелье', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'ищейка', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'угощение', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'мощеный', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'лущеный', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'блещут', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'плещут', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'трещу', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'ищут', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'общий', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'кладовщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'ящик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'вещи', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'овощи', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'упаковщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'зимовщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'хищник', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'изящный', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'помощник', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'мощный', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'овощной', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'насущный', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'банщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'взломщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'музейщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'пильщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'натурщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'ныряльщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'мойщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'уборщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'каменщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'гонщик', 'middle'),
+('[Щ]-[Ч]', 'Щ', 'выдумщик', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'чай', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чайка', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чайник', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чабан', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чашка', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чадо', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чаинка', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чан', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чаша', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чудо', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чугун', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чугунок', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чуб', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чудак', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чугунный', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чудной', 'start'),
+('[Щ]-[Ч]', 'Ч', 'Чукотка', 'start'),
+('[Щ]-[Ч]', 'Ч', 'чуткий', 'start'),
+('[Щ]-[Ч]', 'Ч', 'кочан', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'туча', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'бахча', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'бачок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'бычок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'пучок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'значок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'кабачок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'башмачок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'бочонок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'зайчонок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'паучок', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'хочу', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'каучук', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'жемчуг', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'мячи', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'овчинка', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'зайчик', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'мячик', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'могучий', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'пахучий', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'пончик', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'заячий', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'ученик', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'учение', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'учебник', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'пугач', 'end'),
+('[Щ]-[Ч]', 'Ч', 'тягач', 'end'),
+('[Щ]-[Ч]', 'Ч', 'ткач', 'end'),
+('[Щ]-[Ч]', 'Ч', 'богач', 'end'),
+('[Щ]-[Ч]', 'Ч', 'кумач', 'end'),
+('[Щ]-[Ч]', 'Ч', 'могуч', 'end'),
+('[Щ]-[Ч]', 'Ч', 'тягуч', 'end'),
+('[Щ]-[Ч]', 'Ч', 'тянуч', 'end'),
+('[Щ]-[Ч]', 'Ч', 'дичь', 'end'),
+('[Щ]-[Ч]', 'Ч', 'меч', 'end'),
+('[Щ]-[Ч]', 'Ч', 'течь', 'end'),
+('[Щ]-[Ч]', 'Ч', 'мяч', 'end'),
+('[Щ]-[Ч]', 'Ч', 'Камчатка', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'ячмень', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'вечно', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'вечный', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'отличник', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'ночник', 'middle'),
+('[Щ]-[Ч]', 'Ч', 'больничный', 'middle'),
+('[Л]-[Р]', 'Л', 'лак', 'start'),
+('[Л]-[Р]', 'Л', 'лапа', 'start'),
+('[Л]-[Р]', 'Л', 'лампа', 'start'),
+('[Л]-[Р]', 'Л', 'лавка', 'start'),
+('[Л]-[Р]', 'Л', 'лайка', 'start'),
+('[Л]-[Р]', 'Л', 'ластик', 'start'),
+('[Л]-[Р]', 'Л', 'лама', 'start'),
+('[Л]-[Р]', 'Л', 'лапоть', 'start'),
+('[Л]-[Р]', 'Л', 'ландыш', 'start'),
+('[Л]-[Р]', 'Л', 'ласточка', 'start'),
+('[Л]-[Р]', 'Л', 'лось', 'start'),
+('[Л]-[Р]', 'Л', 'лом', 'start'),
+('[Л]-[Р]', 'Л', 'лошадь', 'start'),
+('[Л]-[Р]', 'Л', 'локоть', 'start'),
+('[Л]-[Р]', 'Л', 'лачуга', 'start'),
+('[Л]-[Р]', 'Л', 'лотос', 'start'),
+('[Л]-[Р]', 'Л', 'лук', 'start'),
+('[Л]-[Р]', 'Л', 'ложка', 'start'),
+('[Л]-[Р]', 'Л', 'лодка', 'start'),
+('[Л]-[Р]', 'Л', 'лупа', 'start'),
+('[Л]-[Р]', 'Л', 'лужа', 'start'),
+('[Л]-[Р]', 'Л', 'луч', 'start'),
+('[Л]-[Р]', 'Л', 'лучник', 'start'),
+('[Л]-[Р]', 'Л', 'лыжи', 'start'),
+('[Л]-[Р]', 'Л', 'лыжник', 'start'),
+('[Л]-[Р]', 'Л', 'лапша', 'start'),
+('[Л]-[Р]', 'Л', 'ладонь', 'start'),
+('[Л]-[Р]', 'Л', 'лаванда', 'start'),
+('[Л]-[Р]', 'Л', 'ладья', 'start'),
+('[Л]-[Р]', 'Л', 'лангуст', 'start'),
+('[Л]-[Р]', 'Л', 'локомотив', 'start'),
+('[Л]-[Р]', 'Л', 'лукошко', 'start'),
+('[Л]-[Р]', 'Л', 'лопата', 'start'),
+('[Л]-[Р]', 'Л', 'лопух', 'start'),
+('[Л]-[Р]', 'Л', 'луна', 'start'),
+('[Л]-[Р]', 'Л', 'пила', 'middle'),
+('[Л]-[Р]', 'Л', 'юла', 'middle'),
+('[Л]-[Р]', 'Л', 'скала', 'middle'),
+('[Л]-[Р]', 'Л', 'булавка', 'middle'),
+('[Л]-[Р]', 'Л', 'салат', 'middle'),
+('[Л]-[Р]', 'Л', 'пчела', 'middle'),
+('[Л]-[Р]', 'Л', 'халат', 'middle'),
+('[Л]-[Р]', 'Л', 'палатка', 'middle'),
+('[Л]-[Р]', 'Л', 'ёлка', 'middle'),
+('[Л]-[Р]', 'Л', 'водолаз', 'middle'),
+('[Л]-[Р]', 'Л', 'колодец', 'middle'),
+('[Л]-[Р]', 'Л', 'колоша', 'middle'),
+('[Л]-[Р]', 'Л', 'солонка', 'middle'),
+('[Л]-[Р]', 'Л', 'булка', 'middle'),
+('[Л]-[Р]', 'Л', 'одеколон', 'middle'),
+('[Л]-[Р]', 'Л', 'малыш', 'middle'),
+('[Л]-[Р]', 'Л', 'булыжник', 'middle'),
+('[Л]-[Р]', 'Л', 'акула', 'middle'),
+('[Л]-[Р]', 'Л', 'кобыла', 'middle'),
+('[Л]-[Р]', 'Л', 'коала', 'middle'),
+('[Л]-[Р]', 'Л', 'зажигалка', 'middle'),
+('[Л]-[Р]', 'Л', 'мыло', 'middle'),
+('[Л]-[Р]', 'Л', 'одеяло', 'middle'),
+('[Л]-[Р]', 'Л', 'чучело', 'middle'),
+('[Л]-[Р]', 'Л', 'сало', 'middle'),
+('[Л]-[Р]', 'Л', 'голова', 'middle'),
+('[Л]-[Р]', 'Л', 'волосы', 'middle'),
+('[Л]-[Р]', 'Л', 'белка', 'middle'),
+('[Л]-[Р]', 'Л', 'скакалка', 'middle'),
+('[Л]-[Р]', 'Л', 'скалка', 'middle'),
+('[Л]-[Р]', 'Л', 'наволочка', 'middle'),
+('[Л]-[Р]', 'Л', 'бокал', 'end'),
+('[Л]-[Р]', 'Л', 'пенал', 'end'),
+('[Л]-[Р]', 'Л', 'шакал', 'end'),
+('[Л]-[Р]', 'Л', 'мангал', 'end'),
+('[Л]-[Р]', 'Л', 'кинжал', 'end'),
+('[Л]-[Р]', 'Л', 'вол', 'end'),
+('[Л]-[Р]', 'Л', 'кол', 'end'),
+('[Л]-[Р]', 'Л', 'стол', 'end'),
+('[Л]-[Р]', 'Л', 'гол', 'end'),
+('[Л]-[Р]', 'Л', 'футбол', 'end'),
+('[Л]-[Р]', 'Л', 'укол', 'end'),
+('[Л]-[Р]', 'Л', 'баскетбол', 'end'),
+('[Л]-[Р]', 'Л', 'стул', 'end'),
+('[Л]-[Р]', 'Л', 'зал', 'end'),
+('[Л]-[Р]', 'Л', 'оскал', 'end'),
+('[Л]-[Р]', 'Л', 'пьедестал', 'end'),
+('[Л]-[Р]', 'Р', 'рак', 'start'),
+('[Л]-[Р]', 'Р', 'рама', 'start'),
+('[Л]-[Р]', 'Р', 'рана', 'start'),
+('[Л]-[Р]', 'Р', 'ракета', 'start'),
+('[Л]-[Р]', 'Р', 'рот', 'start'),
+('[Л]-[Р]', 'Р', 'рота', 'start'),
+('[Л]-[Р]', 'Р', 'роза', 'start'),
+('[Л]-[Р]', 'Р', 'робот', 'start'),
+('[Л]-[Р]', 'Р', 'Рома', 'start'),
+('[Л]-[Р]', 'Р', 'Рая', 'start'),
+('[Л]-[Р]', 'Р', 'роса', 'start'),
+('[Л]-[Р]', 'Р', 'родина', 'start'),
+('[Л]-[Р]', 'Р', 'рынок', 'start'),
+('[Л]-[Р]', 'Р', 'рыть', 'start'),
+('[Л]-[Р]', 'Р', 'рысь', 'start'),
+('[Л]-[Р]', 'Р', 'рыба', 'start'),
+('[Л]-[Р]', 'Р', 'рука', 'start'),
+('[Л]-[Р]', 'Р', 'рубка', 'start'),
+('[Л]-[Р]', 'Р', 'рукава', 'start'),
+('[Л]-[Р]', 'Р', 'ура', 'middle'),
+('[Л]-[Р]', 'Р', 'дыра', 'middle'),
+('[Л]-[Р]', 'Р', 'гора', 'middle'),
+('[Л]-[Р]', 'Р', 'пора', 'middle'),
+('[Л]-[Р]', 'Р', 'пара', 'middle'),
+('[Л]-[Р]', 'Р', 'фара', 'middle'),
+('[Л]-[Р]', 'Р', 'гитара', 'middle'),
+('[Л]-[Р]', 'Р', 'тара', 'middle'),
+('[Л]-[Р]', 'Р', 'Вера', 'middle'),
+('[Л]-[Р]', 'Р', 'Юра', 'middle'),
+('[Л]-[Р]', 'Р', 'Кира', 'middle'),
+('[Л]-[Р]', 'Р', 'Марат', 'middle'),
+('[Л]-[Р]', 'Р', 'игра', 'middle'),
+('[Л]-[Р]', 'Р', 'конура', 'middle'),
+('[Л]-[Р]', 'Р', 'контора', 'middle'),
+('[Л]-[Р]', 'Р', 'жара', 'middle'),
+('[Л]-[Р]', 'Р', 'город', 'middle'),
+('[Л]-[Р]', 'Р', 'герой', 'middle'),
+('[Л]-[Р]', 'Р', 'ворота', 'middle'),
+('[Л]-[Р]', 'Р', 'дорога', 'middle'),
+('[Л]-[Р]', 'Р', 'ведро', 'middle'),
+('[Л]-[Р]', 'Р', 'ядро', 'middle'),
+('[Л]-[Р]', 'Р', 'бедро', 'middle'),
+('[Л]-[Р]', 'Р', 'утро', 'middle'),
+('[Л]-[Р]', 'Р', 'шар', 'end'),
+('[Л]-[Р]', 'Р', 'пар', 'end'),
+('[Л]-[Р]', 'Р', 'дар', 'end'),
+('[Л]-[Р]', 'Р', 'бар', 'end'),
+('[Л]-[Р]', 'Р', 'удар', 'end'),
+('[Л]-[Р]', 'Р', 'загар', 'end'),
+('[Л]-[Р]', 'Р', 'комар', 'end'),
+('[Л]-[Р]', 'Р', 'бор', 'end'),
+('[Л]-[Р]', 'Р', 'мотор', 'end'),
+('[Л]-[Р]', 'Р', 'набор', 'end'),
+('[Л]-[Р]', 'Р', 'топор', 'end'),
+('[Л]-[Р]', 'Р', 'мир', 'end'),
+('[Л]-[Р]', 'Р', 'пир', 'end'),
+('[Л]-[Р]', 'Р', 'кефир', 'end'),
+('[Л]-[Р]', 'Р', 'зефир', 'end'),
+('[Л]-[Р]', 'Р', 'ветер', 'end'),
+('[Л]-[Р]', 'Р', 'вечер', 'end'),
+('[Л]-[Р]', 'Р', 'мастер', 'end'),
+('[Л]-[Р]', 'Р', 'катер', 'end'),
+('[Л]-[Р]', 'Р', 'узор', 'end'),
+('[Л]-[Р]', 'Р', 'брат', 'middle'),
+('[Л]-[Р]', 'Р', 'град', 'middle'),
+('[Л]-[Р]', 'Р', 'гром', 'middle'),
+('[Л]-[Р]', 'Р', 'груз', 'middle'),
+('[Л]-[Р]', 'Р', 'грач', 'middle'),
+('[Л]-[Р]', 'Р', 'враг', 'middle'),
+('[Л]-[Р]', 'Р', 'гранит', 'middle'),
+('[Л]-[Р]', 'Р', 'графин', 'middle'),
+('[Л]-[Р]', 'Р', 'грохот', 'middle'),
+('[Л]-[Р]', 'Р', 'грузди', 'middle'),
+('[Л]-[Р]', 'Р', 'прутик', 'middle'),
+('[Л]-[Р]', 'Р', 'крышка', 'middle'),
+('[Л]-[Р]', 'Р', 'граница', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'лев', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лей', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лес', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лезь', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лезть', 'start'),
+('[Л'']-[Р'']', 'Ль', 'левый', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лейка', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лента', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лебедь', 'start'),
+('[Л'']-[Р'']', 'Ль', 'леска', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лесенка', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лежать', 'start'),
+('[Л'']-[Р'']', 'Ль', 'летать', 'start'),
+('[Л'']-[Р'']', 'Ль', 'ледник', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лесник', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лечить', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лепёшка', 'start'),
+('[Л'']-[Р'']', 'Ль', 'лебедка', 'start'),
+('[Л'']-[Р'']', 'Ль', 'ледоход', 'start'),
+('[Л'']-[Р'']', 'Ль', 'налим', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'долина', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'калина', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'Полина', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'малина', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'улитка', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'улица', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'кролик', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'спали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'сидели', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'стояли', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'стучали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'ходили', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'писали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'читали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'качели', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'бегали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'уехали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'наехали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'топали', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'пеликан', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'великан', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'сталь', 'end'),
+('[Л'']-[Р'']', 'Ль', 'эмаль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'шаль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'даль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'медаль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'педаль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'деталь', 'end'),
+('[Л'']-[Р'']', 'Ль', 'мальчик', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'дальше', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'фестиваль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'соль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'моль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'толь', 'end'),
+('[Л'']-[Р'']', 'Ль', 'боль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'руль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'ковыль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'бутыль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'мотыль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'пыль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'быль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'тюль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'вестибюль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'утиль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'фитиль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'ель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'мель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'цель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'щель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'хмель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'метель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'панель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'шинель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'щавель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'удаль', 'end'),
+('[Л'']-[Р'']', 'Ль', 'табель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'никель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'китель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'шницель', 'end'),
+('[Л'']-[Р'']', 'Ль', 'лин', 'start'),
+('[Л'']-[Р'']', 'Ль', 'клин', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'глина', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'длина', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'плита', 'middle'),
+('[Л'']-[Р'']', 'Ль', 'климат', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'ревность', 'start'),
+('[Л'']-[Р'']', 'Рь', 'регата', 'start'),
+('[Л'']-[Р'']', 'Рь', 'регент', 'start'),
+('[Л'']-[Р'']', 'Рь', 'регион', 'start'),
+('[Л'']-[Р'']', 'Рь', 'редакция', 'start'),
+('[Л'']-[Р'']', 'Рь', 'редеть', 'start'),
+('[Л'']-[Р'']', 'Рь', 'редис', 'start'),
+('[Л'']-[Р'']', 'Рь', 'редкий', 'start'),
+('[Л'']-[Р'']', 'Рь', 'редкость', 'start'),
+('[Л'']-[Р'']', 'Рь', 'реактивы', 'start'),
+('[Л'']-[Р'']', 'Рь', 'реакция', 'start'),
+('[Л'']-[Р'']', 'Рь', 'реальный', 'start'),
+('[Л'']-[Р'']', 'Рь', 'реанимация', 'start'),
+('[Л'']-[Р'']', 'Рь', 'ребус', 'start'),
+('[Л'']-[Р'']', 'Рь', 'ребята', 'start'),
+('[Л'']-[Р'']', 'Рь', 'ребячество', 'start'),
+('[Л'']-[Р'']', 'Рь', 'ревень', 'start'),
+('[Л'']-[Р'']', 'Рь', 'реветь', 'start'),
+('[Л'']-[Р'']', 'Рь', 'коряга', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'корявый', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'моряк', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'зарядка', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'нарядный', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'буря', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'гиря', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'порядок', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'снаряд', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'наряд', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'обряд', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'подряд', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'моря', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'зря', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'заря', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'Боря', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'Варя', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'горят', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'говорят', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'варят', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'парят', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'жарят', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'ныряют', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'теряют', 'middle'),
+('[Л'']-[Р'']', 'Рь', 'сударь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'бездарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'лекарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'пекарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'токарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'библиотекарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'аптекарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'слесарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'писарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'знахарь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'якорь', 'end'),
+('[Л'']-[Р'']', 'Рь', 'борьба', 'middle'),
+('[Б]-[П]', 'Б', 'бак', 'start'),
+('[Б]-[П]', 'Б', 'бар', 'start'),
+('[Б]-[П]', 'Б', 'бас', 'start'),
+('[Б]-[П]', 'Б', 'бал', 'start'),
+('[Б]-[П]', 'Б', 'банка', 'start'),
+('[Б]-[П]', 'Б', 'балка', 'start'),
+('[Б]-[П]', 'Б', 'бочка', 'start'),
+('[Б]-[П]', 'Б', 'башня', 'start'),
+('[Б]-[П]', 'Б', 'баня', 'start'),
+('[Б]-[П]', 'Б', 'база', 'start'),
+('[Б]-[П]', 'Б', 'бабушка', 'start'),
+('[Б]-[П]', 'Б', 'банан', 'start'),
+('[Б]-[П]', 'Б', 'батон', 'start'),
+('[Б]-[П]', 'Б', 'барабан', 'start'),
+('[Б]-[П]', 'Б', 'бумага', 'start'),
+('[Б]-[П]', 'Б', 'булка', 'start'),
+('[Б]-[П]', 'Б', 'бусы', 'start'),
+('[Б]-[П]', 'Б', 'буквы', 'start'),
+('[Б]-[П]', 'Б', 'буфет', 'start'),
+('[Б]-[П]', 'Б', 'букет', 'start'),
+('[Б]-[П]', 'Б', 'бутон', 'start'),
+('[Б]-[П]', 'Б', 'быль', 'start'),
+('[Б]-[П]', 'Б', 'бык', 'start'),
+('[Б]-[П]', 'Б', 'был', 'start'),
+('[Б]-[П]', 'Б', 'былина', 'start'),
+('[Б]-[П]', 'Б', 'рыба', 'middle'),
+('[Б]-[П]', 'Б', 'изба', 'middle'),
+('[Б]-[П]', 'Б', 'тыква', 'middle'),
+('[Б]-[П]', 'Б', 'шуба', 'middle'),
+('[Б]-[П]', 'Б', 'губа', 'middle'),
+('[Б]-[П]', 'Б', 'труба', 'middle'),
+('[Б]-[П]', 'Б', 'рубаха', 'middle'),
+('[Б]-[П]', 'Б', 'арбуз', 'middle'),
+('[Б]-[П]', 'Б', 'арбуха', 'middle'),
+('[Б]-[П]', 'Б', 'кабан', 'middle'),
+('[Б]-[П]', 'Б', 'собака', 'middle'),
+('[Б]-[П]', 'Б', 'работа', 'middle'),
+('[Б]-[П]', 'Б', 'забор', 'middle'),
+('[Б]-[П]', 'Б', 'забота', 'middle'),
+('[Б]-[П]', 'Б', 'табун', 'middle'),
+('[Б]-[П]', 'Б', 'обувь', 'middle'),
+('[Б]-[П]', 'Б', 'азбука', 'middle'),
+('[Б]-[П]', 'Б', 'ябеда', 'middle'),
+('[Б]-[П]', 'Б', 'зубы', 'middle'),
+('[Б]-[П]', 'Б', 'дубы', 'middle'),
+('[Б]-[П]', 'Б', 'грибы', 'middle'),
+('[Б]-[П]', 'Б', 'рубль', 'middle'),
+('[Б]-[П]', 'Б', 'гриб', 'end'),
+('[Б]-[П]', 'Б', 'зуб', 'end'),
+('[Б]-[П]', 'Б', 'дуб', 'end'),
+('[Б]-[П]', 'Б', 'лоб', 'end'),
+('[Б]-[П]', 'Б', 'столб', 'end'),
+('[Б]-[П]', 'Б', 'герб', 'end'),
+('[Б]-[П]', 'Б', 'хлеб', 'end'),
+('[Б]-[П]', 'Б', 'боб', 'start'),
+('[Б]-[П]', 'Б', 'сноб', 'end'),
+('[Б]-[П]', 'П', 'пар', 'start'),
+('[Б]-[П]', 'П', 'пас', 'start'),
+('[Б]-[П]', 'П', 'пал', 'start'),
+('[Б]-[П]', 'П', 'панама', 'start'),
+('[Б]-[П]', 'П', 'палка', 'start'),
+('[Б]-[П]', 'П', 'почка', 'start'),
+('[Б]-[П]', 'П', 'пашня', 'start'),
+('[Б]-[П]', 'П', 'папа', 'start'),
+('[Б]-[П]', 'П', 'папка', 'start'),
+('[Б]-[П]', 'П', 'пакет', 'start'),
+('[Б]-[П]', 'П', 'пончик', 'start'),
+('[Б]-[П]', 'П', 'пудра', 'start'),
+('[Б]-[П]', 'П', 'пума', 'start'),
+('[Б]-[П]', 'П', 'пуля', 'start'),
+('[Б]-[П]', 'П', 'пушка', 'start'),
+('[Б]-[П]', 'П', 'пух', 'start'),
+('[Б]-[П]', 'П', 'путь', 'start'),
+('[Б]-[П]', 'П', 'пыль', 'start'),
+('[Б]-[П]', 'П', 'липа', 'middle'),
+('[Б]-[П]', 'П', 'лапа', 'middle'),
+('[Б]-[П]', 'П', 'лупа', 'middle'),
+('[Б]-[П]', 'П', 'тапки', 'middle'),
+('[Б]-[П]', 'П', 'лампа', 'middle'),
+('[Б]-[П]', 'П', 'капуста', 'middle'),
+('[Б]-[П]', 'П', 'опушка', 'middle'),
+('[Б]-[П]', 'П', 'тропа', 'middle'),
+('[Б]-[П]', 'П', 'шапка', 'middle'),
+('[Б]-[П]', 'П', 'папаха', 'start'),
+('[Б]-[П]', 'П', 'репа', 'middle'),
+('[Б]-[П]', 'П', 'крупа', 'middle'),
+('[Б]-[П]', 'П', 'купать', 'middle'),
+('[Б]-[П]', 'П', 'топать', 'middle'),
+('[Б]-[П]', 'П', 'копать', 'middle'),
+('[Б]-[П]', 'П', 'опора', 'middle'),
+('[Б]-[П]', 'П', 'капать', 'middle'),
+('[Б]-[П]', 'П', 'лопата', 'middle'),
+('[Б]-[П]', 'П', 'запах', 'middle'),
+('[Б]-[П]', 'П', 'опала', 'middle'),
+('[Б]-[П]', 'П', 'палата', 'start'),
+('[Б]-[П]', 'П', 'панель', 'start'),
+('[Б]-[П]', 'П', 'суп', 'end'),
+('[Б]-[П]', 'П', 'стоп', 'end'),
+('[Б]-[П]', 'П', 'топ', 'end'),
+('[Б]-[П]', 'П', 'поп', 'start'),
+('[Б]-[П]', 'П', 'оп', 'end'),
+('[Б]-[П]', 'П', 'клоп', 'end'),
+('[Б]-[П]', 'П', 'коп', 'end'),
+('[Б]-[П]', 'П', 'сноп', 'end'),
+('[Б]-[П]', 'П', 'укроп', 'end'),
+('[Б]-[П]', 'П', 'сироп', 'end'),
+('[Б]-[П]', 'П', 'серп', 'end'),
+('[Б]-[П]', 'П', 'карп', 'end'),
+('[Б]-[П]', 'П', 'герпес', 'middle'),
+('[Б]-[П]', 'П', 'кепка', 'middle'),
+('[Б'']-[П'']', 'Бь', 'бег', 'start'),
+('[Б'']-[П'']', 'Бь', 'белка', 'start'),
+('[Б'']-[П'']', 'Бь', 'берег', 'start'),
+('[Б'']-[П'']', 'Бь', 'билет', 'start'),
+('[Б'']-[П'']', 'Бь', 'бинт', 'start'),
+('[Б'']-[П'']', 'Бь', 'битва', 'start'),
+('[Б'']-[П'']', 'Бь', 'бисер', 'start'),
+('[Б'']-[П'']', 'Бь', 'белый', 'start'),
+('[Б'']-[П'']', 'Бь', 'бедный', 'start'),
+('[Б'']-[П'']', 'Бь', 'бегать', 'start'),
+('[Б'']-[П'']', 'Бь', 'беда', 'start'),
+('[Б'']-[П'']', 'Бь', 'белить', 'start'),
+('[Б'']-[П'']', 'Бь', 'береза', 'start'),
+('[Б'']-[П'']', 'Бь', 'беседа', 'start'),
+('[Б'']-[П'']', 'Бь', 'беречь', 'start'),
+('[Б'']-[П'']', 'Бь', 'любить', 'middle'),
+('[Б'']-[П'']', 'Бь', 'рябина', 'middle'),
+('[Б'']-[П'']', 'Бь', 'ребята', 'middle'),
+('[Б'']-[П'']', 'Бь', 'собирать', 'middle'),
+('[Б'']-[П'']', 'Бь', 'победа', 'middle'),
+('[Б'']-[П'']', 'Бь', 'оби дать', 'middle'),
+('[Б'']-[П'']', 'Бь', 'обида', 'middle'),
+('[Б'']-[П'']', 'Бь', 'рубить', 'middle'),
+('[Б'']-[П'']', 'Бь', 'губить', 'middle'),
+('[Б'']-[П'']', 'Бь', 'дубить', 'middle'),
+('[Б'']-[П'']', 'Бь', 'лебедь', 'middle'),
+('[Б'']-[П'']', 'Бь', 'рябь', 'end'),
+('[Б'']-[П'']', 'Бь', 'зыбь', 'end'),
+('[Б'']-[П'']', 'Бь', 'дробь', 'end'),
+('[Б'']-[П'']', 'Бь', 'голубь', 'end'),
+('[Б'']-[П'']', 'Бь', 'гребень', 'middle'),
+('[Б'']-[П'']', 'Бь', 'ребенок', 'middle'),
+('[Б'']-[П'']', 'Бь', 'трубить', 'middle'),
+('[Б'']-[П'']', 'Бь', 'грабить', 'middle'),
+('[Б'']-[П'']', 'Бь', 'слабить', 'middle'),
+('[Б'']-[П'']', 'Пь', 'пел', 'start'),
+('[Б'']-[П'']', 'Пь', 'петь', 'start'),
+('[Б'']-[П'']', 'Пь', 'пена', 'start'),
+('[Б'']-[П'']', 'Пь', 'пень', 'start'),
+('[Б'']-[П'']', 'Пь', 'песня', 'start'),
+('[Б'']-[П'']', 'Пь', 'перо', 'start'),
+('[Б'']-[П'']', 'Пь', 'пеший', 'start'),
+('[Б'']-[П'']', 'Пь', 'печь', 'start'),
+('[Б'']-[П'']', 'Пь', 'пила', 'start'),
+('[Б'']-[П'']', 'Пь', 'пир', 'start'),
+('[Б'']-[П'']', 'Пь', 'писать', 'start'),
+('[Б'']-[П'']', 'Пь', 'питать', 'start'),
+('[Б'']-[П'']', 'Пь', 'пить', 'start'),
+('[Б'']-[П'']', 'Пь', 'пищать', 'start'),
+('[Б'']-[П'']', 'Пь', 'купить', 'middle'),
+('[Б'']-[П'']', 'Пь', 'сопеть', 'middle'),
+('[Б'']-[П'']', 'Пь', 'копить', 'middle'),
+('[Б'']-[П'']', 'Пь', 'топить', 'middle'),
+('[Б'']-[П'']', 'Пь', 'лепить', 'middle'),
+('[Б'']-[П'']', 'Пь', 'слепить', 'middle'),
+('[Б'']-[П'']', 'Пь', 'насыпь', 'end'),
+('[Б'']-[П'']', 'Пь', 'сыпь', 'end'),
+('[Б'']-[П'']', 'Пь', 'цепь', 'end'),
+('[Б'']-[П'']', 'Пь', 'степь', 'end'),
+('[Б'']-[П'']', 'Пь', 'крепь', 'end'),
+('[Б'']-[П'']', 'Пь', 'дрепь', 'end'),
+('[Б'']-[П'']', 'Пь', 'капель', 'middle'),
+('[Б'']-[П'']', 'Пь', 'репей', 'middle'),
+('[Б'']-[П'']', 'Пь', 'тюпик', 'middle'),
+('[Б'']-[П'']', 'Пь', 'опека', 'middle'),
+('[Д]-[Т]', 'Д', 'дар', 'start'),
+('[Д]-[Т]', 'Д', 'дал', 'start'),
+('[Д]-[Т]', 'Д', 'дам', 'start'),
+('[Д]-[Т]', 'Д', 'дата', 'start'),
+('[Д]-[Т]', 'Д', 'дача', 'start'),
+('[Д]-[Т]', 'Д', 'даль', 'start'),
+('[Д]-[Т]', 'Д', 'дама', 'start'),
+('[Д]-[Т]', 'Д', 'дуб', 'start'),
+('[Д]-[Т]', 'Д', 'дух', 'start'),
+('[Д]-[Т]', 'Д', 'душ', 'start'),
+('[Д]-[Т]', 'Д', 'душа', 'start'),
+('[Д]-[Т]', 'Д', 'дуга', 'start'),
+('[Д]-[Т]', 'Д', 'дудка', 'start'),
+('[Д]-[Т]', 'Д', 'дым', 'start'),
+('[Д]-[Т]', 'Д', 'дыра', 'start'),
+('[Д]-[Т]', 'Д', 'дыня', 'start'),
+('[Д]-[Т]', 'Д', 'дом', 'start'),
+('[Д]-[Т]', 'Д', 'дочка', 'start'),
+('[Д]-[Т]', 'Д', 'доска', 'start'),
+('[Д]-[Т]', 'Д', 'дорога', 'start'),
+('[Д]-[Т]', 'Д', 'донор', 'start'),
+('[Д]-[Т]', 'Д', 'доктор', 'start'),
+('[Д]-[Т]', 'Д', 'досуг', 'start'),
+('[Д]-[Т]', 'Д', 'вода', 'middle'),
+('[Д]-[Т]', 'Д', 'беда', 'middle'),
+('[Д]-[Т]', 'Д', 'еда', 'middle'),
+('[Д]-[Т]', 'Д', 'звезда', 'middle'),
+('[Д]-[Т]', 'Д', 'орда', 'middle'),
+('[Д]-[Т]', 'Д', 'руда', 'middle'),
+('[Д]-[Т]', 'Д', 'сода', 'middle'),
+('[Д]-[Т]', 'Д', 'гнездо', 'middle'),
+('[Д]-[Т]', 'Д', 'ведро', 'middle'),
+('[Д]-[Т]', 'Д', 'бедро', 'middle'),
+('[Д]-[Т]', 'Д', 'удочка', 'middle'),
+('[Д]-[Т]', 'Д', 'одежда', 'middle'),
+('[Д]-[Т]', 'Д', 'победа', 'middle'),
+('[Д]-[Т]', 'Д', 'ягода', 'middle'),
+('[Д]-[Т]', 'Д', 'свобода', 'middle'),
+('[Д]-[Т]', 'Д', 'народ', 'end'),
+('[Д]-[Т]', 'Д', 'сад', 'end'),
+('[Д]-[Т]', 'Д', 'лад', 'end'),
+('[Д]-[Т]', 'Д', 'клад', 'end'),
+('[Д]-[Т]', 'Д', 'взгляд', 'end'),
+('[Д]-[Т]', 'Д', 'град', 'end'),
+('[Д]-[Т]', 'Д', 'пруд', 'end'),
+('[Д]-[Т]', 'Д', 'труд', 'end'),
+('[Д]-[Т]', 'Д', 'верблюд', 'end'),
+('[Д]-[Т]', 'Д', 'сосед', 'end'),
+('[Д]-[Т]', 'Д', 'обед', 'end'),
+('[Д]-[Т]', 'Д', 'след', 'end'),
+('[Д]-[Т]', 'Д', 'лед', 'end'),
+('[Д]-[Т]', 'Д', 'мед', 'end'),
+('[Д]-[Т]', 'Д', 'плед', 'end'),
+('[Д]-[Т]', 'Д', 'бред', 'end'),
+('[Д]-[Т]', 'Т', 'там', 'start'),
+('[Д]-[Т]', 'Т', 'так', 'start'),
+('[Д]-[Т]', 'Т', 'таз', 'start'),
+('[Д]-[Т]', 'Т', 'тайна', 'start'),
+('[Д]-[Т]', 'Т', 'танец', 'start'),
+('[Д]-[Т]', 'Т', 'тапки', 'start'),
+('[Д]-[Т]', 'Т', 'табун', 'start'),
+('[Д]-[Т]', 'Т', 'тачка', 'start'),
+('[Д]-[Т]', 'Т', 'туман', 'start'),
+('[Д]-[Т]', 'Т', 'туча', 'start'),
+('[Д]-[Т]', 'Т', 'тундра', 'start'),
+('[Д]-[Т]', 'Т', 'тут', 'start'),
+('[Д]-[Т]', 'Т', 'тыл', 'start'),
+('[Д]-[Т]', 'Т', 'тыква', 'start'),
+('[Д]-[Т]', 'Т', 'тон', 'start'),
+('[Д]-[Т]', 'Т', 'ток', 'start'),
+('[Д]-[Т]', 'Т', 'точка', 'start'),
+('[Д]-[Т]', 'Т', 'топор', 'start'),
+('[Д]-[Т]', 'Т', 'тополь', 'start'),
+('[Д]-[Т]', 'Т', 'торт', 'start'),
+('[Д]-[Т]', 'Т', 'товар', 'start'),
+('[Д]-[Т]', 'Т', 'тонна', 'start'),
+('[Д]-[Т]', 'Т', 'топот', 'start'),
+('[Д]-[Т]', 'Т', 'вата', 'middle'),
+('[Д]-[Т]', 'Т', 'нота', 'middle'),
+('[Д]-[Т]', 'Т', 'мята', 'middle'),
+('[Д]-[Т]', 'Т', 'сито', 'middle'),
+('[Д]-[Т]', 'Т', 'лото', 'middle'),
+('[Д]-[Т]', 'Т', 'фото', 'middle'),
+('[Д]-[Т]', 'Т', 'пята', 'middle'),
+('[Д]-[Т]', 'Т', 'каток', 'middle'),
+('[Д]-[Т]', 'Т', 'платок', 'middle'),
+('[Д]-[Т]', 'Т', 'поток', 'middle'),
+('[Д]-[Т]', 'Т', 'восток', 'middle'),
+('[Д]-[Т]', 'Т', 'листок', 'middle'),
+('[Д]-[Т]', 'Т', 'моток', 'middle'),
+('[Д]-[Т]', 'Т', 'венок', 'middle'),
+('[Д]-[Т]', 'Т', 'листок', 'middle'),
+('[Д]-[Т]', 'Т', 'мостик', 'middle'),
+('[Д]-[Т]', 'Т', 'хвостик', 'middle'),
+('[Д]-[Т]', 'Т', 'тост', 'start'),
+('[Д]-[Т]', 'Т', 'пост', 'end'),
+('[Д]-[Т]', 'Т', 'рост', 'end'),
+('[Д]-[Т]', 'Т', 'мост', 'end'),
+('[Д]-[Т]', 'Т', 'кот', 'end'),
+('[Д]-[Т]', 'Т', 'рот', 'end'),
+('[Д]-[Т]', 'Т', 'крот', 'end'),
+('[Д]-[Т]', 'Т', 'салат', 'end'),
+('[Д]-[Т]', 'Т', 'халат', 'end'),
+('[Д]-[Т]', 'Т', 'брат', 'end'),
+('[Д]-[Т]', 'Т', 'закат', 'end'),
+('[Д]-[Т]', 'Т', 'результат', 'end'),
+('[Д]-[Т]', 'Т', 'кит', 'end'),
+('[Д]-[Т]', 'Т', 'бит', 'end'),
+('[Д]-[Т]', 'Т', 'щит', 'end'),
+('[Д'']-[Т'']', 'Дь', 'дед', 'start'),
+('[Д'']-[Т'']', 'Дь', 'день', 'start'),
+('[Д'']-[Т'']', 'Дь', 'деньги', 'start'),
+('[Д'']-[Т'']', 'Дь', 'дело', 'start'),
+('[Д'']-[Т'']', 'Дь', 'делать', 'start'),
+('[Д'']-[Т'']', 'Дь', 'десять', 'start'),
+('[Д'']-[Т'']', 'Дь', 'дети', 'start'),
+('[Д'']-[Т'']', 'Дь', 'детство', 'start'),
+('[Д'']-[Т'']', 'Дь', 'диво', 'start'),
+('[Д'']-[Т'']', 'Дь', 'диван', 'start'),
+('[Д'']-[Т'']', 'Дь', 'диктор', 'start'),
+('[Д'']-[Т'']', 'Дь', 'динамо', 'start'),
+('[Д'']-[Т'']', 'Дь', 'диск', 'start'),
+('[Д'']-[Т'']', 'Дь', 'один', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'среда', NULL),
+('[Д'']-[Т'']', 'Дь', 'беседа', NULL),
+('[Д'']-[Т'']', 'Дь', 'соседи', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'медик', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'победить', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'обидеть', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'видеть', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'радио', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'надевать', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'садик', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'дядя', 'start'),
+('[Д'']-[Т'']', 'Дь', 'младенец', 'middle'),
+('[Д'']-[Т'']', 'Дь', 'гвоздь', 'end'),
+('[Д'']-[Т'']', 'Дь', 'гордость', NULL),
+('[Д'']-[Т'']', 'Дь', 'жадность', NULL),
+('[Д'']-[Т'']', 'Дь', 'радость', NULL),
+('[Д'']-[Т'']', 'Дь', 'бледность', NULL),
+('[Д'']-[Т'']', 'Дь', 'сладость', NULL),
+('[Д'']-[Т'']', 'Дь', 'медь', 'end'),
+('[Д'']-[Т'']', 'Дь', 'лебедь', 'end'),
+('[Д'']-[Т'']', 'Дь', 'лошадь', 'end'),
+('[Д'']-[Т'']', 'Дь', 'очередь', 'end'),
+('[Д'']-[Т'']', 'Дь', 'тетрадь', 'end'),
+('[Д'']-[Т'']', 'Ть', 'тень', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тесто', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тема', 'start'),
+('[Д'']-[Т'']', 'Ть', 'телега', 'start'),
+('[Д'']-[Т'']', 'Ть', 'телефон', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тело', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тетя', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тихий', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тина', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тир', 'start'),
+('[Д'']-[Т'']', 'Ть', 'титул', 'start'),
+('[Д'']-[Т'']', 'Ть', 'типаж', 'start'),
+('[Д'']-[Т'']', 'Ть', 'стена', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'утенок', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'котенок', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'аптека', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'монета', NULL),
+('[Д'']-[Т'']', 'Ть', 'котел', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'потеря', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'артист', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'партия', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'картина', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'рутина', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'мотив', 'middle'),
+('[Д'']-[Т'']', 'Ть', 'тюлень', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тюрьма', 'start'),
+('[Д'']-[Т'']', 'Ть', 'тюбик', 'start'),
+('[Д'']-[Т'']', 'Ть', 'петь', 'end'),
+('[Д'']-[Т'']', 'Ть', 'сеть', 'end'),
+('[Д'']-[Т'']', 'Ть', 'деталь', NULL),
+('[Д'']-[Т'']', 'Ть', 'гость', 'end'),
+('[Д'']-[Т'']', 'Ть', 'кость', 'end'),
+('[Д'']-[Т'']', 'Ть', 'грусть', 'end'),
+('[Д'']-[Т'']', 'Ть', 'честь', 'end'),
+('[Д'']-[Т'']', 'Ть', 'весть', 'end'),
+('[Д'']-[Т'']', 'Ть', 'пасть', 'end'),
+('[Д'']-[Т'']', 'Ть', 'часть', 'end'),
+('[Д'']-[Т'']', 'Ть', 'шесть', 'end'),
+('[Д'']-[Т'']', 'Ть', 'смерть', 'end'),
+('[Д'']-[Т'']', 'Ть', 'дверь', NULL),
+('[В]-[Ф]', 'В', 'вата', 'start'),
+('[В]-[Ф]', 'В', 'вагон', 'start'),
+('[В]-[Ф]', 'В', 'ваза', 'start'),
+('[В]-[Ф]', 'В', 'валенки', 'start'),
+('[В]-[Ф]', 'В', 'ванна', 'start'),
+('[В]-[Ф]', 'В', 'варежки', 'start'),
+('[В]-[Ф]', 'В', 'варить', 'start'),
+('[В]-[Ф]', 'В', 'вахта', 'start'),
+('[В]-[Ф]', 'В', 'воз', 'start'),
+('[В]-[Ф]', 'В', 'вода', 'start'),
+('[В]-[Ф]', 'В', 'водить', 'start'),
+('[В]-[Ф]', 'В', 'возить', 'start'),
+('[В]-[Ф]', 'В', 'волк', 'start'),
+('[В]-[Ф]', 'В', 'волна', 'start'),
+('[В]-[Ф]', 'В', 'ворона', 'start'),
+('[В]-[Ф]', 'В', 'ворота', 'start'),
+('[В]-[Ф]', 'В', 'восток', 'start'),
+('[В]-[Ф]', 'В', 'вулкан', 'start'),
+('[В]-[Ф]', 'В', 'выход', 'start'),
+('[В]-[Ф]', 'В', 'вымыть', 'start'),
+('[В]-[Ф]', 'В', 'вызов', 'start'),
+('[В]-[Ф]', 'В', 'корова', 'middle'),
+('[В]-[Ф]', 'В', 'канава', 'middle'),
+('[В]-[Ф]', 'В', 'голова', 'middle'),
+('[В]-[Ф]', 'В', 'слава', 'middle'),
+('[В]-[Ф]', 'В', 'забава', 'middle'),
+('[В]-[Ф]', 'В', 'трава', 'middle'),
+('[В]-[Ф]', 'В', 'дрова', 'middle'),
+('[В]-[Ф]', 'В', 'сова', 'middle'),
+('[В]-[Ф]', 'В', 'клюква', 'middle'),
+('[В]-[Ф]', 'В', 'буква', 'middle'),
+('[В]-[Ф]', 'В', 'тыква', 'middle'),
+('[В]-[Ф]', 'В', 'кров', 'end'),
+('[В]-[Ф]', 'В', 'улов', 'end'),
+('[В]-[Ф]', 'В', 'клов', 'end'),
+('[В]-[Ф]', 'В', 'ров', 'end'),
+('[В]-[Ф]', 'В', 'лев', 'end'),
+('[В]-[Ф]', 'В', 'гнев', 'end'),
+('[В]-[Ф]', 'В', 'зев', 'end'),
+('[В]-[Ф]', 'В', 'посев', 'end'),
+('[В]-[Ф]', 'В', 'напев', 'end'),
+('[В]-[Ф]', 'В', 'распев', 'end'),
+('[В]-[Ф]', 'В', 'синев', 'end'),
+('[В]-[Ф]', 'Ф', 'факт', 'start'),
+('[В]-[Ф]', 'Ф', 'фара', 'start'),
+('[В]-[Ф]', 'Ф', 'фабрика', 'start'),
+('[В]-[Ф]', 'Ф', 'фамилия', 'start'),
+('[В]-[Ф]', 'Ф', 'фартук', 'start'),
+('[В]-[Ф]', 'Ф', 'факел', 'start'),
+('[В]-[Ф]', 'Ф', 'фокус', 'start'),
+('[В]-[Ф]', 'Ф', 'форма', 'start'),
+('[В]-[Ф]', 'Ф', 'фонарь', 'start'),
+('[В]-[Ф]', 'Ф', 'фотограф', 'start'),
+('[В]-[Ф]', 'Ф', 'фонтан', 'start'),
+('[В]-[Ф]', 'Ф', 'фраза', 'start'),
+('[В]-[Ф]', 'Ф', 'фрукт', 'start'),
+('[В]-[Ф]', 'Ф', 'туфли', 'middle'),
+('[В]-[Ф]', 'Ф', 'кофта', 'middle'),
+('[В]-[Ф]', 'Ф', 'лифт', 'middle'),
+('[В]-[Ф]', 'Ф', 'шкаф', 'end'),
+('[В]-[Ф]', 'Ф', 'граф', 'end'),
+('[В]-[Ф]', 'Ф', 'риф', 'end'),
+('[В]-[Ф]', 'Ф', 'гольф', 'end'),
+('[В]-[Ф]', 'Ф', 'миф', 'end'),
+('[В]-[Ф]', 'Ф', 'залив', 'middle'),
+('[В]-[Ф]', 'Ф', 'эфир', 'middle'),
+('[В]-[Ф]', 'Ф', 'софа', 'middle'),
+('[В]-[Ф]', 'Ф', 'телефон', 'middle'),
+('[В]-[Ф]', 'Ф', 'светофор', 'middle'),
+('[В]-[Ф]', 'Ф', 'кафе', 'middle'),
+('[В]-[Ф]', 'Ф', 'жираф', 'end'),
+('[В]-[Ф]', 'Ф', 'шеф', 'end'),
+('[В]-[Ф]', 'Ф', 'шарф', 'end'),
+('[В]-[Ф]', 'Ф', 'буфет', 'middle'),
+('[В]-[Ф]', 'Ф', 'конфета', 'middle'),
+('[В]-[Ф]', 'Ф', 'кафель', 'middle'),
+('[В]-[Ф]', 'Ф', 'кофе', 'middle'),
+('[В'']-[Ф'']', 'Вь', 'веер', 'start'),
+('[В'']-[Ф'']', 'Вь', 'век', 'start'),
+('[В'']-[Ф'']', 'Вь', 'веко', 'start'),
+('[В'']-[Ф'']', 'Вь', 'велосипед', 'start'),
+('[В'']-[Ф'']', 'Вь', 'венок', 'start'),
+('[В'']-[Ф'']', 'Вь', 'вера', 'start'),
+('[В'']-[Ф'']', 'Вь', 'верба', 'start'),
+('[В'']-[Ф'']', 'Вь', 'веревка', 'start'),
+('[В'']-[Ф'']', 'Вь', 'ветка', 'start'),
+('[В'']-[Ф'']', 'Вь', 'ветер', 'start'),
+('[В'']-[Ф'']', 'Вь', 'вечер', 'start'),
+('[В'']-[Ф'']', 'Вь', 'весы', 'start'),
+('[В'']-[Ф'']', 'Вь', 'весна', 'start'),
+('[В'']-[Ф'']', 'Вь', 'вести', 'start'),
+('[В'']-[Ф'']', 'Вь', 'винт', 'start'),
+('[В'']-[Ф'']', 'Вь', 'вишня', 'start'),
+('[В'']-[Ф'']', 'Вь', 'видео', 'start'),
+('[В'']-[Ф'']', 'Вь', 'победить', NULL),
+('[В'']-[Ф'']', 'Вь', 'медведь', 'middle'),
+('[В'']-[Ф'']', 'Вь', 'обвинить', 'middle'),
+('[В'']-[Ф'']', 'Вь', 'ответить', 'middle'),
+('[В'']-[Ф'']', 'Вь', 'кровь', 'end'),
+('[В'']-[Ф'']', 'Вь', 'любовь', 'end'),
+('[В'']-[Ф'']', 'Вь', 'бровь', 'end'),
+('[В'']-[Ф'']', 'Вь', 'морковь', 'end'),
+('[В'']-[Ф'']', 'Вь', 'верь', 'start'),
+('[В'']-[Ф'']', 'Вь', 'дверь', 'middle'),
+('[В'']-[Ф'']', 'Вь', 'зверь', 'middle'),
+('[В'']-[Ф'']', 'Вь', 'ревень', 'middle'),
+('[В'']-[Ф'']', 'Вь', 'сентябрь', NULL),
+('[В'']-[Ф'']', 'Вь', 'октябрь', NULL),
+('[В'']-[Ф'']', 'Вь', 'ноябрь', NULL),
+('[В'']-[Ф'']', 'Вь', 'декабрь', NULL),
+('[В'']-[Ф'']', 'Вь', 'январь', NULL),
+('[В'']-[Ф'']', 'Вь', 'февраль', NULL),
+('[В'']-[Ф'']', 'Фь', 'фен', 'start'),
+('[В'']-[Ф'']', 'Фь', 'феникс', 'start'),
+('[В'']-[Ф'']', 'Фь', 'фея', 'start'),
+('[В'']-[Ф'']', 'Фь', 'фейерверк', 'start'),
+('[В'']-[Ф'']', 'Фь', 'физика', 'start'),
+('[В'']-[Ф'']', 'Фь', 'филин', 'start'),
+('[В'']-[Ф'']', 'Фь', 'фильм', 'start'),
+('[В'']-[Ф'']', 'Фь', 'финиш', 'start'),
+('[В'']-[Ф'']', 'Фь', 'кофе', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'профиль', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'портфель', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'трюфель', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'конфетти', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'дефект', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'эффект', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'буфет', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'пуфик', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'софит', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'графин', 'middle'),
+('[В'']-[Ф'']', 'Фь', 'кефир', 'middle'),
+('[Г]-[К]', 'Г', 'газ', 'start'),
+('[Г]-[К]', 'Г', 'газета', 'start'),
+('[Г]-[К]', 'Г', 'галка', 'start'),
+('[Г]-[К]', 'Г', 'гамак', 'start'),
+('[Г]-[К]', 'Г', 'гараж', 'start'),
+('[Г]-[К]', 'Г', 'гармонь', 'start'),
+('[Г]-[К]', 'Г', 'город', 'start'),
+('[Г]-[К]', 'Г', 'горка', 'start'),
+('[Г]-[К]', 'Г', 'горох', 'start'),
+('[Г]-[К]', 'Г', 'гости', 'start'),
+('[Г]-[К]', 'Г', 'голова', 'start'),
+('[Г]-[К]', 'Г', 'голос', 'start'),
+('[Г]-[К]', 'Г', 'голубь', 'start'),
+('[Г]-[К]', 'Г', 'гром', 'start'),
+('[Г]-[К]', 'Г', 'груша', 'start'),
+('[Г]-[К]', 'Г', 'грузовик', 'start'),
+('[Г]-[К]', 'Г', 'грядка', 'start'),
+('[Г]-[К]', 'Г', 'губа', 'start'),
+('[Г]-[К]', 'Г', 'гулять', 'start'),
+('[Г]-[К]', 'Г', 'гусь', 'start'),
+('[Г]-[К]', 'Г', 'нога', 'middle'),
+('[Г]-[К]', 'Г', 'дорога', 'middle'),
+('[Г]-[К]', 'Г', 'ягода', 'middle'),
+('[Г]-[К]', 'Г', 'радуга', 'middle'),
+('[Г]-[К]', 'Г', 'бумага', 'middle'),
+('[Г]-[К]', 'Г', 'загадка', 'middle'),
+('[Г]-[К]', 'Г', 'попугай', 'middle'),
+('[Г]-[К]', 'Г', 'огонь', 'middle'),
+('[Г]-[К]', 'Г', 'бегать', 'middle'),
+('[Г]-[К]', 'Г', 'вагон', 'middle'),
+('[Г]-[К]', 'Г', 'магазин', 'middle'),
+('[Г]-[К]', 'Г', 'пироги', 'middle'),
+('[Г]-[К]', 'Г', 'утюг', 'end'),
+('[Г]-[К]', 'Г', 'луг', 'end'),
+('[Г]-[К]', 'Г', 'снег', 'end'),
+('[Г]-[К]', 'Г', 'берег', 'end'),
+('[Г]-[К]', 'Г', 'круг', 'end'),
+('[Г]-[К]', 'Г', 'друг', 'end'),
+('[Г]-[К]', 'Г', 'враг', 'end'),
+('[Г]-[К]', 'Г', 'флаг', 'end'),
+('[Г]-[К]', 'Г', 'шаг', 'end'),
+('[Г]-[К]', 'Г', 'овраг', 'end'),
+('[Г]-[К]', 'Г', 'творог', 'end'),
+('[Г]-[К]', 'К', 'каша', 'start'),
+('[Г]-[К]', 'К', 'камень', 'start'),
+('[Г]-[К]', 'К', 'канат', 'start'),
+('[Г]-[К]', 'К', 'капуста', 'start'),
+('[Г]-[К]', 'К', 'карандаш', 'start'),
+('[Г]-[К]', 'К', 'картина', 'start'),
+('[Г]-[К]', 'К', 'карман', 'start'),
+('[Г]-[К]', 'К', 'касса', 'start'),
+('[Г]-[К]', 'К', 'кот', 'start'),
+('[Г]-[К]', 'К', 'кофе', 'start'),
+('[Г]-[К]', 'К', 'кость', 'start'),
+('[Г]-[К]', 'К', 'кошка', 'start'),
+('[Г]-[К]', 'К', 'корова', 'start'),
+('[Г]-[К]', 'К', 'корзина', 'start'),
+('[Г]-[К]', 'К', 'коса', 'start'),
+('[Г]-[К]', 'К', 'красный', 'start'),
+('[Г]-[К]', 'К', 'крупа', 'start'),
+('[Г]-[К]', 'К', 'кровать', 'start'),
+('[Г]-[К]', 'К', 'кукла', 'start'),
+('[Г]-[К]', 'К', 'курица', 'start'),
+('[Г]-[К]', 'К', 'рука', 'middle'),
+('[Г]-[К]', 'К', 'река', 'middle'),
+('[Г]-[К]', 'К', 'мука', 'middle'),
+('[Г]-[К]', 'К', 'щука', 'middle'),
+('[Г]-[К]', 'К', 'тыква', 'middle'),
+('[Г]-[К]', 'К', 'буква', 'middle'),
+('[Г]-[К]', 'К', 'палка', 'middle'),
+('[Г]-[К]', 'К', 'белка', 'middle'),
+('[Г]-[К]', 'К', 'полка', 'middle'),
+('[Г]-[К]', 'К', 'чайка', 'middle'),
+('[Г]-[К]', 'К', 'майка', 'middle'),
+('[Г]-[К]', 'К', 'шайка', 'middle'),
+('[Г]-[К]', 'К', 'сказка', 'middle'),
+('[Г]-[К]', 'К', 'краска', 'start'),
+('[Г]-[К]', 'К', 'ласка', 'middle'),
+('[Г]-[К]', 'К', 'маска', 'middle'),
+('[Г]-[К]', 'К', 'каток', 'start'),
+('[Г]-[К]', 'К', 'платок', 'end'),
+('[Г]-[К]', 'К', 'урок', 'end'),
+('[Г]-[К]', 'К', 'порок', 'end'),
+('[Г]-[К]', 'К', 'венок', 'end'),
+('[Г]-[К]', 'К', 'сок', 'end'),
+('[Г]-[К]', 'К', 'ток', 'end'),
+('[Г]-[К]', 'К', 'бок', 'end'),
+('[Г]-[К]', 'К', 'рок', 'end'),
+('[Г]-[К]', 'К', 'срок', 'end'),
+('[Г'']-[К'']', 'Гь', 'гений', 'start'),
+('[Г'']-[К'']', 'Гь', 'генерал', 'start'),
+('[Г'']-[К'']', 'Гь', 'география', 'start'),
+('[Г'']-[К'']', 'Гь', 'герой', 'start'),
+('[Г'']-[К'']', 'Гь', 'гигант', 'start'),
+('[Г'']-[К'']', 'Гь', 'гимн', 'start'),
+('[Г'']-[К'']', 'Гь', 'гитара', 'start'),
+('[Г'']-[К'']', 'Гь', 'снеги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'враги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'шаги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'ноги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'дороги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'круги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'враги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'книги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'деньги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'серьги', 'middle'),
+('[Г'']-[К'']', 'Гь', 'другие', 'middle'),
+('[Г'']-[К'']', 'Гь', 'многие', 'middle'),
+('[Г'']-[К'']', 'Гь', 'строгие', 'middle'),
+('[Г'']-[К'']', 'Гь', 'берегите', 'middle'),
+('[Г'']-[К'']', 'Гь', 'бегите', 'middle'),
+('[Г'']-[К'']', 'Гь', 'пироги', 'middle'),
+('[Г'']-[К'']', 'Кь', 'кекс', 'start'),
+('[Г'']-[К'']', 'Кь', 'кедр', 'start'),
+('[Г'']-[К'']', 'Кь', 'кепка', 'start'),
+('[Г'']-[К'']', 'Кь', 'кефир', 'start'),
+('[Г'']-[К'']', 'Кь', 'кино', 'start'),
+('[Г'']-[К'']', 'Кь', 'кисть', 'start'),
+('[Г'']-[К'']', 'Кь', 'китаец', 'start'),
+('[Г'']-[К'']', 'Кь', 'руки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'реки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'щеки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'брюки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'веки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'звуки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'пеньки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'кубики', 'middle'),
+('[Г'']-[К'']', 'Кь', 'домики', 'middle'),
+('[Г'']-[К'']', 'Кь', 'коники', 'middle'),
+('[Г'']-[К'']', 'Кь', 'маки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'репки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'тапки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'липки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'кильки', 'start'),
+('[Г'']-[К'']', 'Кь', 'коньки', 'middle'),
+('[Г'']-[К'']', 'Кь', 'тюльки', 'middle')
+ON CONFLICT (pair, phoneme, word) DO NOTHING;
@@ -0,0 +1,11 @@
+-- sync_jobs: transient AlfaCRM errors are retried (attempts counts consecutive failed slices),
+-- jobs started together share batch_id so lessons wait until every branch of the batch has synced users
+ALTER TABLE t_p720035_lineaschool_app.sync_jobs
+ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE t_p720035_lineaschool_app.sync_jobs
+ADD COLUMN IF NOT EXISTS batch_id INTEGER;
+
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_batch_unfinished
+ON t_p720035_lineaschool_app.sync_jobs(batch_id)
+WHERE status IN ('pending', 'running');
@@ -3,6 +3,7 @@ import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import Icon from "@/components/ui/icon";
+import { authHeaders } from "@/utils/auth";
 import { Student, Teacher, User } from "./types";
 import AppHeader from "./AppHeader";
 import AppNavigation from "./AppNavigation";
@@ -57,7 +58,9 @@ const AdminDashboard = ({
   const loadDataFromDB = async () => {
     setLoading(true);
     try {
-      const response = await fetch('https://functions.poehali.dev/649662ee-a259-46cb-a494-a090f9842573');
+      const response = await fetch('https://functions.poehali.dev/649662ee-a259-46cb-a494-a090f9842573', {
+        headers: authHeaders()
+      });
       const data = await response.json();
       
       console.log('Данные из БД:', data);
@@ -151,6 +154,15 @@ const AdminDashboard = ({
               </Button>
             </div>
 
+            <Button
+              onClick={() => navigate('/admin/sync')}
+              variant="outline"
+              className="w-full"
+            >
+              <Icon name="RefreshCw" size={16} className="mr-2" />
+              Синхронизировать учеников
+            </Button>
+
             <div className="flex items-center justify-between">
               <h2 className="text-xl font-semibold text-secondary">Педагоги</h2>
               <Button size="sm" onClick={() => setActiveTab("admin")}>
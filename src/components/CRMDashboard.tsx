@@ -4,6 +4,8 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Input } from "@/components/ui/input";
 import Icon from "@/components/ui/icon";
+import { authHeaders } from "@/utils/auth";
+import { rememberWritePosition } from "@/utils/dbPosition";
 import { Student, Teacher, Assignment, Payment } from "./types";
 import StudentCard, { StudentWithStats } from "./CRM/StudentCard";
 import PaymentDialog from "./CRM/PaymentDialog";
@@ -47,8 +49,11 @@ const CRMDashboard = ({ students, teachers, assignments, onBack }: CRMDashboardP
 
     const syncWithAlfaCRM = async () => {
       try {
-        const response = await fetch('https://functions.poehali.dev/ff6e4964-b0a6-4754-a939-342ee35193d4');
+        const response = await fetch('https://functions.poehali.dev/ff6e4964-b0a6-4754-a939-342ee35193d4', {
+          headers: authHeaders()
+        });
         if (response.ok) {
+          rememberWritePosition(response);
           console.log('Синхронизация с AlfaCRM выполнена');
           setRefreshKey(prev => prev + 1);
         }
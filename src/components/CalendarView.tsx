@@ -1,3 +1,4 @@
+import { useEffect, useMemo, useState } from "react";
 import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
@@ -5,6 +6,19 @@ import { Checkbox } from "@/components/ui/checkbox";
 import Icon from "@/components/ui/icon";
 import { cn } from "@/lib/utils";
 import { Assignment } from "./types";
+import { authHeaders } from "@/utils/auth";
+import { readAfterWriteHeaders } from "@/utils/dbPosition";
+
+const GET_STUDENTS_URL = "https://functions.poehali.dev/649662ee-a259-46cb-a494-a090f9842573";
+
+const toIsoDate = (date: Date) =>
+  `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, "0")}-${String(date.getDate()).padStart(2, "0")}`;
+
+// Дата из YYYY-MM-DD в локальном поясе: new Date("2025-10-09") дал бы полночь UTC
+const fromIsoDate = (value: string) => {
+  const [year, month, day] = value.split("-").map(Number);
+  return new Date(year, month - 1, day);
+};
 
 interface CalendarViewProps {
   selectedDate: Date;
@@ -12,6 +26,7 @@ interface CalendarViewProps {
   assignments: Assignment[];
   onComplete: (id: string) => void;
   onStartHomework: (assignment: Assignment) => void;
+  studentId?: string;
 }
 
 const CalendarView = ({
@@ -19,8 +34,50 @@ const CalendarView = ({
   setSelectedDate,
   assignments,
   onComplete,
-  onStartHomework
+  onStartHomework,
+  studentId
 }: CalendarViewProps) => {
+  const [monthAssignments, setMonthAssignments] = useState<Assignment[] | null>(null);
+  const year = selectedDate.getFullYear();
+  const month = selectedDate.getMonth();
+
+  // Только видимый месяц выбранного ученика (mode=calendar), а не все назначения сразу
+  useEffect(() => {
+    setMonthAssignments(null);
+    if (!studentId || !/^\d+$/.test(studentId)) return;
+
+    let cancelled = false;
+    const params = new URLSearchParams({
+      mode: "calendar",
+      from: toIsoDate(new Date(year, month, 1)),
+      to: toIsoDate(new Date(year, month + 1, 0)),
+      student_id: studentId
+    });
+    fetch(`${GET_STUDENTS_URL}?${params}`, { headers: authHeaders(readAfterWriteHeaders()) })
+      .then((response) => (response.ok ? response.json() : null))
+      .then((data) => {
+        if (cancelled || !data?.days) return;
+        const loaded: Assignment[] = [];
+        for (const dayAssignments of Object.values(data.days) as any[][]) {
+          for (const a of dayAssignments) {
+            loaded.push({ ...a, date: fromIsoDate(a.date), createdBy: a.teacherId ?? "" });
+          }
+        }
+        setMonthAssignments(loaded);
+      })
+      .catch((error) => console.error("Ошибка загрузки календаря:", error));
+    return () => {
+      cancelled = true;
+    };
+  }, [year, month, studentId]);
+
+  // Назначения из базы дополняют локальные; при ошибке запроса календарь показывает только локальные
+  const visibleAssignments = useMemo(() => {
+    if (!monthAssignments) return assignments;
+    const localIds = new Set(assignments.map((a) => a.id));
+    return [...assignments, ...monthAssignments.filter((a) => !localIds.has(a.id))];
+  }, [assignments, monthAssignments]);
+
   const getDaysInMonth = (date: Date) => {
     const year = date.getFullYear();
     const month = date.getMonth();
@@ -36,11 +93,24 @@ const CalendarView = ({
   const monthNames = ["Январь", "Февраль", "Март", "Апрель", "Май", "Июнь", "Июль", "Август", "Сентябрь", "Октябрь", "Ноябрь", "Декабрь"];
   const weekDays = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"];
 
+  // Один проход по назначениям вместо фильтра всего массива для каждого дня месяца
+  const assignmentsByDate = useMemo(() => {
+    const byDate = new Map<string, Assignment[]>();
+    for (const assignment of visibleAssignments) {
+      const key = assignment.date.toDateString();
+      const dayAssignments = byDate.get(key);
+      if (dayAssignments) {
+        dayAssignments.push(assignment);
+      } else {
+        byDate.set(key, [assignment]);
+      }
+    }
+    return byDate;
+  }, [visibleAssignments]);
+
   const getAssignmentsForDate = (day: number) => {
     const checkDate = new Date(selectedDate.getFullYear(), selectedDate.getMonth(), day);
-    return assignments.filter(
-      (a) => a.date.toDateString() === checkDate.toDateString()
-    );
+    return assignmentsByDate.get(checkDate.toDateString()) ?? [];
   };
 
   const todayAssignments = getAssignmentsForDate(selectedDate.getDate());
@@ -1,7 +1,9 @@
 import { useState } from 'react';
+import { Navigate } from 'react-router-dom';
 import { Button } from '@/components/ui/button';
 import { Card } from '@/components/ui/card';
 import Icon from '@/components/ui/icon';
+import { authHeaders, hasAuthToken } from '@/utils/auth';
 
 export default function AdminSync() {
   const [loading, setLoading] = useState(false);
@@ -14,7 +16,7 @@ export default function AdminSync() {
     try {
       const response = await fetch(
         'https://functions.poehali.dev/7ef3480a-587f-492d-a8fa-27a1c0056429',
-        { method: 'POST' }
+        { method: 'POST', headers: authHeaders() }
       );
       
       if (!response.ok) throw new Error('Sync failed');
@@ -31,6 +33,11 @@ export default function AdminSync() {
     }
   };
 
+  // Синхронизация доступна только администратору после входа
+  if (!hasAuthToken()) {
+    return <Navigate to="/admin-login" replace />;
+  }
+
   return (
     <div className="min-h-screen bg-gradient-to-br from-purple-50 to-pink-50 p-8">
       <div className="max-w-2xl mx-auto">
@@ -2,6 +2,8 @@ import { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import Filword from '@/components/games/Filword';
 import FilwordConfig from '@/components/games/FilwordConfig';
+import { authHeaders } from '@/utils/auth';
+import { rememberWritePosition } from '@/utils/dbPosition';
 import Icon from '@/components/ui/icon';
 
 export default function GameFilword() {
@@ -31,9 +33,9 @@ export default function GameFilword() {
     try {
       const response = await fetch('https://functions.poehali.dev/1fc4b783-89ef-4c50-9b7b-c8185ca01681', {
         method: 'POST',
-        headers: {
+        headers: authHeaders({
           'Content-Type': 'application/json',
-        },
+        }),
         body: JSON.stringify({
           game_type: 'filword',
           title: `Филворд: ${config.theme}`,
@@ -46,6 +48,7 @@ export default function GameFilword() {
         }),
       });
 
+      rememberWritePosition(response);
       const data = await response.json();
       if (data.success) {
         alert('Игра сохранена в библиотеку!');
@@ -78,6 +81,7 @@ export default function GameFilword() {
         }),
       });
 
+      rememberWritePosition(response);
       const data = await response.json();
       if (data.success) {
         console.log('Результат сохранен!');
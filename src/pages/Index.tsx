@@ -10,6 +10,8 @@ import AppNavigation from "@/components/AppNavigation";
 import { Button } from "@/components/ui/button";
 import Icon from "@/components/ui/icon";
 import { Assignment, Student, Teacher, User } from "@/components/types";
+import { authHeaders, clearAuthToken } from "@/utils/auth";
+import { readAfterWriteHeaders } from "@/utils/dbPosition";
 
 const Index = () => {
   const navigate = useNavigate();
@@ -134,13 +136,16 @@ const Index = () => {
   const handleLogout = () => {
     setUser(null);
     localStorage.removeItem("lineaschool_current_user");
+    clearAuthToken();
     setActiveTab("calendar");
     setSelectedStudent(null);
   };
 
   const loadStudents = async () => {
     try {
-      const response = await fetch('https://functions.poehali.dev/649662ee-a259-46cb-a494-a090f9842573');
+      const response = await fetch('https://functions.poehali.dev/649662ee-a259-46cb-a494-a090f9842573', {
+        headers: authHeaders(readAfterWriteHeaders())
+      });
       const data = await response.json();
       setStudents(data.students || []);
       setTeachers(data.teachers || []);
@@ -296,6 +301,7 @@ const Index = () => {
             assignments={assignments}
             onComplete={handleComplete}
             onStartHomework={handleStartHomework}
+            studentId={selectedStudent?.id}
           />
         )}
 
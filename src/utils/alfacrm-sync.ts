@@ -1,3 +1,6 @@
+import { authHeaders } from './auth';
+import { readAfterWriteHeaders, rememberWritePosition } from './dbPosition';
+
 const ALFACRM_SYNC_URL = 'https://functions.poehali.dev/ff6e4964-b0a6-4754-a939-342ee35193d4';
 const GET_STUDENTS_URL = 'https://functions.poehali.dev/649662ee-a259-46cb-a494-a090f9842573';
 
@@ -50,24 +53,26 @@ export interface DatabaseData {
 export async function syncWithAlfaCRM(): Promise<SyncResult> {
   const response = await fetch(ALFACRM_SYNC_URL, {
     method: 'POST',
-    headers: {
+    headers: authHeaders({
       'Content-Type': 'application/json'
-    }
+    })
   });
 
   if (!response.ok) {
     throw new Error(`Sync failed: ${response.status}`);
   }
 
+  // Следующее чтение get-students увидит синхронизированные строки даже на отстающей реплике
+  rememberWritePosition(response);
   return response.json();
 }
 
 export async function getDataFromDatabase(): Promise<DatabaseData> {
   const response = await fetch(GET_STUDENTS_URL, {
     method: 'GET',
-    headers: {
+    headers: authHeaders(readAfterWriteHeaders({
       'Content-Type': 'application/json'
-    }
+    }))
   });
 
   if (!response.ok) {
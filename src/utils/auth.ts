@@ -0,0 +1,22 @@
+const AUTH_TOKEN_KEY = 'lineaschool_auth_token';
+
+export function saveAuthToken(token?: string): void {
+  if (token) {
+    localStorage.setItem(AUTH_TOKEN_KEY, token);
+  } else {
+    localStorage.removeItem(AUTH_TOKEN_KEY);
+  }
+}
+
+export function clearAuthToken(): void {
+  localStorage.removeItem(AUTH_TOKEN_KEY);
+}
+
+export function hasAuthToken(): boolean {
+  return localStorage.getItem(AUTH_TOKEN_KEY) !== null;
+}
+
+export function authHeaders(headers: Record<string, string> = {}): Record<string, string> {
+  const token = localStorage.getItem(AUTH_TOKEN_KEY);
+  return token ? { ...headers, Authorization: `Bearer ${token}` } : headers;
+}
@@ -0,0 +1,15 @@
+const DB_LSN_KEY = 'lineaschool_db_lsn';
+const DB_LSN_HEADER = 'X-DB-LSN';
+
+// Позиция WAL последней собственной записи: чтения с ней не уйдут на отстающую реплику
+export function rememberWritePosition(response: Response): void {
+  const lsn = response.headers.get(DB_LSN_HEADER);
+  if (lsn) {
+    sessionStorage.setItem(DB_LSN_KEY, lsn);
+  }
+}
+
+export function readAfterWriteHeaders(headers: Record<string, string> = {}): Record<string, string> {
+  const lsn = sessionStorage.getItem(DB_LSN_KEY);
+  return lsn ? { ...headers, [DB_LSN_HEADER]: lsn } : headers;
+}